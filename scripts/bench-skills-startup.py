@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark dot-agents-skills start-up time against a regression budget.
+
+Times `--help` style invocations of the entry point (from the checkout, and
+from the zipapp when it has been built) and subtracts the cost of starting a
+bare interpreter, so the figure is the time our own imports add. Exits 1 if
+any invocation exceeds the budget.
+
+Usage:
+    python scripts/bench-skills-startup.py [--budget-ms MS] [--repeat R]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINTS = {
+    "source": PROJECT_ROOT / "scripts/dot-agents-skills.py",
+    "zipapp": PROJECT_ROOT / "dist/dot-agents-skills.pyz",
+}
+INVOCATIONS = (
+    ["--help"],
+    ["validate", "--help"],
+    ["yaml", "--help"],
+    ["evaluate", "--help"],
+    ["index", "--help"],
+)
+
+
+def median_ms(argv, repeat: int) -> float:
+    """Median wall time in milliseconds to run argv to completion."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dot-agents-skills start-up time")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=75.0,
+        help="Maximum start-up cost over a bare interpreter (default: 75)",
+    )
+    parser.add_argument("--repeat", type=int, default=15, help="Runs per invocation (median is reported)")
+    args = parser.parse_args()
+
+    baseline = median_ms([sys.executable, "-c", "pass"], args.repeat)
+    print(f"Bare interpreter: {baseline:.1f} ms\n")
+    print(f"{'Entry':<8} {'Invocation':<18} {'Total (ms)':>11} {'Added (ms)':>11}")
+
+    over_budget = []
+    for label, entry_point in ENTRY_POINTS.items():
+        if not entry_point.exists():
+            print(f"⚠ {entry_point.relative_to(PROJECT_ROOT)} not found; run `just build-skills-cli`")
+            continue
+        for invocation in INVOCATIONS:
+            total = median_ms([sys.executable, str(entry_point), *invocation], args.repeat)
+            added = total - baseline
+            name = " ".join(invocation)
+            print(f"{label:<8} {name:<18} {total:>11.1f} {added:>11.1f}")
+            if added > args.budget_ms:
+                over_budget.append(f"{label} {name}")
+
+    print()
+    if over_budget:
+        print(f"✗ Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    print(f"✓ All invocations within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
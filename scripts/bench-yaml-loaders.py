@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark SKILL.md frontmatter loading: pure-Python vs libyaml-backed loader.
+
+Builds a synthetic frontmatter corpus, checks that skill_parser.load_frontmatter
+returns exactly what yaml.safe_load returns for every document, then times both.
+
+Usage:
+    python scripts/bench-yaml-loaders.py [--count N] [--repeat R] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/meta/skill-tester/scripts"))
+
+from skill_parser import fast_safe_loader, load_frontmatter  # noqa: E402
+
+WORDS = (
+    "analyze convert data files format generate json markdown pdf report "
+    "review skill task test use validate weather when workflow"
+).split()
+
+
+def synthetic_frontmatter(rng: random.Random) -> str:
+    """One realistic-looking frontmatter block."""
+    name = "-".join(rng.sample(WORDS, rng.randint(1, 3)))
+    description = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+    lines = [
+        f"name: {name}",
+        f"description: {description.capitalize()}. Use when you need to {rng.choice(WORDS)}.",
+        "license: MIT",
+    ]
+    if rng.random() < 0.6:
+        lines.append("allowed-tools:")
+        lines.extend(f"  - {tool}" for tool in rng.sample(["Bash", "Read", "Write", "Edit"], 2))
+    if rng.random() < 0.4:
+        lines.append("metadata:")
+        lines.append(f"  version: \"{rng.randint(1, 9)}.{rng.randint(0, 9)}\"")
+        lines.append(f"  updated: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+        lines.append(f"  tags: [{', '.join(rng.sample(WORDS, 3))}]")
+    if rng.random() < 0.3:
+        lines.append("notes: |")
+        lines.extend(f"  {' '.join(rng.sample(WORDS, 6))}" for _ in range(rng.randint(1, 5)))
+    return "\n".join(lines)
+
+
+def time_loader(corpus, load, repeat: int) -> float:
+    """Best-of-repeat seconds to load the whole corpus."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            load(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter YAML loaders")
+    parser.add_argument("--count", type=int, default=2000, help="Documents in the corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [synthetic_frontmatter(rng) for _ in range(args.count)]
+
+    mismatches = sum(1 for text in corpus if load_frontmatter(text) != yaml.safe_load(text))
+    if mismatches:
+        print(f"✗ {mismatches} documents loaded differently")
+        return 1
+    print(f"✓ {len(corpus)} documents load identically")
+
+    if fast_safe_loader() is None:
+        print("⚠ PyYAML was built without libyaml; only the pure-Python loader is available")
+        return 0
+
+    pure = time_loader(corpus, yaml.safe_load, args.repeat)
+    fast = time_loader(corpus, load_frontmatter, args.repeat)
+
+    print(f"\n{'Loader':<20} {'Total (s)':>10} {'Per doc (µs)':>14}")
+    print(f"{'yaml.safe_load':<20} {pure:>10.3f} {pure / len(corpus) * 1e6:>14.1f}")
+    print(f"{'load_frontmatter':<20} {fast:>10.3f} {fast / len(corpus) * 1e6:>14.1f}")
+    print(f"\nSpeedup: {pure / fast:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Generate the skill entries in CATALOG.md from the skill tree.
+
+Each entry is built from the skill index (name, description, content hash),
+bundled resources and git history (added/updated dates). Entries carry a
+fingerprint of the skill's tracked files; unchanged entries are copied
+through verbatim, so only changed skills cost a `git log`. Hand-written
+bullets such as Dependencies and Note survive regeneration, as does
+everything outside the generated region.
+
+Usage:
+    python scripts/build-catalog.py [--root skills] [--catalog CATALOG.md]
+    python scripts/build-catalog.py --check   # exit 1 if CATALOG.md is stale
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills/meta/skill-evaluator/scripts"))
+
+from run_evaluation import check_bundled_resources  # noqa: E402
+from skill_index import DEFAULT_INDEX, SkillIndex, update_index  # noqa: E402
+
+BEGIN_MARKER = "<!-- BEGIN GENERATED CATALOG: run `just catalog` to update -->"
+END_MARKER = "<!-- END GENERATED CATALOG -->"
+ENTRY_MARKER = re.compile(r"^<!-- catalog-entry (\S+) ([0-9a-f]+) -->$")
+BULLET = re.compile(r"^- \*\*(?P<key>[^*]+):\*\* ?(?P<value>.*)$")
+LAST_UPDATED = re.compile(r"^\*\*Last Updated:\*\* .*$", re.MULTILINE)
+DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Bullets owned by the generator; any others in an entry are kept as written
+GENERATED_KEYS = ("Path", "Added", "Updated", "Description", "Files")
+
+
+def git(*args: str) -> str | None:
+    """Output of a git command, or None if git is unavailable or fails."""
+    try:
+        proc = subprocess.run(["git", *args], capture_output=True, text=True)
+    except OSError:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+class CatalogEntry:
+    """One skill's block of lines in the generated region."""
+
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+        self.path = None
+        self.fingerprint = None
+        self.bullets: Dict[str, str] = {}
+        self.extra: List[str] = []
+        for line in lines:
+            marker = ENTRY_MARKER.match(line)
+            bullet = BULLET.match(line)
+            if marker:
+                self.path, self.fingerprint = marker.groups()
+            elif bullet:
+                self.bullets[bullet["key"]] = bullet["value"]
+                if bullet["key"] not in GENERATED_KEYS:
+                    self.extra.append(line)
+        if self.path is None:
+            self.path = self.bullets.get("Path")
+
+
+def split_catalog(text: str) -> Tuple[str, str, str]:
+    """Split CATALOG.md into (before, generated region, after).
+
+    Catalogs written before the generator existed have no markers; their
+    region runs from the first `## ` heading to the first `---` rule.
+    """
+    if BEGIN_MARKER in text and END_MARKER in text:
+        before, rest = text.split(BEGIN_MARKER, 1)
+        region, after = rest.split(END_MARKER, 1)
+        return before, region, after
+
+    start = re.search(r"^## ", text, re.MULTILINE)
+    if start is None:
+        return text.rstrip("\n") + "\n\n", "", "\n"
+    end = re.compile(r"^---$", re.MULTILINE).search(text, start.start())
+    end_pos = end.start() if end else len(text)
+    return text[: start.start()], text[start.start() : end_pos], "\n\n" + text[end_pos:]
+
+
+def parse_region(region: str) -> Tuple[List[str], Dict[str, List[str]], Dict[str, CatalogEntry]]:
+    """Category titles in order, each category's intro lines, and entries by path."""
+    categories: List[str] = []
+    intros: Dict[str, List[str]] = {}
+    entries: Dict[str, CatalogEntry] = {}
+
+    category = None
+    entry_lines: List[str] | None = None
+
+    def finish_entry():
+        if entry_lines is not None:
+            entry = CatalogEntry(entry_lines)
+            if entry.path:
+                entries[entry.path] = entry
+
+    for line in region.split("\n"):
+        if line.startswith("## "):
+            finish_entry()
+            entry_lines = None
+            category = line[3:].strip()
+            categories.append(category)
+            intros[category] = []
+        elif line.startswith("### "):
+            finish_entry()
+            entry_lines = [line]
+        elif entry_lines is not None:
+            entry_lines.append(line)
+        elif category is not None:
+            intros[category].append(line)
+    finish_entry()
+
+    for lines in intros.values():
+        while lines and not lines[0].strip():
+            lines.pop(0)
+        while lines and not lines[-1].strip():
+            lines.pop()
+    return categories, intros, entries
+
+
+def category_title(rel_path: str) -> str:
+    """Catalog section for a skill: its top-level directory, title-cased."""
+    top = rel_path.split("/", 1)[0] if "/" in rel_path else ""
+    return top.replace("-", " ").title() if top else "Other"
+
+
+class GitHistory:
+    """Tracked-file fingerprints and change dates for skills, from git."""
+
+    def __init__(self, root: Path, skill_paths: List[str]):
+        self.available = git("rev-parse", "--git-dir") is not None
+        self.tracked: Dict[str, List[str]] = {path: [] for path in skill_paths}
+        self.staged = set()
+        if not self.available:
+            return
+
+        skills = set(skill_paths)
+
+        def owner(path: str) -> str | None:
+            while "/" in path:
+                path = path.rsplit("/", 1)[0]
+                if path in skills:
+                    return path
+            return None
+
+        listing = git("ls-files", "--stage", "-z", "--", str(root)) or ""
+        for item in listing.split("\0"):
+            if item:
+                info, path = item.split("\t", 1)
+                skill = owner(path)
+                if skill is not None:
+                    self.tracked[skill].append(f"{path} {info.split()[1]}")
+
+        changed = git("diff", "--cached", "--name-only", "-z", "HEAD", "--", str(root)) or ""
+        self.staged = {owner(path) for path in changed.split("\0") if path} - {None}
+
+    def dates(self, skill_path: str) -> Tuple[str | None, str | None]:
+        """(added, updated) dates, counting staged changes as made today."""
+        today = date.today().isoformat()
+        history = git("log", "--format=%as", "--", skill_path) if self.available else None
+        dates = history.split() if history else []
+        if skill_path in self.staged or (self.available and not dates):
+            return (dates[-1] if dates else today), today
+        if not dates:
+            return None, None
+        return dates[-1], dates[0]
+
+
+def fingerprint(content_hash: str, files: List[str], tracked: List[str]) -> str:
+    """Short hash of everything an entry is generated from."""
+    digest = hashlib.blake2b(digest_size=8)
+    for part in [content_hash, *files, *sorted(tracked)]:
+        digest.update(part.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def render_entry(
+    name: str, path: str, description: str, files: List[str], dates, old: CatalogEntry | None, mark: str
+) -> List[str]:
+    added, updated = dates
+    if old is not None:
+        # A hand-entered Added date predating the git history wins
+        old_added = old.bullets.get("Added", "")
+        if DATE.match(old_added) and (added is None or old_added < added):
+            added = old_added
+        updated = updated or old.bullets.get("Updated")
+
+    lines = [
+        f"### {name}",
+        "",
+        f"- **Path:** {path}",
+        f"- **Added:** {added or 'unknown'}",
+        f"- **Updated:** {updated or 'unknown'}",
+        f"- **Description:** {' '.join(description.split())}",
+        f"- **Files:** {', '.join(files)}",
+    ]
+    if old is not None:
+        lines.extend(old.extra)
+    lines.extend(["", mark, ""])
+    return lines
+
+
+def build_catalog(root: Path, catalog_text: str, index_path: Path) -> str:
+    """Return the new CATALOG.md text for the skills beneath root."""
+    update_index(root, index_path)
+    with SkillIndex(index_path) as index:
+        skills = sorted(index, key=lambda entry: entry.path)
+
+    before, region, after = split_catalog(catalog_text)
+    categories, intros, old_entries = parse_region(region)
+
+    paths = {entry.path: (root / entry.path).as_posix() for entry in skills}
+    history = GitHistory(root, list(paths.values()))
+
+    by_category: Dict[str, List[List[str]]] = {}
+    latest = None
+    for entry in skills:
+        path = paths[entry.path]
+        resources = check_bundled_resources(root / entry.path)
+        top_level = sorted(
+            item.name
+            for item in os.scandir(root / entry.path)
+            if item.is_file() and item.name != "SKILL.md" and not item.name.startswith(".")
+        )
+        files = ["SKILL.md", *top_level] + [
+            f"{kind}/{name}" for kind, names in resources.items() for name in sorted(names)
+        ]
+        current = fingerprint(entry.content_hash, files, history.tracked[path])
+
+        old = old_entries.get(path)
+        if old is not None and old.fingerprint == current:
+            lines = old.lines
+        else:
+            name = entry.name or Path(entry.path).name
+            mark = f"<!-- catalog-entry {path} {current} -->"
+            lines = render_entry(name, path, entry.description, files, history.dates(path), old, mark)
+
+        updated = CatalogEntry(lines).bullets.get("Updated", "")
+        if DATE.match(updated) and (latest is None or updated > latest):
+            latest = updated
+
+        category = category_title(entry.path)
+        by_category.setdefault(category, []).append(lines)
+        if category not in categories:
+            categories.append(category)
+
+    out = [BEGIN_MARKER, ""]
+    for category in categories:
+        if category not in by_category:
+            continue
+        out.extend([f"## {category}", ""])
+        if intros.get(category):
+            out.extend(intros[category] + [""])
+        for lines in by_category[category]:
+            while lines and not lines[-1].strip():
+                lines = lines[:-1]
+            out.extend(lines + [""])
+    out.append(END_MARKER)
+
+    if latest is not None:
+        before = LAST_UPDATED.sub(f"**Last Updated:** {latest}", before, count=1)
+    return before + "\n".join(out) + after
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate CATALOG.md skill entries")
+    parser.add_argument("--root", type=Path, default=Path("skills"), help="Skills directory (default: skills)")
+    parser.add_argument("--catalog", type=Path, default=Path("CATALOG.md"), help="Catalog file (default: CATALOG.md)")
+    parser.add_argument("--index", type=Path, default=DEFAULT_INDEX, help=f"Skill index file (default: {DEFAULT_INDEX})")
+    parser.add_argument("--check", action="store_true", help="Don't write; exit 1 if the catalog is out of date")
+    args = parser.parse_args()
+
+    current = args.catalog.read_text(encoding="utf-8") if args.catalog.exists() else "# .agents Catalog\n"
+    updated = build_catalog(args.root, current, args.index)
+
+    if updated == current:
+        print(f"✓ {args.catalog} is up to date")
+        return 0
+    if args.check:
+        print(f"✗ {args.catalog} is out of date - run `just catalog`")
+        return 1
+    args.catalog.write_text(updated, encoding="utf-8")
+    print(f"✓ Updated {args.catalog}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+#!/bin/bash
+set -e
+
+# Build the skill tooling into a single precompiled zipapp
+# Output: dist/dot-agents-skills.pyz (run with `python3 dist/dot-agents-skills.pyz <command>`)
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+STAGING="$PROJECT_ROOT/dist/skills-cli"
+OUTPUT="$PROJECT_ROOT/dist/dot-agents-skills.pyz"
+PYTHON="${PYTHON:-python3}"
+
+rm -rf "$STAGING"
+mkdir -p "$STAGING"
+
+cp "$SCRIPT_DIR/dot-agents-skills.py" "$STAGING/__main__.py"
+cp "$PROJECT_ROOT/skills/meta/skill-creator/scripts/validate_skill.py" \
+   "$PROJECT_ROOT/skills/meta/skill-tester/scripts/skill_parser.py" \
+   "$PROJECT_ROOT/skills/meta/skill-tester/scripts/validate_yaml.py" \
+   "$PROJECT_ROOT/skills/meta/skill-tester/scripts/description_overlap.py" \
+   "$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/run_evaluation.py" \
+   "$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/skill_index.py" \
+   "$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/skill_manifest.py" \
+   "$PROJECT_ROOT/skills/meta/skill-browser/scripts/search_skills.py" \
+   "$STAGING/"
+
+# Bytecode sits next to each source so zipimport loads it without compiling;
+# unchecked hashes mean they are never revalidated against the sources.
+# Sources stay in the archive as a fallback for other Python versions.
+"$PYTHON" -m compileall -q -b --invalidation-mode unchecked-hash \
+    -d dot-agents-skills.pyz "$STAGING"
+
+"$PYTHON" -m zipapp "$STAGING" -p "/usr/bin/env python3" -o "$OUTPUT"
+rm -rf "$STAGING"
+
+# Smoke test: the cache reads the validator's own source to version its
+# entries, which must work from inside the archive (cold, then warm run)
+SMOKE_CACHE=$(mktemp -d)
+trap 'rm -rf "$SMOKE_CACHE"' EXIT
+for run in cold warm; do
+    "$PYTHON" "$OUTPUT" validate --quiet --cache-dir "$SMOKE_CACHE" "$PROJECT_ROOT/skills" >/dev/null || {
+        echo "✗ $OUTPUT validate --cache-dir failed ($run cache)"
+        exit 1
+    }
+done
+
+echo "✓ Built $OUTPUT"
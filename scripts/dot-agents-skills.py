@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the skill tooling scripts.
+
+Dispatches to the bundled skill scripts, importing only the one that is
+asked for so `--help` and simple invocations stay fast. Runs from a checkout
+or as the zipapp built by scripts/build-skills-zipapp.sh.
+
+Usage:
+    python scripts/dot-agents-skills.py <command> [args...]
+    python dist/dot-agents-skills.pyz <command> [args...]
+"""
+
+import sys
+
+USAGE = """\
+usage: dot-agents-skills <command> [args...]
+
+commands:
+  validate   Validate a skill, or every skill beneath a directory
+  yaml       Validate the YAML frontmatter of a skill
+  evaluate   Generate an evaluation report template, or a metrics table for a tree
+  index      Build or query the skill index
+  search     Search skills by name, description and content
+  overlap    Find skills with overlapping descriptions
+  manifest   Write or verify per-skill integrity manifests
+
+Run `dot-agents-skills <command> --help` for command options.
+"""
+
+# command -> module providing main()
+COMMANDS = {
+    "validate": "validate_skill",
+    "yaml": "validate_yaml",
+    "evaluate": "run_evaluation",
+    "index": "skill_index",
+    "search": "search_skills",
+    "overlap": "description_overlap",
+    "manifest": "skill_manifest",
+}
+
+# Where the modules live in a checkout; the zipapp bundles them at its root
+SKILL_SCRIPT_DIRS = (
+    "skills/meta/skill-creator/scripts",
+    "skills/meta/skill-tester/scripts",
+    "skills/meta/skill-evaluator/scripts",
+    "skills/meta/skill-browser/scripts",
+)
+
+
+def add_checkout_paths():
+    """Make the skill scripts importable when running from a checkout."""
+    from pathlib import Path
+
+    repo_root = Path(__file__).resolve().parent.parent
+    for rel_dir in SKILL_SCRIPT_DIRS:
+        scripts_dir = repo_root / rel_dir
+        if scripts_dir.is_dir():
+            sys.path.insert(0, str(scripts_dir))
+
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if not args or args[0] in ("-h", "--help"):
+        print(USAGE, end="")
+        return 0 if args else 2
+
+    command, rest = args[0], args[1:]
+    if command not in COMMANDS:
+        print(f"dot-agents-skills: unknown command '{command}'\n", file=sys.stderr)
+        print(USAGE, end="", file=sys.stderr)
+        return 2
+
+    add_checkout_paths()
+    module = __import__(COMMANDS[command])
+
+    # The tools parse sys.argv themselves; make their usage read as the subcommand
+    sys.argv = [f"dot-agents-skills {command}", *rest]
+    return module.main() or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/bin/bash
+set -e
+
+# Archive Validation Tests
+# Checks that validate_skill.py validates the skills inside .zip and
+# .tar.gz archives from their member lists, without extracting anything
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR="$PROJECT_ROOT/skills/meta/skill-creator/scripts/validate_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# A bundle of two skills: good-skill is valid, bad-skill references a file
+# that is only present outside the archive
+SOURCE="$TEST_DIR/source"
+mkdir -p "$SOURCE/good-skill/scripts" "$SOURCE/bad-skill"
+printf -- '---\nname: good-skill\ndescription: Use when testing archives.\n---\n\nRun `scripts/run.sh`.\n' \
+  > "$SOURCE/good-skill/SKILL.md"
+echo 'echo run' > "$SOURCE/good-skill/scripts/run.sh"
+printf -- '---\nname: bad-skill\ndescription: Use when testing archives.\n---\n\nRun `scripts/run.sh`.\n' \
+  > "$SOURCE/bad-skill/SKILL.md"
+
+"$PYTHON" - "$SOURCE" "$TEST_DIR" <<'EOF'
+import sys, tarfile, zipfile
+from pathlib import Path
+
+source, out = Path(sys.argv[1]), Path(sys.argv[2])
+files = sorted(p for p in source.rglob("*") if p.is_file())
+with zipfile.ZipFile(out / "bundle.zip", "w") as bundle:
+    for path in files:
+        bundle.write(path, path.relative_to(source).as_posix())
+    # Members escaping the archive root are never treated as skill files
+    bundle.writestr("../bad-skill/scripts/run.sh", "echo escaped\n")
+with tarfile.open(out / "bundle.tar.gz", "w:gz") as bundle:
+    for path in files:
+        bundle.add(path, path.relative_to(source).as_posix())
+with zipfile.ZipFile(out / "good-skill.zip", "w") as bundle:
+    for path in files:
+        if path.is_relative_to(source / "good-skill"):
+            bundle.write(path, path.relative_to(source / "good-skill").as_posix())
+EOF
+# bad-skill's reference exists on disk next to the archives, but not inside them
+mkdir -p "$TEST_DIR/bundle/bad-skill/scripts"
+echo 'echo run' > "$TEST_DIR/bundle/bad-skill/scripts/run.sh"
+
+# Each validated skill (relative to the archive's directory) and whether it passed
+validated() {
+  "$PYTHON" "$VALIDATOR" --quiet --format json "$1" | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+for skill in report["skills"]:
+    print(skill["skill"].split(sys.argv[1] + "/", 1)[1], skill["valid"])
+' "$TEST_DIR"
+}
+
+echo ""
+echo "Archive Validation Tests"
+echo "========================"
+echo ""
+
+expected="bundle/bad-skill False
+bundle/good-skill True"
+for archive in bundle.zip bundle.tar.gz; do
+  before=$(find "$TEST_DIR" | sort)
+  results=$(validated "$TEST_DIR/$archive")
+  [[ "$results" == "$expected" ]] || fail "unexpected results for $archive: $results"
+  [[ $(find "$TEST_DIR" | sort) == "$before" ]] || fail "validating $archive wrote files"
+done
+pass "Skills in zip and tar.gz archives are validated without extracting"
+pass "References resolve against the archive's members only"
+
+[[ $(validated "$TEST_DIR/good-skill.zip") == "good-skill True" ]] \
+  || fail "an archive holding one skill at its root was not validated"
+pass "An archive with SKILL.md at its root is a single skill"
+
+echo 'not an archive' > "$TEST_DIR/broken.zip"
+if "$PYTHON" "$VALIDATOR" --quiet "$TEST_DIR/broken.zip" >"$TEST_DIR/output" 2>&1; then
+  fail "an unreadable archive passed validation"
+fi
+grep -q 'Not a readable archive' "$TEST_DIR/output" \
+  || fail "an unreadable archive was not reported: $(cat "$TEST_DIR/output")"
+pass "An unreadable archive is reported as an error"
+
+echo ""
+echo "All archive validation tests passed!"
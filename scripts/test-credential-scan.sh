@@ -0,0 +1,96 @@
+#!/bin/bash
+set -e
+
+# Credential Scan Tests
+# Checks that validate_skill.py reports every hardcoded credential with its
+# line and column in SKILL.md, in one pass and with pluggable rules
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR_DIR="$PROJECT_ROOT/skills/meta/skill-creator/scripts"
+VALIDATOR="$VALIDATOR_DIR/validate_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+SKILL="$TEST_DIR/cred-skill"
+mkdir -p "$SKILL"
+cat > "$SKILL/SKILL.md" <<'EOF'
+---
+name: cred-skill
+description: Use when testing the credential scan.
+---
+
+# Cred Skill
+
+Set password: "hunter2" before running.
+  api_key = "abc123" and TOKEN: 'xyz'
+secret: "never closed
+EOF
+
+echo ""
+echo "Credential Scan Tests"
+echo "====================="
+echo ""
+
+# (rule, line, column) of every credential finding in a JSON run
+findings=$("$PYTHON" "$VALIDATOR" --format json "$SKILL" | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+for result in report["skills"][0]["results"]:
+    if result["rule"] == "hardcoded-credential":
+        print(result["message"].split("(")[1].split(")")[0], result["line"], result["column"])
+')
+expected="password 8 5
+api-key 9 3
+token 9 26"
+[[ "$findings" == "$expected" ]] || fail "unexpected credential findings: $findings"
+pass "Every credential is reported with its line and column"
+pass "A value without a closing quote on its line is not reported"
+
+"$PYTHON" - "$VALIDATOR_DIR" <<'EOF' || fail "custom rules were not applied"
+import sys
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import CredentialRule, CredentialScanner
+
+scanner = CredentialScanner([
+    CredentialRule("aws", r"aws_(access|secret)_key(_id)?"),
+    CredentialRule("bearer", r"bearer"),
+])
+text = 'aws_secret_key = "a"\nnothing here\nBearer: "b" password: "c"\n'
+found = [(rule.name, offset) for rule, offset in scanner.scan(text)]
+assert found == [("aws", 0), ("bearer", 34)], found
+EOF
+pass "Rules are pluggable, including keys with their own groups"
+
+# Many openings on one line without a closing quote stay linear
+"$PYTHON" - "$VALIDATOR_DIR" <<'EOF' || fail "adversarial input was slow or reported"
+import sys, time
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import DEFAULT_CREDENTIAL_RULES, CredentialScanner
+
+scanner = CredentialScanner(DEFAULT_CREDENTIAL_RULES)
+text = 'password: "' * 200_000
+start = time.perf_counter()
+found = list(scanner.scan(text))
+elapsed = time.perf_counter() - start
+assert found[:1] and len(found) == 199_999, len(found)
+assert elapsed < 5, elapsed
+EOF
+pass "Scanning adversarial input stays linear"
+
+echo ""
+echo "All credential scan tests passed!"
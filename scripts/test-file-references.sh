@@ -0,0 +1,133 @@
+#!/bin/bash
+set -e
+
+# File Reference Tests
+# Checks which file references validate_skill.py extracts from a SKILL.md
+# body and how each one is resolved against the skill's own files
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR_DIR="$PROJECT_ROOT/skills/meta/skill-creator/scripts"
+VALIDATOR="$VALIDATOR_DIR/validate_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# Write a skill named $1 whose body is read from stdin
+write_skill() {
+  mkdir -p "$TEST_DIR/$1"
+  {
+    printf -- '---\nname: %s\ndescription: Use when testing file references.\n---\n\n' "$1"
+    cat
+  } > "$TEST_DIR/$1/SKILL.md"
+}
+
+validate() {
+  "$PYTHON" "$VALIDATOR" --quiet "$TEST_DIR/$1" >"$TEST_DIR/output" 2>&1
+}
+
+echo ""
+echo "File Reference Tests"
+echo "===================="
+echo ""
+
+"$PYTHON" - "$VALIDATOR_DIR" <<'EOF' || fail "link targets were not extracted correctly"
+import sys
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import extract_file_references
+
+cases = {
+    "[t](foo(bar).md)": ["foo(bar).md"],
+    "[t](a(b(c)).md \"Title\")": ["a(b(c)).md"],
+    "[t](foo\\(bar.md)": ["foo(bar.md"],
+    "[t](foo(bar.md)": [],
+    "[t](<with space.md>)": ["with space.md"],
+    "![i](img.png 'Title') [t](doc.md#anchor)": ["img.png", "doc.md"],
+    "[t](https://example.com/a(b)) [u](notes.md)": ["notes.md"],
+    "Run `scripts/run.sh` or [t](a.md (Title)).": ["scripts/run.sh", "a.md"],
+    "```\n[t](in-fence.md)\n```\n[t](after.md)": ["after.md"],
+}
+for body, expected in cases.items():
+    found = [path for path, _ in extract_file_references(body)]
+    assert found == expected, (body, found, expected)
+EOF
+pass "Link targets keep balanced parentheses and drop titles, anchors and URLs"
+
+write_skill paren-skill <<'EOF'
+See [the notes](references/notes(v2).md) for details.
+EOF
+mkdir -p "$TEST_DIR/paren-skill/references"
+echo notes > "$TEST_DIR/paren-skill/references/notes(v2).md"
+validate paren-skill || fail "existing file with parentheses reported: $(cat "$TEST_DIR/output")"
+rm "$TEST_DIR/paren-skill/references/notes(v2).md"
+if validate paren-skill; then
+  fail "missing file with parentheses was not reported"
+fi
+grep -q 'references/notes(v2).md' "$TEST_DIR/output" \
+  || fail "missing file reported under the wrong name: $(cat "$TEST_DIR/output")"
+pass "Destinations with parentheses are checked against the skill's files"
+
+# (rule, reference) of each failed reference check in a JSON run
+reference_errors() {
+  "$PYTHON" "$VALIDATOR" --format json "$TEST_DIR/$1" | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+for result in report["skills"][0]["results"]:
+    if result["rule"].startswith("reference") and result["severity"] == "error":
+        print(result["rule"], result["message"].rsplit(": ", 1)[1].split(" at line ")[0])
+'
+}
+
+write_skill escape-skill <<'EOF'
+Run `scripts/run.sh`, then read [the guide](./references/guide.md)
+and [the script again](references/../scripts/run.sh).
+
+Not bundled: [a sibling](../paren-skill/SKILL.md), [an absolute path](/etc/hostname)
+and [a file used as a directory](scripts/run.sh/extra).
+EOF
+mkdir -p "$TEST_DIR/escape-skill/scripts" "$TEST_DIR/escape-skill/references"
+echo 'echo run' > "$TEST_DIR/escape-skill/scripts/run.sh"
+echo guide > "$TEST_DIR/escape-skill/references/guide.md"
+errors=$(reference_errors escape-skill)
+expected="reference-outside-skill ../paren-skill/SKILL.md
+reference-outside-skill /etc/hostname
+reference-exists scripts/run.sh/extra"
+[[ "$errors" == "$expected" ]] || fail "unexpected reference errors: $errors"
+pass "References escaping the skill are reported as reference-outside-skill, even when they exist"
+pass "References inside the skill resolve through ./ and .. segments"
+
+"$PYTHON" - "$VALIDATOR_DIR" "$TEST_DIR/escape-skill" <<'EOF' || fail "snapshot listed a directory more than once"
+import os, sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+import validate_skill
+
+listed = []
+scandir = os.scandir
+def counting_scandir(path):
+    listed.append(Path(path).name)
+    return scandir(path)
+validate_skill.os.scandir = counting_scandir
+
+snapshot = validate_skill.DirectorySnapshot(Path(sys.argv[2]))
+paths = ["scripts/run.sh", "scripts/missing.sh", "references/guide.md", "scripts/run.sh", "assets/x.png"]
+assert [snapshot.exists(path) for path in paths] == [True, False, True, True, False]
+assert sorted(listed) == ["escape-skill", "references", "scripts"], listed
+EOF
+pass "Each skill directory is listed at most once"
+
+echo ""
+echo "All file reference tests passed!"
@@ -0,0 +1,128 @@
+#!/bin/bash
+set -e
+
+# Git Validation Tests
+# Checks that --changed-since selects skills from a git diff, that --staged
+# validates the index and that a commit range (and the pre-push hook)
+# validates committed content rather than the checkout
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR="$PROJECT_ROOT/skills/meta/skill-tester/scripts/test_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# Write a skill whose YAML name is $2 (a mismatch with its directory fails)
+write_skill() {
+  mkdir -p "skills/$1"
+  printf -- '---\nname: %s\ndescription: Use when testing git validation.\n---\n\nBody\n' "$2" \
+    > "skills/$1/SKILL.md"
+}
+
+# The skills (directory names) validated by a JSON run, and whether it passed
+validated() {
+  "$PYTHON" "$VALIDATOR" --quiet --jobs 1 --format json "$@" skills | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+names = " ".join(skill["skill"].rsplit("/", 1)[1] for skill in report["skills"])
+print(names, report["summary"]["valid"], sep=":")
+'
+}
+
+REPO="$TEST_DIR/repo"
+mkdir -p "$REPO"
+cd "$REPO"
+git init -q
+git config user.email test@example.com
+git config user.name Test
+write_skill alpha alpha
+write_skill beta beta
+git add skills
+git commit -qm "Add skills"
+branch=$(git symbolic-ref --short HEAD)
+base=$(git rev-parse HEAD)
+write_skill beta wrong-name
+git commit -qam "Break beta"
+broken=$(git rev-parse HEAD)
+
+echo ""
+echo "Git Validation Tests"
+echo "===================="
+echo ""
+
+# A single ref compares against the working tree
+[[ $(validated --changed-since "$base") == "beta:False" ]] \
+  || fail "--changed-since REF did not select the changed skill"
+[[ $(validated --changed-since HEAD) == ":True" ]] \
+  || fail "--changed-since HEAD selected skills on a clean tree"
+pass "--changed-since REF validates skills changed since the ref"
+
+# A range reads the end commit, whatever is checked out or edited
+git checkout -q "$base"
+write_skill alpha uncommitted-edit
+[[ $(validated --changed-since "$base..$broken") == "beta:False" ]] \
+  || fail "--changed-since A..B validated the checkout instead of B"
+[[ $(validated --changed-since "$base..$base") == ":True" ]] \
+  || fail "--changed-since A..A selected skills"
+git checkout -q -- skills
+git checkout -q "$branch"
+pass "--changed-since A..B validates skills changed between commits, as committed in B"
+
+if "$PYTHON" "$VALIDATOR" --staged --changed-since "$base..$broken" skills >/dev/null 2>&1; then
+  fail "--staged accepted a commit range"
+fi
+pass "--staged rejects a commit range"
+
+# --staged reads SKILL.md and referenced files from the index, not the disk
+write_skill beta beta
+printf 'Run `scripts/run.sh`.\n' >> skills/beta/SKILL.md
+mkdir -p skills/beta/scripts
+echo 'echo run' > skills/beta/scripts/run.sh
+git add skills/beta
+write_skill beta broken-on-disk
+rm skills/beta/scripts/run.sh
+[[ $(validated --staged) == "alpha beta:True" ]] \
+  || fail "--staged validated the working tree instead of the index"
+[[ $(validated --staged --changed-since HEAD) == "beta:True" ]] \
+  || fail "--staged --changed-since HEAD did not select the staged change"
+git reset -q -- skills
+git checkout -q -- skills
+write_skill gamma gamma
+printf 'Run `scripts/run.sh`.\n' >> skills/gamma/SKILL.md
+git add skills/gamma
+mkdir -p skills/gamma/scripts
+echo 'echo run' > skills/gamma/scripts/run.sh  # on disk, never staged
+[[ $(validated --staged --changed-since HEAD) == "gamma:False" ]] \
+  || fail "--staged resolved a reference against an unstaged file"
+git rm -rq --cached skills/gamma
+rm -r skills/gamma
+pass "--staged validates exactly what is staged, including referenced files"
+
+# The pre-push hook checks the pushed commit, not the working tree
+mkdir -p skills/meta/skill-tester/scripts
+cp "$PROJECT_ROOT"/skills/meta/skill-tester/scripts/{test_skill.py,skill_parser.py} skills/meta/skill-tester/scripts/
+zero=0000000000000000000000000000000000000000
+write_skill beta beta  # fixed on disk only
+if echo "refs/heads/$branch $broken refs/heads/$branch $base" | "$PROJECT_ROOT/.githooks/pre-push" >/dev/null 2>&1; then
+  fail "pre-push accepted a pushed commit with an invalid skill"
+fi
+git checkout -q -- skills/beta
+write_skill beta wrong-again  # broken on disk only
+echo "refs/heads/$branch $base refs/heads/new-branch $zero" | "$PROJECT_ROOT/.githooks/pre-push" >/dev/null 2>&1 \
+  || fail "pre-push rejected a valid pushed commit because of the working tree"
+pass "pre-push validates the pushed commits, not the checkout"
+
+echo ""
+echo "All git validation tests passed!"
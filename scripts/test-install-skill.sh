@@ -0,0 +1,90 @@
+#!/bin/bash
+set -e
+
+# Skill Installer Tests
+# Checks that install.py validates before writing anything, names the
+# install from the parsed frontmatter, never hardlinks unless asked and
+# swaps an existing install out whole
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+INSTALLER="$PROJECT_ROOT/skills/meta/install-skill/scripts/install.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+SOURCE="$TEST_DIR/source-dir"
+TARGET="$TEST_DIR/target"
+mkdir -p "$SOURCE/scripts"
+cat > "$SOURCE/SKILL.md" <<'EOF'
+---
+name: installed-skill  # the install is named after this, not the directory
+description: Use when testing the installer.
+---
+
+# Installed Skill
+
+Run `scripts/run.sh`.
+EOF
+echo 'echo run' > "$SOURCE/scripts/run.sh"
+
+install() {
+  "$PYTHON" "$INSTALLER" "$@" >"$TEST_DIR/output" 2>&1
+}
+
+# Inode link count of a file
+links() {
+  "$PYTHON" -c 'import os, sys; print(os.stat(sys.argv[1]).st_nlink)' "$1"
+}
+
+echo ""
+echo "Skill Installer Tests"
+echo "====================="
+echo ""
+
+install "$SOURCE" "$TARGET" || fail "install failed: $(cat "$TEST_DIR/output")"
+[[ -f "$TARGET/installed-skill/scripts/run.sh" ]] \
+  || fail "skill not installed under its YAML name: $(ls -A "$TARGET")"
+pass "Install is named from the parsed frontmatter (comments stripped)"
+
+[[ $(links "$SOURCE/scripts/run.sh") == 1 ]] || fail "auto mode hardlinked a file"
+echo 'echo edited' > "$TARGET/installed-skill/scripts/run.sh"
+grep -q 'echo run' "$SOURCE/scripts/run.sh" || fail "editing the install changed the source"
+pass "Auto mode reflinks or copies, leaving the source independent"
+
+# A reinstall replaces the old install whole, leaving nothing behind
+touch "$TARGET/installed-skill/stale-file"
+install "$SOURCE" "$TARGET" --force || fail "reinstall failed: $(cat "$TEST_DIR/output")"
+[[ ! -e "$TARGET/installed-skill/stale-file" ]] || fail "reinstall kept a file from the old install"
+grep -q 'echo run' "$TARGET/installed-skill/scripts/run.sh" || fail "reinstall kept an edited file"
+[[ $(ls -A "$TARGET") == installed-skill ]] || fail "reinstall left staging files: $(ls -A "$TARGET")"
+pass "Reinstalling swaps the install out whole"
+
+install "$SOURCE" "$TARGET" --force --link hardlink || fail "hardlink install failed: $(cat "$TEST_DIR/output")"
+[[ $(links "$SOURCE/scripts/run.sh") == 2 ]] || fail "--link hardlink did not hardlink"
+pass "--link hardlink shares files with the source"
+
+# Validation errors abort before anything is written
+BROKEN="$TEST_DIR/broken"
+mkdir -p "$BROKEN"
+printf -- '---\nname: broken\ndescription: Use when testing.\n---\n\nSee [missing](references/missing.md).\n' > "$BROKEN/SKILL.md"
+if install "$BROKEN" "$TARGET" --force; then
+  fail "installed a skill that fails validation"
+fi
+[[ ! -e "$TARGET/broken" ]] || fail "a failed validation still wrote the install"
+[[ $(ls -A "$TARGET") == installed-skill ]] || fail "a failed validation left files: $(ls -A "$TARGET")"
+pass "A skill that fails validation is not installed"
+
+echo ""
+echo "All skill installer tests passed!"
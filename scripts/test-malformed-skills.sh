@@ -0,0 +1,160 @@
+#!/bin/bash
+set -e
+
+# Malformed Skill Tests
+# Checks that the skill tooling reports broken SKILL.md files as errors for
+# that skill and keeps going, instead of aborting the whole run
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR="$PROJECT_ROOT/skills/meta/skill-tester/scripts/test_skill.py"
+YAML_CHECKER="$PROJECT_ROOT/skills/meta/skill-tester/scripts/validate_yaml.py"
+EVALUATOR="$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/run_evaluation.py"
+SKILL_INDEX="$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/skill_index.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# A tree of one valid skill and several broken ones
+TREE="$TEST_DIR/skills"
+mkdir -p "$TREE"/{good-skill,dated-license,list-description,list-frontmatter,empty-frontmatter,text-frontmatter,not-utf8}
+cat > "$TREE/good-skill/SKILL.md" <<'EOF'
+---
+name: good-skill
+description: A well-formed skill. Use when checking that valid skills still pass.
+---
+
+# Good Skill
+
+## When to Use This Skill
+
+Use it in tests.
+EOF
+printf -- '---\nname: dated-license\ndescription: Use when YAML loads a field as a date.\nlicense: 2024-01-01\n---\n\nBody\n' \
+  > "$TREE/dated-license/SKILL.md"
+printf -- '---\nname: list-description\ndescription: [1, 2]\n---\n\nBody\n' > "$TREE/list-description/SKILL.md"
+printf -- '---\n- name\n- description\n---\n\nBody\n' > "$TREE/list-frontmatter/SKILL.md"
+printf -- '---\n\n---\n\nBody\n' > "$TREE/empty-frontmatter/SKILL.md"
+printf -- '---\njust text\n---\n\nBody\n' > "$TREE/text-frontmatter/SKILL.md"
+printf -- '---\nname: not-utf8\ndescription: Latin-1 \xe9\n---\n\nBody\n' > "$TREE/not-utf8/SKILL.md"
+
+echo ""
+echo "Malformed Skill Tests"
+echo "====================="
+echo ""
+
+# Validator: every skill is reported and the run exits 1, without a traceback
+for jobs in 1 2; do
+  output=$("$PYTHON" "$VALIDATOR" --quiet --jobs "$jobs" --format json "$TREE" 2>&1) && status=0 || status=$?
+  [[ $status -eq 1 ]] || fail "validator (--jobs $jobs) exited $status instead of 1: $output"
+  echo "$output" | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+valid = {skill["skill"].rsplit("/", 1)[1]: skill["valid"] for skill in report["skills"]}
+expected = {
+    "good-skill": True,
+    "dated-license": True,
+    "list-description": False,
+    "list-frontmatter": False,
+    "empty-frontmatter": False,
+    "text-frontmatter": False,
+    "not-utf8": False,
+}
+sys.exit(0 if valid == expected else f"unexpected results: {valid}")
+' || fail "validator (--jobs $jobs) misreported the tree"
+done
+pass "Validator reports each malformed skill and checks the rest of the tree"
+
+# YAML checker: each malformed skill fails with a message instead of a traceback
+for skill in list-description list-frontmatter empty-frontmatter text-frontmatter not-utf8; do
+  output=$("$PYTHON" "$YAML_CHECKER" --format json "$TREE/$skill" 2>&1) && status=0 || status=$?
+  [[ $status -eq 1 ]] || fail "validate_yaml.py exited $status on $skill: $output"
+  echo "$output" | "$PYTHON" -c '
+import json, sys
+report = json.load(sys.stdin)
+errors = [r["message"] for r in report["results"] if r["severity"] == "error"]
+sys.exit(0 if report["valid"] is False and errors else f"no error reported: {report}")
+' || fail "validate_yaml.py misreported $skill: $output"
+done
+output=$("$PYTHON" "$YAML_CHECKER" "$TREE/list-frontmatter" 2>&1 || true)
+[[ $output == *"must be a mapping of fields (got list)"* ]] \
+  || fail "validate_yaml.py did not explain non-mapping frontmatter: $output"
+"$PYTHON" "$YAML_CHECKER" "$TREE/good-skill" >/dev/null || fail "validate_yaml.py rejected a valid skill"
+pass "YAML checker reports each malformed skill"
+
+# Metrics collection: malformed skills still get metrics from their body
+"$PYTHON" "$VALIDATOR" --quiet --metrics "$TEST_DIR/metrics.json" "$TREE" >/dev/null 2>"$TEST_DIR/stderr" || true
+"$PYTHON" - "$TEST_DIR/metrics.json" <<'EOF' || fail "--metrics failed on the malformed tree: $(cat "$TEST_DIR/stderr")"
+import json, sys
+metrics = {entry["path"].rsplit("/", 1)[1]: entry for entry in json.load(open(sys.argv[1]))}
+assert len(metrics) == 6, sorted(metrics)
+assert metrics["dated-license"]["license"] == "2024-01-01", metrics["dated-license"]
+assert metrics["list-frontmatter"]["name"] == "unknown" and metrics["list-frontmatter"]["word_count"] == 1
+EOF
+output=$(printf '%s\n' "{\"jsonrpc\": \"2.0\", \"id\": 1, \"method\": \"evaluate\", \"params\": {\"path\": \"$TREE/list-frontmatter\"}}" \
+  | "$PYTHON" "$VALIDATOR" --serve)
+echo "$output" | "$PYTHON" -c '
+import json, sys
+result = json.loads(sys.stdin.readline())["result"]
+sys.exit(0 if result["valid"] is False and result["metrics"]["word_count"] == 1 else f"unexpected result: {result}")
+' || fail "worker evaluate failed on list frontmatter: $output"
+pass "Metrics collection reports bad frontmatter, records fields as text and still measures the body"
+
+output=$(printf '%s\n' "{\"jsonrpc\": \"2.0\", \"id\": 1, \"method\": \"validate_many\", \"params\": {\"root\": \"$TREE\"}}" \
+  | "$PYTHON" "$VALIDATOR" --serve)
+echo "$output" | "$PYTHON" -c '
+import json, sys
+response = json.loads(sys.stdin.readline())
+summary = response["result"]["summary"]
+sys.exit(0 if (summary["skills"], summary["failed"]) == (7, 5) else f"unexpected summary: {summary}")
+' || fail "validate_many failed on the malformed tree: $output"
+pass "Worker validate_many reports malformed skills instead of failing the batch"
+
+# Batch evaluation: broken skills get a row carrying the error
+for jobs in 1 2; do
+  "$PYTHON" "$EVALUATOR" --batch --jobs "$jobs" "$TREE" -o "$TEST_DIR/metrics.csv" >/dev/null \
+    || fail "batch evaluation (--jobs $jobs) failed on the malformed tree"
+  "$PYTHON" - "$TEST_DIR/metrics.csv" <<'EOF' || fail "batch evaluation (--jobs $jobs) wrote the wrong rows"
+import csv, sys
+rows = {row["path"]: row for row in csv.DictReader(open(sys.argv[1], encoding="utf-8"))}
+assert len(rows) == 7, sorted(rows)
+assert rows["good-skill"]["error"] == "" and rows["good-skill"]["name"] == "good-skill", rows["good-skill"]
+for path in ("list-frontmatter", "empty-frontmatter", "text-frontmatter", "not-utf8"):
+    assert rows[path]["error"] and not rows[path]["name"], rows[path]
+EOF
+done
+pass "Batch evaluation writes an error row for each malformed skill"
+
+# Skill index: malformed skills are indexed by their body, not dropped
+output=$("$PYTHON" "$SKILL_INDEX" "$TREE" --index "$TEST_DIR/index.bin" --format json 2>&1) \
+  || fail "skill index failed on the malformed tree: $output"
+echo "$output" | "$PYTHON" -c '
+import json, sys
+entries = {entry["path"]: entry for entry in json.load(sys.stdin)}
+assert len(entries) == 7, sorted(entries)
+assert entries["good-skill"]["name"] == "good-skill", entries["good-skill"]
+for path in ("list-frontmatter", "empty-frontmatter", "text-frontmatter"):
+    assert entries[path]["name"] == "" and entries[path]["word_count"] == 1, entries[path]
+' || fail "skill index misrecorded the malformed tree: $output"
+pass "Skill index records malformed skills instead of aborting the build"
+
+# Catalog generation is built on the index (run outside any git checkout)
+(cd "$TEST_DIR" && "$PYTHON" "$PROJECT_ROOT/scripts/build-catalog.py" --root skills \
+  --catalog CATALOG.md --index index.bin >/dev/null) || fail "build-catalog.py failed on the malformed tree"
+grep -q "catalog-entry skills/empty-frontmatter " "$TEST_DIR/CATALOG.md" \
+  || fail "build-catalog.py left out a malformed skill"
+pass "Catalog generator lists malformed skills"
+
+echo ""
+echo "All malformed skill tests passed!"
@@ -0,0 +1,45 @@
+#!/bin/bash
+set -e
+
+# Shared Module Tests
+# Each skill ships its own copy of the shared Python modules so it stays
+# self-contained; checks that every copy is identical to the original
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+META="$PROJECT_ROOT/skills/meta"
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+# original, then each copy that must match it
+check_copies() {
+  local original="$1"
+  shift
+  for copy in "$@"; do
+    cmp -s "$META/$original" "$META/$copy" \
+      || fail "$copy differs from $original (copy the original over it)"
+  done
+  pass "$original matches its $# cop$([[ $# -eq 1 ]] && echo y || echo ies)"
+}
+
+echo ""
+echo "Shared Module Tests"
+echo "==================="
+echo ""
+
+check_copies skill-tester/scripts/skill_parser.py \
+  skill-creator/scripts/skill_parser.py \
+  skill-evaluator/scripts/skill_parser.py \
+  skill-browser/scripts/skill_parser.py
+check_copies skill-creator/scripts/validate_skill.py \
+  skill-tester/scripts/test_skill.py
+
+echo ""
+echo "All shared module tests passed!"
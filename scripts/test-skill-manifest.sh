@@ -0,0 +1,78 @@
+#!/bin/bash
+set -e
+
+# Skill Manifest Tests
+# Checks that skill_manifest.py verify reports every kind of drift, in any
+# directory of the skill, and stays quiet for an untouched install
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+MANIFEST="$PROJECT_ROOT/skills/meta/skill-evaluator/scripts/skill_manifest.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+SKILLS="$TEST_DIR/skills"
+SKILL="$SKILLS/tracked-skill"
+mkdir -p "$SKILL/scripts" "$SKILL/node_modules/dep" "$SKILL/.git"
+printf -- '---\nname: tracked-skill\ndescription: Use when testing manifests.\n---\n\nBody\n' > "$SKILL/SKILL.md"
+echo 'echo run' > "$SKILL/scripts/run.sh"
+echo 'module.exports = 1' > "$SKILL/node_modules/dep/index.js"
+echo 'ref: refs/heads/main' > "$SKILL/.git/HEAD"
+
+# Drift reported by verify, as "status added/removed/modified" paths
+drift() {
+  "$PYTHON" "$MANIFEST" verify --format json "$SKILLS" | "$PYTHON" -c '
+import json, sys
+[report] = json.load(sys.stdin)
+changes = [f"{key}:{path}" for key in ("added", "removed", "modified") for path in report.get(key, [])]
+print(report["status"], *changes)
+' || true
+}
+
+echo ""
+echo "Skill Manifest Tests"
+echo "===================="
+echo ""
+
+[[ $(drift) == "error" ]] || fail "verify without a manifest did not report an error"
+"$PYTHON" "$MANIFEST" write "$SKILLS" >/dev/null || fail "write failed"
+[[ $(drift) == "clean" ]] || fail "untouched skill reported drift: $(drift)"
+pass "An untouched skill matches its manifest"
+
+# Same size, different content: found by hashing after the mtime changed
+echo 'echo RUN' > "$SKILL/scripts/run.sh"
+touch -d '2000-01-01' "$SKILL/scripts/run.sh"
+[[ $(drift) == "drift modified:scripts/run.sh" ]] || fail "same-size edit not reported: $(drift)"
+pass "An edit that keeps the file size is reported as modified"
+
+"$PYTHON" "$MANIFEST" write "$SKILLS" >/dev/null
+echo 'module.exports = 2;' > "$SKILL/node_modules/dep/index.js"
+echo 'new' > "$SKILL/node_modules/dep/extra.js"
+rm "$SKILL/scripts/run.sh"
+echo 'ignored' > "$SKILL/.git/ORIG_HEAD"
+expected="drift added:node_modules/dep/extra.js removed:scripts/run.sh modified:node_modules/dep/index.js"
+[[ $(drift) == "$expected" ]] || fail "unexpected drift: $(drift)"
+pass "Added, removed and modified files are reported, including in node_modules/"
+
+"$PYTHON" "$MANIFEST" write "$SKILLS" >/dev/null
+[[ $(drift) == "clean" ]] || fail "rewritten manifest still reports drift: $(drift)"
+grep -q '"node_modules/dep/index.js"' "$SKILL/.skill-manifest.json" || fail "manifest left out node_modules/"
+if grep -q '".git/' "$SKILL/.skill-manifest.json"; then
+  fail "manifest recorded .git/"
+fi
+pass "Manifests record dependency directories and leave out .git/"
+
+echo ""
+echo "All skill manifest tests passed!"
@@ -0,0 +1,143 @@
+#!/bin/bash
+set -e
+
+# Skill Metrics Parity Tests
+# Checks that skill_parser.body_metrics and count_words return exactly what
+# the straightforward split/lower/regex implementation returns
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+PARSER_DIR="$PROJECT_ROOT/skills/meta/skill-tester/scripts"
+PYTHON="${PYTHON:-python3}"
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+run_parity() {
+  PYTHONDONTWRITEBYTECODE=1 "$PYTHON" - "$PARSER_DIR" "$PROJECT_ROOT" "$1" <<'EOF'
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+import skill_parser  # noqa: E402
+from skill_parser import body_metrics, count_words, parse_skill_md  # noqa: E402
+
+
+def reference(body):
+    """The metrics as originally computed: five passes, two copies."""
+    return {
+        "word_count": len(body.split()),
+        "line_count": len(body.split("\n")),
+        "example_count": body.lower().count("### example"),
+        "has_when_section": bool(re.search(r"##\s+when to use", body, re.IGNORECASE)),
+        "sections": re.findall(r"^##\s+(.+)$", body, re.MULTILINE),
+    }
+
+
+def check(body):
+    expected, actual = reference(body), body_metrics(body)
+    if expected != actual:
+        sys.exit(f"mismatch for {body!r}:\n  expected {expected}\n  actual   {actual}")
+
+
+case = sys.argv[3]
+
+if case == "whitespace":
+    # Every character str.split() treats as whitespace, between two words
+    for code in range(0x110000):
+        char = chr(code)
+        for text in (f"a{char}b", char, f"{char}x{char}"):
+            if count_words(text) != len(text.split()):
+                sys.exit(f"count_words differs for U+{code:04X}")
+
+elif case == "skills":
+    bodies = 0
+    for skill_md in sorted(Path(sys.argv[2], "skills").rglob("SKILL.md")):
+        parsed = parse_skill_md(skill_md)
+        if parsed.body is not None:
+            check(parsed.body)
+            bodies += 1
+    if not bodies:
+        sys.exit("no SKILL.md bodies found")
+
+elif case == "edge":
+    for body in [
+        "",
+        "\n",
+        "word",
+        "  leading and trailing  ",
+        "## Section",
+        "##Section",
+        "## ",
+        "##  \n",
+        "## \n\n## Next",
+        "##\n\nfollowing line",
+        "#### Deeper\n### Sub\n## Top\n",
+        "text ## inline\n## Real\n",
+        "## A\r\n## B\r\n",
+        "### Example\n### EXAMPLE 2\n### example\n#### example\n###Example\n",
+        "### Exampl\n### İxample\n### Examples",
+        "## When to Use\n",
+        "##\twhen  TO\nuse",
+        "## When to uſe",
+        "a\x1cb\x1dc\x1ed\x1ff",
+        "a\x0bb\x0cc\rd\te",
+        "non\xa0breaking　ideographic line",
+        "✓ emoji 🎉 and ümlauts",
+        "lone \ud800 surrogate",
+        "\x85## Next",
+    ]:
+        check(body)
+
+elif case == "fuzz":
+    rng = random.Random(1234)
+    alphabet = [
+        "#", "##", "### ", " ", "  ", "\n", "\r", "\t", "\x0b", "\x1c", "\xa0",
+        " ", "　", "\x85", "example", "Example", "EXAMPLE", "when to use",
+        "When To Use", "ſ", "K", "İ", "✓", "word", "a", "-",
+    ]
+    for _ in range(20000):
+        check("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))))
+
+elif case == "windows":
+    # Words, spaces and Unicode whitespace falling on window boundaries
+    rng = random.Random(5678)
+    pieces = ["a", "word", "ü", " ", "  ", "\n", "\xa0", "　", "\x1c", "\u2028"]
+    for window in (1, 2, 3, 7, 16):
+        skill_parser.WORD_COUNT_WINDOW = window
+        for _ in range(5000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+            if count_words(text) != len(text.split()):
+                sys.exit(f"count_words differs with window {window} for {text!r}")
+    skill_parser.WORD_COUNT_WINDOW = 1 << 16
+    large = "".join(rng.choice(pieces) for _ in range(400000))
+    check(large)
+EOF
+}
+
+echo ""
+echo "Skill Metrics Parity Tests"
+echo "=========================="
+echo ""
+
+run_parity whitespace && pass "count_words agrees with str.split() for every Unicode character" \
+  || fail "count_words disagrees with str.split()"
+run_parity skills && pass "body_metrics matches the reference on every SKILL.md in skills/" \
+  || fail "body_metrics differs on a SKILL.md in skills/"
+run_parity edge && pass "body_metrics matches the reference on edge cases" \
+  || fail "body_metrics differs on an edge case"
+run_parity fuzz && pass "body_metrics matches the reference on 20,000 random bodies" \
+  || fail "body_metrics differs on a random body"
+run_parity windows && pass "count_words agrees with str.split() across window boundaries" \
+  || fail "count_words differs across window boundaries"
+
+echo ""
+echo "All skill metrics tests passed!"
@@ -0,0 +1,91 @@
+#!/bin/bash
+set -e
+
+# Skill Search Tests
+# Checks that skill-browser's search_skills.py ranks skills with BM25
+# (name and description terms above body terms) and updates its index
+# incrementally as skills are added, edited and removed
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+SEARCH_DIR="$PROJECT_ROOT/skills/meta/skill-browser/scripts"
+SEARCH="$SEARCH_DIR/search_skills.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+TREE="$TEST_DIR/skills"
+INDEX="$TEST_DIR/index.bin"
+
+# Write a skill named $1 with description $2 and body $3
+write_skill() {
+  mkdir -p "$TREE/$1"
+  printf -- '---\nname: %s\ndescription: %s\n---\n\n# %s\n\n%s\n' "$1" "$2" "$1" "$3" > "$TREE/$1/SKILL.md"
+}
+
+write_skill pdf-tools "Use when converting PDF files." "Split and merge documents."
+write_skill doc-writer "Use when writing documents." "Can also export a pdf at the end."
+write_skill weather "Use when checking the forecast." "Fetches weather data."
+
+# Skill names matching a query, best first
+search() {
+  "$PYTHON" "$SEARCH" "$TREE" "$@" --index "$INDEX" --format json | "$PYTHON" -c '
+import json, sys
+print(" ".join(hit["name"] for hit in json.load(sys.stdin)))
+'
+}
+
+# Counts from an index update, as "added updated unchanged removed"
+update() {
+  "$PYTHON" - "$SEARCH_DIR" "$TREE" "$INDEX" <<'EOF'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+from search_skills import update_search_index
+
+stats = update_search_index(Path(sys.argv[2]), Path(sys.argv[3]))
+print(stats["added"], stats["updated"], stats["unchanged"], stats["removed"])
+EOF
+}
+
+echo ""
+echo "Skill Search Tests"
+echo "=================="
+echo ""
+
+[[ $(search pdf) == "pdf-tools doc-writer" ]] || fail "unexpected ranking for 'pdf': $(search pdf)"
+[[ $(search forecast weather) == "weather" ]] || fail "multi-term query failed: $(search forecast weather)"
+if "$PYTHON" "$SEARCH" "$TREE" nonexistent --index "$INDEX" >/dev/null; then
+  fail "a query without matches exited successfully"
+fi
+pass "Matches are ranked, with name and description terms above body terms"
+
+[[ $(update) == "0 0 3 0" ]] || fail "an unchanged tree was re-indexed"
+touch "$TREE/weather/SKILL.md"
+[[ $(update) == "0 0 3 0" ]] || fail "a touched but unchanged skill was re-parsed"
+write_skill weather "Use when checking the forecast." "Fetches weather data and radar maps."
+write_skill radar "Use when reading radar images." "Shows radar loops."
+rm -r "$TREE/doc-writer"
+counts=$(update)
+[[ "$counts" == "1 1 1 1" ]] || fail "unexpected update counts: $counts"
+pass "Updates re-parse only added and edited skills and drop removed ones"
+
+[[ $(search radar) == "radar weather" ]] || fail "edited and added skills not searchable: $(search radar)"
+[[ $(search pdf) == "pdf-tools" ]] || fail "removed skill still found: $(search pdf)"
+[[ $(search --no-update merge) == "pdf-tools" ]] || fail "postings of unchanged skills were lost"
+pass "The updated index answers queries for new, edited and unchanged skills"
+
+echo ""
+echo "All skill search tests passed!"
@@ -0,0 +1,98 @@
+#!/bin/bash
+set -e
+
+# Skill Worker Tests
+# Checks that the JSON-RPC validation worker (validate_skill.py --serve)
+# answers every request on valid input, survives results it can't encode
+# and keeps its in-memory results bounded
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR_DIR="$PROJECT_ROOT/skills/meta/skill-creator/scripts"
+VALIDATOR="$VALIDATOR_DIR/validate_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+TREE="$TEST_DIR/skills"
+for name in first-skill second-skill third-skill; do
+  mkdir -p "$TREE/$name"
+  printf -- '---\nname: %s\ndescription: Use when testing the worker.\nlicense: 2024-01-01\n---\n\nBody\n' \
+    "$name" > "$TREE/$name/SKILL.md"
+done
+
+echo ""
+echo "Skill Worker Tests"
+echo "=================="
+echo ""
+
+# A date-valued license is answered as text and the worker keeps serving
+output=$(printf '%s\n' \
+  "{\"jsonrpc\": \"2.0\", \"id\": 1, \"method\": \"evaluate\", \"params\": {\"path\": \"$TREE/first-skill\"}}" \
+  "{\"jsonrpc\": \"2.0\", \"id\": 2, \"method\": \"validate\", \"params\": {\"path\": \"$TREE/second-skill\", \"metrics\": true}}" \
+  | "$PYTHON" "$VALIDATOR" --serve)
+echo "$output" | "$PYTHON" -c '
+import json, sys
+responses = [json.loads(line) for line in sys.stdin]
+assert [r["id"] for r in responses] == [1, 2], responses
+assert responses[0]["result"]["metrics"]["license"] == "2024-01-01", responses[0]
+assert responses[1]["result"]["valid"] is True, responses[1]
+' || fail "worker failed on a date-valued frontmatter field: $output"
+pass "Worker answers skills with date-valued frontmatter"
+
+# An unencodable result becomes an internal error for that request only
+"$PYTHON" - "$VALIDATOR_DIR" "$TREE" <<'EOF' || fail "worker stopped on an unencodable result"
+import datetime, io, json, sys
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import INTERNAL_ERROR, ValidationServer
+
+server = ValidationServer()
+server._methods["today"] = lambda params: {"date": datetime.date(2024, 1, 1)}
+requests = [
+    {"jsonrpc": "2.0", "id": 1, "method": "today", "params": {}},
+    {"jsonrpc": "2.0", "id": 2, "method": "validate", "params": {"path": f"{sys.argv[2]}/first-skill"}},
+]
+stdout = io.StringIO()
+server.serve(io.StringIO("".join(json.dumps(r) + "\n" for r in requests)), stdout)
+first, second = [json.loads(line) for line in stdout.getvalue().splitlines()]
+assert first["id"] == 1 and first["error"]["code"] == INTERNAL_ERROR, first
+assert "TypeError" in first["error"]["message"], first
+assert second["id"] == 2 and second["result"]["valid"] is True, second
+EOF
+pass "Worker answers an unencodable result with an internal error and keeps serving"
+
+# Remembered results are capped, dropping the least recently used
+"$PYTHON" - "$VALIDATOR_DIR" "$TREE" <<'EOF' || fail "worker memo is not bounded"
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import ValidationServer
+
+tree = Path(sys.argv[2])
+first, second, third = (tree / name for name in ("first-skill", "second-skill", "third-skill"))
+server = ValidationServer(memo_size=2)
+[kept] = server.validate_paths([first])
+server.validate_paths([second])
+server.validate_paths([first])  # first is now the most recently used
+server.validate_paths([third])
+remembered = [key[0] for key in server._memo]
+assert remembered == [str(first), str(third)], remembered
+assert server.validate_paths([first])[0] is kept
+EOF
+pass "Worker keeps at most memo_size results, evicting the least recently used"
+
+echo ""
+echo "All skill worker tests passed!"
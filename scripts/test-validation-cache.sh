@@ -0,0 +1,109 @@
+#!/bin/bash
+set -e
+
+# Validation Cache Tests
+# Checks that validate_skill.py --cache-dir reuses results only while a
+# skill, its referenced files and the validator are unchanged, and that a
+# failed cache write never breaks the run
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR_DIR="$PROJECT_ROOT/skills/meta/skill-creator/scripts"
+VALIDATOR="$VALIDATOR_DIR/validate_skill.py"
+PYTHON="${PYTHON:-python3}"
+export PYTHONDONTWRITEBYTECODE=1
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+# Test helpers
+pass() { echo -e "${GREEN}✓${NC} $1"; }
+fail() { echo -e "${RED}✗${NC} $1"; exit 1; }
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+TREE="$TEST_DIR/skills"
+CACHE="$TEST_DIR/cache"
+SKILL="$TREE/cached-skill"
+mkdir -p "$SKILL/scripts"
+cat > "$SKILL/SKILL.md" <<'EOF'
+---
+name: cached-skill
+description: Use when testing the validation cache.
+---
+
+# Cached Skill
+
+Run `scripts/run.sh` first.
+EOF
+echo 'echo run' > "$SKILL/scripts/run.sh"
+
+# Whether the cache holds a complete entry for the skill
+cache_state() {
+  "$PYTHON" - "$VALIDATOR_DIR" "$SKILL" "$CACHE" <<'EOF'
+import sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import ValidationCache
+
+hit = ValidationCache(Path(sys.argv[3])).lookup(Path(sys.argv[2]))
+print("hit" if hit is not None else "miss")
+EOF
+}
+
+validate() {
+  "$PYTHON" "$VALIDATOR" --quiet --jobs 1 --cache-dir "$CACHE" "$TREE" >/dev/null 2>&1
+}
+
+echo ""
+echo "Validation Cache Tests"
+echo "======================"
+echo ""
+
+[[ $(cache_state) == miss ]] || fail "empty cache reported a hit"
+validate || fail "valid skill failed validation"
+[[ $(cache_state) == hit ]] || fail "validated skill was not cached"
+validate || fail "cached run failed"
+pass "Results are cached and reused for an unchanged skill"
+
+# Editing SKILL.md changes its content hash
+printf '\nMore text.\n' >> "$SKILL/SKILL.md"
+[[ $(cache_state) == miss ]] || fail "edited SKILL.md still hit the cache"
+validate || fail "edited skill failed validation"
+[[ $(cache_state) == hit ]] || fail "edited skill was not re-cached"
+pass "Editing SKILL.md invalidates its entry"
+
+# A referenced file disappearing changes its stat signature
+rm "$SKILL/scripts/run.sh"
+[[ $(cache_state) == miss ]] || fail "removed reference still hit the cache"
+if validate; then
+  fail "cached result hid a missing referenced file"
+fi
+pass "Removing a referenced file invalidates the entry and is reported"
+
+# Entries that can't be serialized are skipped without leaving temp files
+"$PYTHON" - "$VALIDATOR_DIR" "$SKILL" "$TEST_DIR/store-cache" <<'EOF' || fail "an unserializable entry broke the cache"
+import datetime, sys
+from pathlib import Path
+
+sys.path.insert(0, sys.argv[1])
+from validate_skill import SkillValidator, ValidationCache
+
+cache_dir = Path(sys.argv[3])
+validator = SkillValidator(Path(sys.argv[2]), collect_metrics=True)
+validator.validate()
+validator.metrics["released"] = datetime.date(2024, 1, 1)
+cache = ValidationCache(cache_dir)
+cache.store(validator)
+leftovers = [p.name for p in cache_dir.rglob("*") if p.is_file()]
+assert leftovers == [], leftovers
+assert cache.lookup(validator.skill_path, collect_metrics=True) is None
+EOF
+pass "Unserializable entries are not cached and leave no temporary files"
+
+echo ""
+echo "All validation cache tests passed!"
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Install agent skills, validating them before anything is written.
+
+The source is checked with skill-tester's SkillValidator, then materialized
+file by file into a staging directory beside the target: reflinked
+(copy-on-write clone) where the filesystem supports it, otherwise copied.
+Hardlinks are only used when asked for, since an installed file edited in
+place would then rewrite the source too. The staging directory is renamed
+into place, so a skill is never visible half-installed and an existing
+install is swapped out whole.
+
+Usage:
+    python install.py <skill-source> [target-directory]
+    python install.py skills/meta/skill-creator
+    python install.py /path/to/skill-directory --force
+    python install.py /path/to/skill-directory --link hardlink
+    python install.py https://github.com/user/repo/tree/main/skills/my-skill
+    python install.py --help
+
+Skill sources:
+    Shorthand (from the dot-agents repo): skills/meta/skill-creator
+    Local path: /path/to/skill-directory, ../skills/my-skill, ~/skills/my-skill
+    GitHub URL: https://github.com/user/repo/tree/<branch>/path/to/skill
+"""
+
+import argparse
+import errno
+import functools
+import importlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+AGENT_SKILLS_REPO = "https://github.com/tnez/dot-agents"
+
+# Target directories in discovery priority order: project before global,
+# agent-agnostic before Claude-specific
+SEARCH_DIRS = (
+    Path(".agents/skills"),
+    Path(".claude/skills"),
+    Path("~/.agents/skills").expanduser(),
+    Path("~/.claude/skills").expanduser(),
+)
+DEFAULT_TARGET = SEARCH_DIRS[0]
+
+# Where skill-tester (and its copy of the validator) sits relative to this
+# skill, both in the dot-agents checkout and in an installed skills directory
+VALIDATOR_DIRS = ("skill-tester/scripts", "skill-creator/scripts")
+VALIDATOR_MODULES = ("test_skill", "validate_skill")
+
+# The installed directory is named after the skill, so a source directory
+# with a different name is not an error here
+IGNORED_RULES = {"name-matches-directory"}
+
+# Directories never copied into an installed skill
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+SKILL_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+GITHUB_TREE_URL = re.compile(r"^(https://github\.com/[^/]+/[^/]+)/tree/([^/]+)/(.+?)/?$")
+
+# Linux ioctl cloning one file's extents into another (fcntl.FICLONE, 3.12+)
+FICLONE = 0x40049409
+
+# Errors meaning a link method is unavailable here, rather than a failed file
+UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL, errno.ENOTTY, errno.EPERM, errno.ENOSYS}
+
+
+def info(message: str):
+    print(f"ℹ {message}", file=sys.stderr)
+
+
+def success(message: str):
+    print(f"✓ {message}", file=sys.stderr)
+
+
+def warning(message: str):
+    print(f"⚠ {message}", file=sys.stderr)
+
+
+def error(message: str):
+    print(f"✗ {message}", file=sys.stderr)
+
+
+class InstallError(Exception):
+    """An installation step failed; the message is shown to the user."""
+
+
+def discover_target_dir() -> Path:
+    """Skills directory to install into when none is given.
+
+    The first search directory already holding skills wins, then the first
+    that exists at all, then `.agents/skills`.
+    """
+    existing = [path for path in SEARCH_DIRS if path.is_dir()]
+    for path in existing:
+        if any(path.glob("*/SKILL.md")):
+            info(f"Found skills in: {path}")
+            return path
+    if existing:
+        warning(f"Found empty skills directory: {existing[0]}")
+        return existing[0]
+    return DEFAULT_TARGET
+
+
+def read_skill_name(skill_md: Path) -> str:
+    """The `name` field of SKILL.md, parsed by skill-tester's parser.
+
+    This is the frontmatter the validator checked, so comments, quoting and
+    folded scalars are read exactly as it read them.
+    """
+    if load_validator() is None:
+        raise InstallError("skill-tester not found next to install-skill; it is needed to read the skill name")
+    # Importable once the validator's scripts directory is on the path
+    import skill_parser
+
+    try:
+        parsed = skill_parser.parse_skill_md(skill_md)
+    except (OSError, UnicodeDecodeError) as exc:
+        raise InstallError(f"Could not read SKILL.md: {exc}") from exc
+    except ImportError as exc:
+        raise InstallError("PyYAML is required to read SKILL.md (pip install pyyaml)") from exc
+
+    frontmatter = parsed.frontmatter
+    name = frontmatter.get("name") if isinstance(frontmatter, dict) else None
+    if not isinstance(name, str):
+        raise InstallError("Could not extract skill name from SKILL.md")
+    return name
+
+
+@functools.lru_cache(maxsize=None)
+def load_validator():
+    """skill-tester's validator module, found beside this skill, or None."""
+    skills_dir = Path(__file__).resolve().parent.parent.parent
+    for rel_dir in VALIDATOR_DIRS:
+        scripts_dir = skills_dir / rel_dir
+        for module_name in VALIDATOR_MODULES:
+            if (scripts_dir / f"{module_name}.py").is_file():
+                sys.path.insert(0, str(scripts_dir))
+                return importlib.import_module(module_name)
+    return None
+
+
+def validate_source(source: Path):
+    """Run SkillValidator on the source, raising InstallError on errors."""
+    validator_module = load_validator()
+    if validator_module is None:
+        raise InstallError("skill-tester not found next to install-skill; use --skip-validation to install anyway")
+
+    validator = validator_module.SkillValidator(source)
+    validator.validate()
+    errors = [
+        result for result in validator.results
+        if result.severity == validator_module.ERROR and result.rule not in IGNORED_RULES
+    ]
+    for result in errors:
+        error(result.message)
+    if errors:
+        raise InstallError(f"Validation failed with {len(errors)} error(s); nothing was installed")
+
+    warnings = validator.counts[validator_module.WARNING]
+    success("Validation passed" + (f" with {warnings} warning(s)" if warnings else ""))
+
+
+def _reflink(source: str, dest: str):
+    """Clone source's data into a new file at dest, sharing extents."""
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(dest), 0) != 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), dest)
+        return
+
+    import fcntl
+
+    with open(source, "rb") as src:
+        fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            fcntl.ioctl(fd, getattr(fcntl, "FICLONE", FICLONE), src.fileno())
+        except OSError:
+            os.close(fd)
+            os.unlink(dest)
+            raise
+        os.close(fd)
+    shutil.copystat(source, dest)
+
+
+def _hardlink(source: str, dest: str):
+    os.link(source, dest)
+
+
+def _copy(source: str, dest: str):
+    shutil.copy2(source, dest)
+
+
+LINK_METHODS = {"reflink": _reflink, "hardlink": _hardlink, "copy": _copy}
+LINK_LABELS = {"reflink": "reflinked", "hardlink": "hardlinked", "copy": "copied"}
+
+
+# Methods tried in order by "auto": both leave the install independent of the
+# source. Hardlinks share the source's data, so they are never a fallback.
+AUTO_METHODS = ("reflink", "copy")
+
+
+class Materializer:
+    """Recreates a skill directory, preferring the cheapest link method.
+
+    A method that fails as unsupported (cross-device, no reflink support) is
+    dropped for the rest of the install instead of being retried per file.
+    """
+
+    def __init__(self, mode: str = "auto"):
+        self.methods: List[str] = list(AUTO_METHODS) if mode == "auto" else [mode]
+        self.counts = dict.fromkeys(LINK_METHODS, 0)
+
+    def place_file(self, source: str, dest: str):
+        while True:
+            method = self.methods[0]
+            try:
+                LINK_METHODS[method](source, dest)
+            except OSError as exc:
+                if exc.errno not in UNSUPPORTED or len(self.methods) == 1:
+                    raise
+                self.methods.pop(0)
+                continue
+            self.counts[method] += 1
+            return
+
+    def materialize(self, source: Path, dest: Path):
+        """Recreate the files and symlinks beneath source at dest."""
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, source)
+            target_dir = dest / rel_dir if rel_dir != "." else dest
+            target_dir.mkdir(exist_ok=True)
+            for name in dirnames + filenames:
+                path = os.path.join(dirpath, name)
+                if os.path.islink(path):
+                    # Links are recreated as links; os.walk doesn't descend them
+                    os.symlink(os.readlink(path), target_dir / name)
+                elif name in filenames:
+                    self.place_file(path, str(target_dir / name))
+
+    def summary(self) -> str:
+        placed = [f"{count} {LINK_LABELS[method]}" for method, count in self.counts.items() if count]
+        return ", ".join(placed) or "no files"
+
+
+def install_directory(source: Path, target_dir: Path, mode: str = "auto", force: bool = False) -> Path:
+    """Install a validated skill directory into target_dir and return its path."""
+    name = read_skill_name(source / "SKILL.md")
+    if not SKILL_NAME.fullmatch(name):
+        raise InstallError(f"Invalid skill name in SKILL.md: {name!r}")
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / name
+    if target.exists() or target.is_symlink():
+        if not force and not confirm(f"Skill already exists: {target}\nOverwrite? [y/N]: "):
+            raise InstallError("Installation cancelled")
+
+    # Stage beside the target so the final renames stay on one filesystem
+    staging = Path(tempfile.mkdtemp(prefix=f".{name}.install-", dir=target_dir))
+    try:
+        info(f"Installing {name} from {source}")
+        materializer = Materializer(mode)
+        materializer.materialize(source, staging)
+        os.chmod(staging, 0o755 & ~current_umask())
+        swap_into_place(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    success(f"Installed skill: {name} → {target} ({materializer.summary()})")
+    return target
+
+
+def swap_into_place(staging: Path, target: Path):
+    """Rename staging to target, replacing any existing install whole."""
+    if not (target.exists() or target.is_symlink()):
+        os.rename(staging, target)
+        return
+
+    retired = target.with_name(f".{target.name}.old-{os.getpid()}")
+    os.rename(target, retired)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        os.rename(retired, target)
+        raise
+    if retired.is_dir() and not retired.is_symlink():
+        shutil.rmtree(retired, ignore_errors=True)
+    else:
+        retired.unlink()
+
+
+def current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def confirm(prompt: str) -> bool:
+    try:
+        return input(prompt).strip().lower() in ("y", "yes")
+    except EOFError:
+        return False
+
+
+def git_sparse_fetch(repo_url: str, repo_path: str, checkout: Path, branch: str | None = None) -> Path:
+    """Fetch just repo_path from a repository into checkout."""
+    clone = ["git", "clone", "--depth", "1", "--filter=blob:none", "--sparse"]
+    if branch:
+        clone += ["--branch", branch]
+    try:
+        subprocess.run([*clone, repo_url, str(checkout)], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise InstallError(f"Failed to clone repository: {repo_url}") from exc
+    try:
+        subprocess.run(
+            ["git", "-C", str(checkout), "sparse-checkout", "set", repo_path], check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError as exc:
+        raise InstallError(f"Path not found in repository: {repo_path}") from exc
+
+    skill_path = checkout / repo_path
+    if not (skill_path / "SKILL.md").is_file():
+        raise InstallError(f"SKILL.md not found at: {repo_path}")
+    return skill_path
+
+
+def find_shorthand(shorthand: str) -> Path | None:
+    """A dot-agents skill in a local checkout, if there is one."""
+    for base in (Path.cwd(), Path.cwd() / "main", Path.home() / "dot-agents", Path.home() / "dot-agents/main"):
+        candidate = base / shorthand
+        if (candidate / "SKILL.md").is_file():
+            info(f"Found skill locally: {candidate}")
+            return candidate
+    return None
+
+
+def install(source: str, target_dir: Path, mode: str = "auto", force: bool = False, validate: bool = True) -> Path:
+    """Resolve a skill source, validate it and install it into target_dir."""
+
+    def install_local(path: Path) -> Path:
+        if not path.is_dir():
+            raise InstallError(f"Source directory does not exist: {path}")
+        if not (path / "SKILL.md").is_file():
+            raise InstallError(f"SKILL.md not found in: {path}")
+        if validate:
+            validate_source(path)
+        else:
+            warning("Skipping validation")
+        return install_directory(path, target_dir, mode=mode, force=force)
+
+    if re.match(r"^https?://", source):
+        match = GITHUB_TREE_URL.match(source)
+        if match is None:
+            raise InstallError("Unsupported URL. Use a GitHub tree URL: https://github.com/user/repo/tree/<branch>/path")
+        repo_url, branch, repo_path = match.groups()
+        info(f"Fetching from GitHub: {repo_url}")
+        with tempfile.TemporaryDirectory() as checkout:
+            return install_local(git_sparse_fetch(repo_url, repo_path, Path(checkout), branch))
+
+    if source.startswith((".", "/", "~")):
+        return install_local(Path(source).expanduser())
+
+    local = find_shorthand(source)
+    if local is not None:
+        return install_local(local)
+    info("Fetching from dot-agents repository...")
+    with tempfile.TemporaryDirectory() as checkout:
+        return install_local(git_sparse_fetch(AGENT_SKILLS_REPO, source, Path(checkout)))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate a skill and install it with reflinks, copies or hardlinks"
+    )
+    parser.add_argument(
+        "source",
+        help="Skill shorthand (skills/meta/skill-creator), local path or GitHub tree URL",
+    )
+    parser.add_argument(
+        "target_directory",
+        nargs="?",
+        type=Path,
+        help="Skills directory to install into (default: discovered, else .agents/skills)",
+    )
+    parser.add_argument(
+        "--link",
+        choices=["auto", *LINK_METHODS],
+        default="auto",
+        help="How to place files: auto reflinks where supported, otherwise copies; "
+        "hardlink shares files with the source, so edits to either change both (default: auto)",
+    )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Replace an existing install without asking",
+    )
+    parser.add_argument(
+        "--skip-validation",
+        action="store_true",
+        help="Install without running skill-tester's validator first",
+    )
+    args = parser.parse_args()
+
+    target_dir = args.target_directory.expanduser() if args.target_directory else discover_target_dir()
+    info(f"Target directory: {target_dir}")
+
+    try:
+        install(args.source, target_dir, mode=args.link, force=args.force, validate=not args.skip_validation)
+    except InstallError as exc:
+        error(str(exc))
+        return 1
+    except OSError as exc:
+        error(f"Installation failed: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Ranked local search over the skills beneath a directory.
+
+Builds an inverted index over each skill's name, description, section
+headings and body text, and ranks matches with BM25. Name, description and
+heading terms count for more than body terms. The index is a single binary
+file that is memory-mapped for queries, so a search reads only the posting
+lists of its own terms; updates re-parse only skills whose SKILL.md changed.
+
+Usage:
+    python search_skills.py <root> <query...>
+    python search_skills.py skills pdf conversion --limit 5
+    python search_skills.py skills weather --format json --no-update
+    python search_skills.py --help
+
+File layout (little-endian):
+    header    magic "SKSI", version, document/term/posting counts, average
+              document length, section offsets, indexed root
+    docs      fixed-size structs: name, description and path offsets, weighted
+              length, SKILL.md mtime/size and a 16-byte BLAKE2b content hash
+    terms     (offset, length, first posting, document frequency), sorted by term
+    postings  u32 document ids, then u32 weighted term frequencies
+    strings   UTF-8 text referenced by the docs and terms
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+from skill_parser import discover_skills, parse_skill_text
+
+DEFAULT_INDEX = Path(".cache/skill-search.bin")
+
+MAGIC = b"SKSI"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIdQQQQQII")
+# name, description, path (offset, length each), weighted length,
+# SKILL.md mtime_ns and size, content hash
+DOC = struct.Struct("<6IIqQ16s")
+# term offset and length, first posting, document frequency
+TERM = struct.Struct("<4I")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# How many body occurrences a term in each field is worth
+FIELD_WEIGHTS = {"name": 4, "description": 2, "headings": 2, "body": 1}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or "
+    "that the this to use used uses when with you your".split()
+)
+
+
+class SearchHit(NamedTuple):
+    """One ranked result. ``path`` is relative to the indexed root."""
+
+    score: float
+    name: str
+    description: str
+    path: str
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric terms, without stopwords and single letters."""
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def _skill_terms(skill_dir: Path, data: bytes) -> tuple:
+    """(name, description, weighted term counts) for SKILL.md content."""
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    parsed = parse_skill_text(text, skill_dir / "SKILL.md")
+
+    frontmatter = parsed.frontmatter if isinstance(parsed.frontmatter, dict) else {}
+    name = str(frontmatter.get("name") or skill_dir.name)
+    description = str(frontmatter.get("description") or "")
+    body = parsed.body if parsed.body is not None else text
+
+    fields = {
+        "name": name,
+        "description": description,
+        "headings": "\n".join(HEADING_PATTERN.findall(body)),
+        "body": body,
+    }
+    counts: Counter = Counter()
+    for field, value in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(value):
+            counts[token] += weight
+    return name, " ".join(description.split()), counts
+
+
+class SearchIndex:
+    """Read-only view of a search index file, memory-mapped on open."""
+
+    def __init__(self, index_path: Path):
+        with open(index_path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                _flags,
+                self._doc_count,
+                self._term_count,
+                self._posting_count,
+                self.average_length,
+                self._docs_offset,
+                self._terms_offset,
+                self._doc_ids_offset,
+                self._freqs_offset,
+                self._strings_offset,
+                root_off,
+                root_len,
+            ) = HEADER.unpack_from(self._buf, 0)
+        except struct.error:
+            self._buf.close()
+            raise ValueError(f"Not a skill search index: {index_path}") from None
+        if magic != MAGIC or version != VERSION:
+            self._buf.close()
+            raise ValueError(f"Not a skill search index (or an unsupported version): {index_path}")
+        self.root = self._string(root_off, root_len)
+
+    def close(self):
+        self._buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buf[start : start + length].decode("utf-8")
+
+    def _doc(self, i: int) -> tuple:
+        return DOC.unpack_from(self._buf, self._docs_offset + i * DOC.size)
+
+    def _term(self, i: int) -> tuple:
+        return TERM.unpack_from(self._buf, self._terms_offset + i * TERM.size)
+
+    def _term_bytes(self, i: int) -> bytes:
+        offset, length = self._term(i)[:2]
+        start = self._strings_offset + offset
+        return self._buf[start : start + length]
+
+    def _u32s(self, section_offset: int, start: int, count: int) -> array:
+        begin = section_offset + start * 4
+        values = array("I", self._buf[begin : begin + count * 4])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def postings(self, term: str) -> tuple:
+        """(document ids, weighted term frequencies) for a term, found by binary search."""
+        key = term.encode("utf-8")
+        lo, hi = 0, self._term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._term_count or self._term_bytes(lo) != key:
+            return array("I"), array("I")
+        _, _, start, df = self._term(lo)
+        return self._u32s(self._doc_ids_offset, start, df), self._u32s(self._freqs_offset, start, df)
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """The best-scoring skills for a free-text query, highest first."""
+        scores: Dict[int, float] = {}
+        lengths: Dict[int, int] = {}
+        n = self._doc_count
+        average = self.average_length or 1.0
+        for term in dict.fromkeys(tokenize(query)):
+            doc_ids, freqs = self.postings(term)
+            if not doc_ids:
+                continue
+            idf = math.log(1 + (n - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            for doc, tf in zip(doc_ids, freqs):
+                length = lengths.get(doc)
+                if length is None:
+                    length = lengths[doc] = self._doc(doc)[6]
+                norm = K1 * (1 - B + B * length / average)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for doc, score in ranked:
+            raw = self._doc(doc)
+            hits.append(
+                SearchHit(
+                    score=round(score, 4),
+                    name=self._string(raw[0], raw[1]),
+                    description=self._string(raw[2], raw[3]),
+                    path=self._string(raw[4], raw[5]),
+                )
+            )
+        return hits
+
+    def documents(self) -> List[tuple]:
+        """Every document as (name, description, path, length, mtime_ns, size, digest)."""
+        docs = []
+        for i in range(self._doc_count):
+            raw = self._doc(i)
+            docs.append(
+                (self._string(raw[0], raw[1]), self._string(raw[2], raw[3]),
+                 self._string(raw[4], raw[5]), *raw[6:])
+            )
+        return docs
+
+    def terms(self) -> Dict[str, tuple]:
+        """Map of every term to its (document ids, frequencies) posting lists."""
+        doc_ids = self._u32s(self._doc_ids_offset, 0, self._posting_count)
+        freqs = self._u32s(self._freqs_offset, 0, self._posting_count)
+        terms = {}
+        for i in range(self._term_count):
+            offset, length, start, df = self._term(i)
+            terms[self._string(offset, length)] = (
+                doc_ids[start : start + df],
+                freqs[start : start + df],
+            )
+        return terms
+
+
+def write_search_index(index_path: Path, root: str, docs: List[tuple], terms: Dict[str, tuple]):
+    """Atomically write an index from documents of (name, description, path,
+    length, mtime_ns, size, digest) and a map of term to (doc ids, frequencies)."""
+    import tempfile
+
+    strings = bytearray()
+
+    def intern(text: str) -> tuple:
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    root_ref = intern(root)
+    packed_docs = bytearray()
+    total_length = 0
+    for name, description, path, length, mtime_ns, size, digest in docs:
+        packed_docs += DOC.pack(
+            *intern(name), *intern(description), *intern(path), length, mtime_ns, size, digest
+        )
+        total_length += length
+
+    packed_terms = bytearray()
+    doc_ids = array("I")
+    freqs = array("I")
+    for term in sorted(terms, key=lambda t: t.encode("utf-8")):
+        term_docs, term_freqs = terms[term]
+        if not term_docs:
+            continue
+        packed_terms += TERM.pack(*intern(term), len(doc_ids), len(term_docs))
+        doc_ids.extend(term_docs)
+        freqs.extend(term_freqs)
+    if sys.byteorder == "big":
+        doc_ids.byteswap()
+        freqs.byteswap()
+
+    docs_offset = HEADER.size
+    terms_offset = docs_offset + len(packed_docs)
+    doc_ids_offset = terms_offset + len(packed_terms)
+    freqs_offset = doc_ids_offset + len(doc_ids) * 4
+    strings_offset = freqs_offset + len(freqs) * 4
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        len(docs),
+        len(packed_terms) // TERM.size,
+        len(doc_ids),
+        total_length / len(docs) if docs else 0.0,
+        docs_offset,
+        terms_offset,
+        doc_ids_offset,
+        freqs_offset,
+        strings_offset,
+        *root_ref,
+    )
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(packed_docs)
+            f.write(packed_terms)
+            f.write(doc_ids.tobytes())
+            f.write(freqs.tobytes())
+            f.write(strings)
+        os.replace(tmp_name, index_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def update_search_index(root: Path, index_path: Path = DEFAULT_INDEX) -> Dict[str, int]:
+    """Bring the search index for root up to date, re-parsing only changed skills.
+
+    A skill is reused without reading SKILL.md when its size and mtime are
+    unchanged, and without parsing when its content hash is unchanged.
+    Documents keep their ids across updates (new skills are appended), so
+    the postings of unchanged skills are carried over as they are; only
+    removals renumber documents. The file is only rewritten when something
+    changed. Returns counts of added, updated, unchanged and removed skills.
+    """
+    root_key = str(root.resolve())
+    previous = None
+    try:
+        previous = SearchIndex(index_path)
+        if previous.root != root_key:
+            previous.close()
+            previous = None
+    except (OSError, ValueError):
+        previous = None
+
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    try:
+        docs = previous.documents() if previous is not None else []
+        slots = {doc[2]: i for i, doc in enumerate(docs)}
+        seen = set()
+        stale = set()
+        fresh = {}
+        dirty = previous is None
+        for skill_dir in discover_skills(root):
+            rel_path = skill_dir.relative_to(root).as_posix()
+            skill_md = skill_dir / "SKILL.md"
+            try:
+                st = skill_md.stat()
+            except OSError:
+                continue
+            slot = slots.get(rel_path)
+            old = docs[slot] if slot is not None else None
+            if slot is not None:
+                seen.add(slot)
+
+            if old is not None and (old[4], old[5]) == (st.st_mtime_ns, st.st_size):
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                data = skill_md.read_bytes()
+            except OSError:
+                seen.discard(slot)
+                continue
+            dirty = True
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if old is not None and old[6] == digest:
+                docs[slot] = (*old[:4], st.st_mtime_ns, st.st_size, digest)
+                stats["unchanged"] += 1
+                continue
+
+            name, description, counts = _skill_terms(skill_dir, data)
+            doc = (name, description, rel_path, sum(counts.values()), st.st_mtime_ns, st.st_size, digest)
+            if slot is None:
+                slot = len(docs)
+                docs.append(doc)
+                seen.add(slot)
+                stats["added"] += 1
+            else:
+                docs[slot] = doc
+                stale.add(slot)
+                stats["updated"] += 1
+            fresh[slot] = counts
+
+        removed = {i for i in range(len(slots)) if i not in seen}
+        stats["removed"] = len(removed)
+        if not dirty and not removed:
+            return stats
+        old_terms = previous.terms() if previous is not None else {}
+    finally:
+        if previous is not None:
+            previous.close()
+
+    # Renumber documents only when some were removed
+    remap = None
+    if removed:
+        remap = [-1] * len(docs)
+        kept = [i for i in range(len(docs)) if i not in removed]
+        for new_id, old_id in enumerate(kept):
+            remap[old_id] = new_id
+        docs = [docs[i] for i in kept]
+    dropped = stale | removed
+
+    # Carry over postings of unchanged skills, then add the re-parsed ones
+    terms: Dict[str, tuple] = {}
+    for term, (doc_ids, freqs) in old_terms.items():
+        if remap is None and dropped.isdisjoint(doc_ids):
+            terms[term] = (doc_ids, freqs)
+            continue
+        kept_docs, kept_freqs = array("I"), array("I")
+        for doc, tf in zip(doc_ids, freqs):
+            if doc not in dropped:
+                kept_docs.append(doc if remap is None else remap[doc])
+                kept_freqs.append(tf)
+        terms[term] = (kept_docs, kept_freqs)
+    for doc, counts in fresh.items():
+        doc = doc if remap is None else remap[doc]
+        for term, tf in counts.items():
+            entry = terms.get(term)
+            if entry is None:
+                entry = terms[term] = (array("I"), array("I"))
+            entry[0].append(doc)
+            entry[1].append(tf)
+
+    write_search_index(index_path, root_key, docs, terms)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search the skills beneath a directory"
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        help="Directory to search for skills",
+    )
+    parser.add_argument(
+        "query",
+        nargs="+",
+        help="Search terms",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=DEFAULT_INDEX,
+        help=f"Search index file to update and read (default: {DEFAULT_INDEX})",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Maximum number of results (default: 10)",
+    )
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Query the existing index without checking the skills for changes",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    if not args.no_update:
+        update_search_index(args.root, args.index)
+    try:
+        with SearchIndex(args.index) as index:
+            hits = index.search(" ".join(args.query), limit=args.limit)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot read search index: {e}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(json.dumps([hit._asdict() for hit in hits], indent=2))
+        return 0 if hits else 1
+
+    if not hits:
+        print(f"No skills match '{' '.join(args.query)}'")
+        return 1
+    for hit in hits:
+        print(f"{hit.name:<30} {hit.path}  ({hit.score:.2f})")
+        if hit.description:
+            print(f"    {hit.description}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,305 @@
+"""
+Shared SKILL.md parsing for the skill tooling scripts.
+
+Reads a SKILL.md once and splits it into YAML frontmatter and body, so the
+validator, YAML checker, evaluator and search index consume one parsed object
+instead of each re-reading and re-parsing the file. Skill discovery lives
+here too, so every tool walks a tree the same way. Identical copies ship
+with skill-creator, skill-tester, skill-evaluator and skill-browser so each
+skill stays self-contained.
+
+Usage:
+    from skill_parser import parse_skill_md
+
+    parsed = parse_skill_md(Path("my-skill/SKILL.md"))
+    parsed.frontmatter, parsed.body, parsed.line_col(offset)
+"""
+
+import bisect
+import functools
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    import yaml
+
+# Directories never worth descending into when discovering skills
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv"}
+
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+# Input where libyaml and the pure-Python loader are known to disagree:
+# characters the Python reader rejects, tabs, BOMs and Unicode line breaks
+# (which libyaml treats differently), non-specific "!" tags and block scalar
+# headers directly followed by a comment
+_LIBYAML_DIVERGENT = re.compile(
+    r"[\t\ufeff\x85\u2028\u2029]|(?:^|[\s\[{,])!|[|>][-+0-9]*#"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_yaml_module():
+    """Import PyYAML on first use; it dominates start-up time otherwise."""
+    import yaml
+
+    return yaml
+
+
+@functools.lru_cache(maxsize=None)
+def fast_safe_loader():
+    """The libyaml-backed safe loader, or None if PyYAML was built without it."""
+    try:
+        from yaml import CSafeLoader
+    except ImportError:
+        return None
+    return CSafeLoader
+
+
+def _libyaml_agrees(text: str) -> bool:
+    """True if libyaml is known to load text exactly like the pure-Python loader."""
+    non_printable = load_yaml_module().reader.Reader.NON_PRINTABLE
+    if _LIBYAML_DIVERGENT.search(text) or non_printable.search(text):
+        return False
+    # "?" inside flow collections is also scanned differently
+    return "?" not in text or not ("[" in text or "{" in text)
+
+
+class ParsedSkill:
+    """A SKILL.md split into frontmatter and body.
+
+    ``frontmatter_text`` is None when the file has no frontmatter block;
+    ``yaml_error`` is set when the block exists but is not valid YAML.
+    ``body_offset`` is the offset of the body within ``content``.
+    """
+
+    __slots__ = (
+        "path",
+        "content",
+        "frontmatter_text",
+        "frontmatter",
+        "yaml_error",
+        "body",
+        "body_offset",
+        "_line_starts",
+    )
+
+    def __init__(self, path: Path | None, content: str):
+        self.path = path
+        self.content = content
+        self.frontmatter_text: str | None = None
+        self.frontmatter = None
+        self.yaml_error: "yaml.YAMLError | None" = None
+        self.body: str | None = None
+        self.body_offset = 0
+        self._line_starts: List[int] | None = None
+
+    @property
+    def line_index(self) -> List[int]:
+        """Offsets of the start of each line in ``content`` (built on first use)."""
+        if self._line_starts is None:
+            starts = [0]
+            find = self.content.find
+            pos = find("\n")
+            while pos != -1:
+                starts.append(pos + 1)
+                pos = find("\n", pos + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) of an offset into ``content``."""
+        starts = self.line_index
+        line = bisect.bisect_right(starts, offset)
+        return line, offset - starts[line - 1] + 1
+
+    def body_line_col(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) in the file of an offset into ``body``."""
+        return self.line_col(self.body_offset + offset)
+
+
+def load_frontmatter(text: str, fast: bool = True):
+    """Parse frontmatter YAML. Raises yaml.YAMLError on invalid input.
+
+    Uses the libyaml-backed safe loader when available. Anything libyaml fails
+    on, and any text the pure-Python reader would reject, goes through
+    yaml.SafeLoader instead, so results and error messages match
+    yaml.safe_load exactly.
+    """
+    yaml = load_yaml_module()
+    loader = fast_safe_loader() if fast else None
+    if loader is not None and _libyaml_agrees(text):
+        try:
+            return yaml.load(text, Loader=loader)
+        except yaml.YAMLError:
+            pass
+    return yaml.load(text, Loader=yaml.SafeLoader)
+
+
+def parse_skill_text(content: str, path: Path | None = None) -> ParsedSkill:
+    """Split SKILL.md content into frontmatter and body and parse the YAML."""
+    parsed = ParsedSkill(path, content)
+
+    match = FRONTMATTER_PATTERN.match(content)
+    if not match:
+        return parsed
+
+    parsed.frontmatter_text = match.group(1)
+    parsed.body = match.group(2)
+    parsed.body_offset = match.start(2)
+
+    try:
+        parsed.frontmatter = load_frontmatter(parsed.frontmatter_text)
+    except load_yaml_module().YAMLError as e:
+        parsed.yaml_error = e
+
+    return parsed
+
+
+def parse_skill_md(skill_md: Path) -> ParsedSkill:
+    """Read and parse a SKILL.md. Raises OSError/UnicodeDecodeError if unreadable."""
+    return parse_skill_text(skill_md.read_text(encoding="utf-8"), skill_md)
+
+
+def discover_skills(root: Path) -> List[Path]:
+    """Find every directory beneath root that contains a SKILL.md, in path order."""
+    skill_dirs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        if "SKILL.md" in filenames:
+            skill_dirs.append(Path(dirpath))
+    return skill_dirs
+
+
+def _is_delimiter(line: str) -> bool:
+    """True for a newline-terminated `---` line (trailing whitespace allowed)."""
+    return line.startswith("---") and line.endswith("\n") and not line[3:].strip()
+
+
+def read_frontmatter(skill_md: Path) -> str | None:
+    r"""Read only the YAML frontmatter block of a SKILL.md.
+
+    Streams lines and stops at the closing ``---``, so the cost is proportional
+    to the frontmatter rather than the whole file. Returns the same text as
+    ``^---\s*\n(.*?)\n---\s*\n`` would capture, or None if there is no
+    frontmatter.
+    """
+    with skill_md.open(encoding="utf-8") as f:
+        if not _is_delimiter(f.readline()):
+            return None
+
+        # Blank lines after the opening delimiter belong to the delimiter
+        last_blank = None
+        lines = []
+        for line in f:
+            if not lines:
+                if line.endswith("\n") and not line.strip():
+                    last_blank = line
+                else:
+                    lines.append(line)
+            elif _is_delimiter(line):
+                return "".join(lines)[:-1]
+            else:
+                lines.append(line)
+
+    # Degenerate case: only blank lines between the delimiters
+    if last_blank is not None and lines and _is_delimiter(lines[0]):
+        return last_blank[:-1]
+    return None
+
+
+# Characters split at a time by count_words, bounding its temporary word list
+WORD_COUNT_WINDOW = 1 << 16
+
+_SECTION_PATTERN = re.compile(r"^##\s+(.+)$", re.MULTILINE)
+_WHEN_SECTION_PATTERN = re.compile(r"##\s+when to use", re.IGNORECASE)
+
+
+def count_words(text: str) -> int:
+    """``len(text.split())``, splitting one fixed-size window at a time.
+
+    Temporaries are bounded by WORD_COUNT_WINDOW rather than the text size
+    (a body shorter than one window is split whole, without slicing). A
+    word straddling two windows is counted in both, so it is subtracted once.
+    """
+    if len(text) <= WORD_COUNT_WINDOW:
+        return len(text.split())
+
+    count = 0
+    for start in range(0, len(text), WORD_COUNT_WINDOW):
+        window = text[start : start + WORD_COUNT_WINDOW]
+        count += len(window.split())
+        if start and not window[0].isspace() and not text[start - 1].isspace():
+            count -= 1
+    return count
+
+
+def body_metrics(body: str) -> dict:
+    """Objective content metrics for a SKILL.md body.
+
+    Makes no lowercased copy of the body: words are counted by
+    ``count_words`` (which splits at most one window at a time), and
+    sections and example headings are found by jumping between candidate
+    positions with ``str.find``, so Python only runs at headings. Results
+    are identical to splitting the body, lowercasing it and running the
+    section and "when to use" patterns over all of it.
+    """
+    find = body.find
+
+    # Same matches as findall: "##" at line starts not consumed by the previous
+    # match. Candidates are the positions just after "\n##" newlines (or -1).
+    sections = []
+    section_end = 0
+    pos = 0 if body.startswith("##") else find("\n##") + 1 or -1
+    while pos != -1:
+        if pos >= section_end:
+            match = _SECTION_PATTERN.match(body, pos)
+            if match:
+                sections.append(match.group(1))
+                section_end = match.end()
+        pos = find("\n##", pos) + 1 or -1
+
+    example_count = 0
+    pos = find("### ")
+    while pos != -1:
+        if body[pos + 4 : pos + 11].lower() == "example":
+            example_count += 1
+        pos = find("### ", pos + 4)
+
+    return {
+        "word_count": count_words(body),
+        "line_count": body.count("\n") + 1,
+        "example_count": example_count,
+        "has_when_section": _WHEN_SECTION_PATTERN.search(body) is not None,
+        "sections": sections,
+    }
+
+
+def frontmatter_text(frontmatter: dict, field: str, default: str = "") -> str:
+    """A frontmatter field as text, or default when it is missing or null.
+
+    YAML loads unquoted values such as ``2024-01-01`` or ``[a, b]`` as dates
+    and lists; they are converted with str() so records built from them stay
+    JSON-serializable.
+    """
+    value = frontmatter.get(field)
+    if value is None:
+        return default
+    return value if isinstance(value, str) else str(value)
+
+
+def skill_metadata(frontmatter, body: str, unnamed: str = "unknown") -> dict:
+    """Name, description and license as text, plus the metrics of the body.
+
+    Frontmatter that is not a mapping counts as empty, so a skill with bad
+    frontmatter is still described by its body.
+    """
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    return {
+        "name": frontmatter_text(frontmatter, "name", unnamed),
+        "description": frontmatter_text(frontmatter, "description"),
+        "license": frontmatter_text(frontmatter, "license"),
+        **body_metrics(body),
+    }
@@ -5,86 +5,309 @@ Semi-automated skill evaluation assistance.
 Extracts objective metrics and generates evaluation report template.
 Final scoring requires human/agent judgment.
 
+Batch mode evaluates every skill beneath a directory in parallel and writes
+one metrics table (CSV, or Parquet/Arrow when pyarrow is installed) instead
+of a report per skill.
+
 Usage:
     python run_evaluation.py <skill-directory>
+    python run_evaluation.py --batch <skills-root> -o metrics.csv
+    python run_evaluation.py --batch <skills-root> -o metrics.parquet
     python run_evaluation.py --help
 """
 
 import argparse
-import re
+import csv
+import functools
+import hashlib
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, NamedTuple
 
-import yaml
+from skill_parser import SKIP_DIRS, ParsedSkill, discover_skills, parse_skill_md, skill_metadata
 
 
-def extract_skill_metadata(skill_path: Path) -> dict:
-    """Extract metadata from SKILL.md."""
-    skill_md = skill_path / "SKILL.md"
+def extract_skill_metadata(skill_path: Path, parsed: ParsedSkill | None = None) -> dict:
+    """Extract metadata from SKILL.md.
 
-    if not skill_md.exists():
-        return {"error": "SKILL.md not found"}
+    Pass an already-parsed SKILL.md to avoid reading and parsing it again.
+    """
+    if parsed is None:
+        skill_md = skill_path / "SKILL.md"
 
-    content = skill_md.read_text(encoding="utf-8")
+        if not skill_md.exists():
+            return {"error": "SKILL.md not found"}
 
-    # Extract YAML frontmatter
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+        try:
+            parsed = parse_skill_md(skill_md)
+        except (OSError, UnicodeDecodeError) as e:
+            return {"error": f"Failed to read SKILL.md: {e}"}
 
-    if not match:
+    if parsed.frontmatter_text is None:
         return {"error": "No YAML frontmatter found"}
 
-    frontmatter_text = match.group(1)
-    body = match.group(2)
-
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-    except yaml.YAMLError:
+    if parsed.yaml_error is not None:
         return {"error": "Invalid YAML frontmatter"}
 
-    # Calculate metrics
-    word_count = len(body.split())
-    line_count = len(body.split("\n"))
+    frontmatter = parsed.frontmatter
+    if not isinstance(frontmatter, dict):
+        return {"error": "YAML frontmatter is not a mapping"}
+
+    return {**skill_metadata(frontmatter, parsed.body), "frontmatter": frontmatter}
+
+
+# Subdirectories of a skill that hold bundled resources
+RESOURCE_TYPES = ("scripts", "templates", "assets", "references")
+
+# Files at least this large are hashed on a thread pool (hashlib releases the
+# GIL while hashing); smaller ones are hashed inline, where a hand-off to a
+# thread would cost more than the hash
+HASH_POOL_MIN_SIZE = 1 << 20
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class ResourceFile(NamedTuple):
+    """A bundled resource file. ``path`` is relative to the skill directory."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str | None = None
+
+
+def hash_file(path: str) -> str:
+    """BLAKE2b-128 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while read := handle.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def scan_files(directory: str, prefix: str = "", skip_dirs=SKIP_DIRS) -> List[ResourceFile]:
+    """Every file beneath directory in path order, with one scandir per directory.
+
+    Entry types come from the directory listing, so the only stat per file
+    is the one that reads its size and mtime. Paths are relative to
+    directory, after prefix. Symlinked directories and those named in
+    skip_dirs (caches by default) are not followed; a missing directory is
+    simply empty.
+    """
+    files = []
+    pending = [(directory, prefix)]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            pending.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files.append(ResourceFile(prefix + entry.name, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            continue
+    files.sort()
+    return files
+
+
+def inventory_resources(skill_path: Path, hashes: bool = False) -> Dict[str, List[ResourceFile]]:
+    """Recursive inventory of a skill's bundled resources, by resource type.
+
+    Each file carries its path, size and mtime; with hashes=True also its
+    BLAKE2b digest, large files being hashed concurrently on a thread pool.
+    """
+    inventory = {
+        resource_type: scan_files(os.path.join(skill_path, resource_type), f"{resource_type}/")
+        for resource_type in RESOURCE_TYPES
+    }
+    if hashes:
+        digests = digest_files(skill_path, [item for items in inventory.values() for item in items])
+        inventory = {
+            resource_type: [item._replace(digest=digests[item.path]) for item in items]
+            for resource_type, items in inventory.items()
+        }
+    return inventory
+
+
+def digest_files(base: Path, files: List[ResourceFile]) -> Dict[str, str]:
+    """Digest of each file (path relative to base), keyed by path.
 
-    # Count examples
-    example_count = body.lower().count("### example")
+    Files of HASH_POOL_MIN_SIZE or more are hashed on a thread pool.
+    """
+    large = [item.path for item in files if item.size >= HASH_POOL_MIN_SIZE]
 
-    # Check for "when to use" section
-    has_when_section = bool(re.search(r"##\s+when to use", body, re.IGNORECASE))
+    digests = {}
+    if len(large) > 1:
+        from concurrent.futures import ThreadPoolExecutor
 
-    # Extract sections
-    sections = re.findall(r"^##\s+(.+)$", body, re.MULTILINE)
+        with ThreadPoolExecutor(max_workers=min(len(large), os.cpu_count() or 1)) as pool:
+            paths = [os.path.join(base, path) for path in large]
+            digests.update(zip(large, pool.map(hash_file, paths)))
 
+    for item in files:
+        if item.path not in digests:
+            digests[item.path] = hash_file(os.path.join(base, item.path))
+    return digests
+
+
+def check_bundled_resources(skill_path: Path, inventory: Dict[str, List[ResourceFile]] | None = None) -> dict:
+    """Bundled resource files by type, as paths relative to the type's directory.
+
+    Pass an existing inventory to avoid scanning the skill again.
+    """
+    if inventory is None:
+        inventory = inventory_resources(skill_path)
     return {
-        "name": frontmatter.get("name", "unknown"),
-        "description": frontmatter.get("description", ""),
-        "license": frontmatter.get("license", ""),
-        "word_count": word_count,
-        "line_count": line_count,
-        "example_count": example_count,
-        "has_when_section": has_when_section,
-        "sections": sections,
-        "frontmatter": frontmatter,
+        resource_type: [item.path.split("/", 1)[1] for item in items]
+        for resource_type, items in inventory.items()
     }
 
 
-def check_bundled_resources(skill_path: Path) -> dict:
-    """Check for bundled resources in skill directory."""
-    resources = {
-        "scripts": [],
-        "templates": [],
-        "assets": [],
-        "references": [],
-    }
+# Columns of the batch metrics table, in output order
+METRIC_COLUMNS = (
+    "path",
+    "name",
+    "description_length",
+    "word_count",
+    "line_count",
+    "example_count",
+    "has_when_section",
+    "section_count",
+    "sections",
+    "scripts",
+    "templates",
+    "assets",
+    "references",
+    "resource_bytes",
+    "error",
+)
+
+# Table formats by output suffix; anything else is written as CSV
+TABLE_FORMATS = {".csv": "csv", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+
+
+def skill_metrics_row(skill_path: Path, root: Path) -> dict:
+    """One row of the batch metrics table. Also the process pool worker.
+
+    Skills whose SKILL.md can't be evaluated get a row with only their path
+    and the error, so they still show up when the table is sorted.
+    """
+    row = dict.fromkeys(METRIC_COLUMNS)
+    row["path"] = skill_path.relative_to(root).as_posix() if skill_path != root else "."
+
+    metadata = extract_skill_metadata(skill_path)
+    if "error" in metadata:
+        row["error"] = metadata["error"]
+        return row
+
+    row["name"] = metadata["name"]
+    row["description_length"] = len(metadata["description"])
+    for key in ("word_count", "line_count", "example_count", "has_when_section", "sections"):
+        row[key] = metadata[key]
+    row["section_count"] = len(metadata["sections"])
+    inventory = inventory_resources(skill_path)
+    for resource_type, items in inventory.items():
+        row[resource_type] = len(items)
+    row["resource_bytes"] = sum(item.size for items in inventory.values() for item in items)
+    return row
+
+
+def evaluate_tree(root: Path, jobs: int = 1) -> Dict[str, list]:
+    """Metrics for every skill beneath root, as columns in path order."""
+    skill_dirs = discover_skills(root)
+    worker = functools.partial(skill_metrics_row, root=root)
+    if jobs <= 1 or len(skill_dirs) < 2:
+        rows = list(map(worker, skill_dirs))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        jobs = min(jobs, len(skill_dirs))
+        chunksize = max(1, len(skill_dirs) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(worker, skill_dirs, chunksize=chunksize))
+
+    return {column: [row[column] for row in rows] for column in METRIC_COLUMNS}
+
+
+def write_csv(columns: Dict[str, list], stream):
+    """Write the metrics table as CSV; sections are joined with "; "."""
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(columns)
+    for values in zip(*columns.values()):
+        writer.writerow(
+            "; ".join(value) if isinstance(value, list) else "" if value is None else value
+            for value in values
+        )
 
-    for resource_type in resources.keys():
-        resource_dir = skill_path / resource_type
-        if resource_dir.exists() and resource_dir.is_dir():
-            resources[resource_type] = [
-                f.name for f in resource_dir.iterdir() if f.is_file()
-            ]
 
-    return resources
+def write_arrow_table(columns: Dict[str, list], output: Path, table_format: str):
+    """Write the metrics table as Parquet or an Arrow IPC file.
+
+    Raises ImportError when pyarrow isn't installed.
+    """
+    import pyarrow
+
+    # Explicit types keep the schema stable when a column is all nulls
+    types = {"path": pyarrow.string(), "name": pyarrow.string(), "error": pyarrow.string()}
+    types["has_when_section"] = pyarrow.bool_()
+    types["sections"] = pyarrow.list_(pyarrow.string())
+    schema = pyarrow.schema((column, types.get(column, pyarrow.int64())) for column in columns)
+    table = pyarrow.table(columns, schema=schema)
+    if table_format == "parquet":
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, output)
+    else:
+        import pyarrow.feather
+
+        pyarrow.feather.write_feather(table, output)
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may use."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def run_batch(root: Path, output: Path | None, table_format: str | None, jobs: int) -> int:
+    """Evaluate every skill beneath root and write the metrics table."""
+    if table_format is None:
+        table_format = TABLE_FORMATS.get(output.suffix.lower(), "csv") if output else "csv"
+    if table_format != "csv" and output is None:
+        print(f"Error: --format {table_format} needs an output file (-o)", file=sys.stderr)
+        return 1
+
+    columns = evaluate_tree(root, jobs=jobs)
+    count = len(columns["path"])
+    if not count:
+        print(f"Error: no skills found under {root}", file=sys.stderr)
+        return 1
+
+    if output is None:
+        write_csv(columns, sys.stdout)
+        return 0
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if table_format == "csv":
+        with output.open("w", encoding="utf-8", newline="") as stream:
+            write_csv(columns, stream)
+    else:
+        try:
+            write_arrow_table(columns, output, table_format)
+        except ImportError:
+            print(f"Error: {table_format} output requires pyarrow (pip install pyarrow)", file=sys.stderr)
+            return 1
+
+    print(f"Metrics for {count} skill(s) written to: {output}")
+    return 0
 
 
 def generate_evaluation_template(skill_path: Path, metadata: dict, resources: dict) -> str:
@@ -257,15 +480,34 @@ def main():
     parser.add_argument(
         "skill_directory",
         type=Path,
-        help="Path to skill directory to evaluate",
+        help="Path to skill directory to evaluate (with --batch, a directory of skills)",
     )
     parser.add_argument(
         "-o", "--output",
         type=Path,
         help="Output file path (default: stdout)",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Evaluate every skill beneath the directory and write one metrics table",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet", "arrow"],
+        help="Metrics table format for --batch (default: from the output suffix, else csv)",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Worker processes for --batch (default: available CPUs)",
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        return run_batch(args.skill_directory, args.output, args.format, args.jobs)
+
     # Extract metadata and resources
     metadata = extract_skill_metadata(args.skill_directory)
 
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Compact on-disk index of the skills beneath a directory.
+
+Records each skill's name, description, path, content hash, word count and
+section headings in a single binary file. The file is memory-mapped when
+loaded, looks skills up by name in O(1) through an embedded hash table, and
+is updated incrementally: only skills whose SKILL.md changed are re-parsed.
+
+Usage:
+    python skill_index.py <root>
+    python skill_index.py <root> --name skill-tester
+    python skill_index.py <root> --index .cache/skill-index.bin --format json
+    python skill_index.py --help
+
+File layout (little-endian):
+    header   magic "SKIX", version, record count, hash table size,
+             record and string offsets, indexed root
+    table    u32 slots, each 0 (empty) or 1 + the first record for a name
+    records  fixed-size structs of string offsets/lengths, word count,
+             SKILL.md size/mtime and a 16-byte BLAKE2b content hash
+    strings  UTF-8 text referenced by the records
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple
+
+from skill_parser import discover_skills, parse_skill_text, skill_metadata
+
+DEFAULT_INDEX = Path(".cache/skill-index.bin")
+
+MAGIC = b"SKIX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQII")
+SLOT = struct.Struct("<I")
+# name, description, path, sections (offset, length each), word count,
+# SKILL.md mtime_ns and size, content hash
+RECORD = struct.Struct("<8IIqQ16s")
+
+
+class IndexEntry(NamedTuple):
+    """One indexed skill. ``path`` is relative to the indexed root."""
+
+    name: str
+    description: str
+    path: str
+    content_hash: str
+    word_count: int
+    sections: List[str]
+
+
+def _name_hash(name: bytes) -> int:
+    # Stable across processes, unlike hash()
+    return int.from_bytes(hashlib.blake2b(name, digest_size=8).digest(), "little")
+
+
+class SkillIndex:
+    """Read-only view of an index file, memory-mapped on open."""
+
+    def __init__(self, index_path: Path):
+        with open(index_path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                _flags,
+                self._count,
+                self._table_size,
+                self._records_offset,
+                self._strings_offset,
+                root_off,
+                root_len,
+            ) = HEADER.unpack_from(self._buf, 0)
+        except struct.error:
+            self._buf.close()
+            raise ValueError(f"Not a skill index: {index_path}") from None
+        if magic != MAGIC or version != VERSION:
+            self._buf.close()
+            raise ValueError(f"Not a skill index (or an unsupported version): {index_path}")
+        self.root = self._string(root_off, root_len)
+
+    def close(self):
+        self._buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._buf[start : start + length].decode("utf-8")
+
+    def _raw(self, i: int) -> tuple:
+        return RECORD.unpack_from(self._buf, self._records_offset + i * RECORD.size)
+
+    def _name_bytes(self, i: int) -> bytes:
+        name_off, name_len = self._raw(i)[:2]
+        start = self._strings_offset + name_off
+        return self._buf[start : start + name_len]
+
+    def entry(self, i: int) -> IndexEntry:
+        """Decode record i."""
+        (
+            name_off, name_len, desc_off, desc_len, path_off, path_len,
+            sections_off, sections_len, word_count, _mtime_ns, _size, digest,
+        ) = self._raw(i)
+        sections = self._string(sections_off, sections_len)
+        return IndexEntry(
+            name=self._string(name_off, name_len),
+            description=self._string(desc_off, desc_len),
+            path=self._string(path_off, path_len),
+            content_hash=digest.hex(),
+            word_count=word_count,
+            sections=sections.split("\n") if sections else [],
+        )
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        return (self.entry(i) for i in range(self._count))
+
+    def lookup(self, name: str) -> List[IndexEntry]:
+        """Every skill with this name (usually one), found through the hash table."""
+        if not self._table_size:
+            return []
+        key = name.encode("utf-8")
+        mask = self._table_size - 1
+        slot = _name_hash(key) & mask
+        table_offset = HEADER.size
+        while True:
+            (value,) = SLOT.unpack_from(self._buf, table_offset + slot * SLOT.size)
+            if value == 0:
+                return []
+            first = value - 1
+            if self._name_bytes(first) == key:
+                break
+            slot = (slot + 1) & mask
+
+        # Records are sorted by name, so duplicates follow the first
+        matches = []
+        i = first
+        while i < self._count and self._name_bytes(i) == key:
+            matches.append(self.entry(i))
+            i += 1
+        return matches
+
+    def signatures(self) -> Dict[str, tuple]:
+        """Map of path to (mtime_ns, size, digest, record index) for incremental rebuilds."""
+        signatures = {}
+        for i in range(self._count):
+            raw = self._raw(i)
+            path = self._string(raw[4], raw[5])
+            signatures[path] = (raw[9], raw[10], raw[11], i)
+        return signatures
+
+
+def write_index(index_path: Path, root: str, records: List[tuple]):
+    """Atomically write records of (name, description, path, sections, word
+    count, mtime_ns, size, digest) as an index file."""
+    import tempfile
+
+    records = sorted(records, key=lambda r: (r[0], r[2]))
+    table_size = 8
+    while table_size < 2 * len(records):
+        table_size *= 2
+    records_offset = HEADER.size + table_size * SLOT.size
+    strings_offset = records_offset + len(records) * RECORD.size
+
+    strings = bytearray()
+
+    def intern(text: str) -> tuple:
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    root_ref = intern(root)
+    table = [0] * table_size
+    packed = bytearray()
+    previous_name = None
+    for i, (name, description, path, sections, word_count, mtime_ns, size, digest) in enumerate(
+        records
+    ):
+        name_ref = intern(name)
+        if name != previous_name:
+            slot = _name_hash(name.encode("utf-8")) & (table_size - 1)
+            while table[slot]:
+                slot = (slot + 1) & (table_size - 1)
+            table[slot] = i + 1
+            previous_name = name
+        packed += RECORD.pack(
+            *name_ref,
+            *intern(description),
+            *intern(path),
+            *intern("\n".join(sections)),
+            word_count,
+            mtime_ns,
+            size,
+            digest,
+        )
+
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, len(records), table_size, records_offset, strings_offset, *root_ref
+    )
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(struct.pack(f"<{table_size}I", *table))
+            f.write(packed)
+            f.write(strings)
+        os.replace(tmp_name, index_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _skill_record(skill_dir: Path, rel_path: str, data: bytes, st, digest: bytes) -> tuple:
+    """Index record for a skill whose SKILL.md content is data."""
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+    parsed = parse_skill_text(text, skill_dir / "SKILL.md")
+
+    # The evaluator's metadata; bad frontmatter still indexes the skill, by its body
+    metadata = skill_metadata(parsed.frontmatter, parsed.body or "", unnamed="")
+    return (
+        metadata["name"],
+        metadata["description"],
+        rel_path,
+        metadata["sections"],
+        metadata["word_count"],
+        st.st_mtime_ns,
+        st.st_size,
+        digest,
+    )
+
+
+def update_index(root: Path, index_path: Path = DEFAULT_INDEX) -> Dict[str, int]:
+    """Bring the index for root up to date, re-parsing only changed skills.
+
+    A skill is reused without reading SKILL.md when its size and mtime are
+    unchanged, and without parsing when its content hash is unchanged.
+    Returns counts of added, updated, unchanged and removed skills.
+    """
+    root_key = str(root.resolve())
+    previous = None
+    try:
+        previous = SkillIndex(index_path)
+        if previous.root != root_key:
+            previous.close()
+            previous = None
+    except (OSError, ValueError):
+        previous = None
+
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    records = []
+    try:
+        signatures = previous.signatures() if previous is not None else {}
+        for skill_dir in discover_skills(root):
+            rel_path = skill_dir.relative_to(root).as_posix()
+            skill_md = skill_dir / "SKILL.md"
+            try:
+                st = skill_md.stat()
+            except OSError:
+                continue
+            old = signatures.pop(rel_path, None)
+
+            if old is not None and (old[0], old[1]) == (st.st_mtime_ns, st.st_size):
+                entry = previous.entry(old[3])
+                records.append(
+                    (entry.name, entry.description, rel_path, entry.sections,
+                     entry.word_count, st.st_mtime_ns, st.st_size, old[2])
+                )
+                stats["unchanged"] += 1
+                continue
+
+            try:
+                data = skill_md.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if old is not None and old[2] == digest:
+                entry = previous.entry(old[3])
+                records.append(
+                    (entry.name, entry.description, rel_path, entry.sections,
+                     entry.word_count, st.st_mtime_ns, st.st_size, digest)
+                )
+                stats["unchanged"] += 1
+                continue
+
+            records.append(_skill_record(skill_dir, rel_path, data, st, digest))
+            stats["updated" if old is not None else "added"] += 1
+        stats["removed"] = len(signatures)
+    finally:
+        if previous is not None:
+            previous.close()
+
+    write_index(index_path, root_key, records)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build or query the compact skill index"
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        help="Directory to search for skills",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=DEFAULT_INDEX,
+        help=f"Index file to update and read (default: {DEFAULT_INDEX})",
+    )
+    parser.add_argument(
+        "--name",
+        help="Only show the skill(s) with this name",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    update_index(args.root, args.index)
+    with SkillIndex(args.index) as index:
+        entries = index.lookup(args.name) if args.name is not None else list(index)
+
+    if args.format == "json":
+        print(json.dumps([entry._asdict() for entry in entries], indent=2))
+        return 0 if entries or args.name is None else 1
+
+    if args.name is not None and not entries:
+        print(f"No skill named '{args.name}'")
+        return 1
+    for entry in entries:
+        print(f"{entry.name or '(unnamed)':<30} {entry.path}")
+        if entry.description:
+            print(f"    {entry.description}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
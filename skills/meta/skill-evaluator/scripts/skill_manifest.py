@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Per-skill integrity manifests for detecting drift in installed skills.
+
+A manifest records the path, size, mtime and BLAKE2b hash of every file in a
+skill directory. Verifying compares stat signatures first and hashes only
+files whose mtime changed (a size change is a modification outright), so
+checking an unchanged install costs one directory listing and one stat per
+file. Files modified in the same clock tick as the manifest was written are
+always hashed, as their mtime can't be trusted.
+
+Every regular file is recorded, including those in dependency and cache
+directories such as node_modules/ or .venv/; only .git/ is left out.
+Symlinked directories are not followed, as their content lives outside the
+skill; symlinked files are recorded by the content they point to.
+
+Usage:
+    python skill_manifest.py write <skill-or-root>...
+    python skill_manifest.py verify <skill-or-root>...
+    python skill_manifest.py verify .agents/skills --format json
+    python skill_manifest.py --help
+
+Manifest format (.skill-manifest.json in the skill directory):
+    {"version": 1, "algorithm": "blake2b-128", "files": [
+    ["<path>", <size>, <mtime_ns>, "<hex digest>"],
+    ...
+    ]}
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from run_evaluation import ResourceFile, digest_files, scan_files
+from skill_parser import discover_skills
+
+MANIFEST_NAME = ".skill-manifest.json"
+# Directories left out of a manifest; everything else in the skill is recorded
+MANIFEST_SKIP_DIRS = {".git"}
+VERSION = 1
+ALGORITHM = "blake2b-128"
+
+
+class Drift(NamedTuple):
+    """Differences between a skill directory and its manifest."""
+
+    added: List[str]
+    removed: List[str]
+    modified: List[str]
+    rehashed: int
+
+    @property
+    def clean(self) -> bool:
+        return not (self.added or self.removed or self.modified)
+
+
+def skill_files(skill_dir: Path) -> List[ResourceFile]:
+    """Every file in a skill directory except its manifest and .git/, in path order."""
+    files = scan_files(str(skill_dir), skip_dirs=MANIFEST_SKIP_DIRS)
+    return [item for item in files if item.path != MANIFEST_NAME]
+
+
+def build_manifest(skill_dir: Path) -> List[ResourceFile]:
+    """Every file in a skill directory with its digest filled in."""
+    files = skill_files(skill_dir)
+    digests = digest_files(skill_dir, files)
+    return [item._replace(digest=digests[item.path]) for item in files]
+
+
+def write_manifest(skill_dir: Path) -> Path:
+    """Write the skill's manifest atomically and return its path."""
+    files = build_manifest(skill_dir)
+    rows = ",\n".join(json.dumps(list(item), ensure_ascii=False) for item in files)
+    header = json.dumps({"version": VERSION, "algorithm": ALGORITHM})[:-1]
+    text = f'{header}, "files": [\n{rows}\n]}}\n' if files else f'{header}, "files": []}}\n'
+
+    manifest = Path(skill_dir) / MANIFEST_NAME
+    partial = manifest.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    partial.write_text(text, encoding="utf-8")
+    os.replace(partial, manifest)
+    return manifest
+
+
+def read_manifest(skill_dir: Path) -> Tuple[Dict[str, ResourceFile], int]:
+    """Recorded files by path, and the manifest's own mtime.
+
+    Raises FileNotFoundError if there is no manifest and ValueError if it
+    can't be read.
+    """
+    manifest = Path(skill_dir) / MANIFEST_NAME
+    with manifest.open(encoding="utf-8") as handle:
+        mtime_ns = os.fstat(handle.fileno()).st_mtime_ns
+        try:
+            data = json.load(handle)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid manifest: {exc}") from exc
+
+    if not isinstance(data, dict) or data.get("version") != VERSION or data.get("algorithm") != ALGORITHM:
+        raise ValueError(f"Unsupported manifest (expected version {VERSION}, {ALGORITHM})")
+    try:
+        files = {row[0]: ResourceFile(*row) for row in data["files"]}
+    except (KeyError, TypeError) as exc:
+        raise ValueError("Invalid manifest: malformed file list") from exc
+    return files, mtime_ns
+
+
+def verify_manifest(skill_dir: Path) -> Drift:
+    """Compare a skill directory against its manifest.
+
+    Files whose size differs are modified without being read; files whose
+    mtime differs, or that were modified no earlier than the manifest was
+    written, are hashed to decide. Everything else is taken as unchanged.
+    """
+    recorded, manifest_mtime = read_manifest(skill_dir)
+
+    added, modified, suspect = [], [], []
+    for item in skill_files(skill_dir):
+        old = recorded.pop(item.path, None)
+        if old is None:
+            added.append(item.path)
+        elif old.size != item.size:
+            modified.append(item.path)
+        elif old.mtime_ns != item.mtime_ns or item.mtime_ns >= manifest_mtime:
+            suspect.append((item, old.digest))
+
+    digests = digest_files(skill_dir, [item for item, _ in suspect])
+    modified.extend(item.path for item, digest in suspect if digests[item.path] != digest)
+    return Drift(added, sorted(recorded), sorted(modified), len(suspect))
+
+
+def find_skill_dirs(paths: List[Path]) -> List[Path]:
+    """Each path that is a skill, or every skill beneath it."""
+    skill_dirs = []
+    for path in paths:
+        if (path / "SKILL.md").is_file():
+            skill_dirs.append(path)
+        else:
+            skill_dirs.extend(discover_skills(path))
+    return skill_dirs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write or verify per-skill integrity manifests"
+    )
+    parser.add_argument(
+        "action",
+        choices=["write", "verify"],
+        help="Write manifests, or check skills against them",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Skill directories, or directories to search for skills",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only report skills that drifted or failed",
+    )
+    args = parser.parse_args()
+
+    skill_dirs = find_skill_dirs(args.paths)
+    if not skill_dirs:
+        print("Error: no skills found")
+        return 1
+
+    reports = []
+    failed = 0
+    for skill_dir in skill_dirs:
+        report = {"skill": skill_dir.as_posix()}
+        try:
+            if args.action == "write":
+                write_manifest(skill_dir)
+                report["status"] = "written"
+            else:
+                drift = verify_manifest(skill_dir)
+                report["status"] = "clean" if drift.clean else "drift"
+                report.update(drift._asdict())
+        except FileNotFoundError as exc:
+            report["status"] = "error"
+            report["error"] = "No manifest found" if Path(exc.filename).name == MANIFEST_NAME else str(exc)
+        except (OSError, ValueError) as exc:
+            report["status"] = "error"
+            report["error"] = str(exc)
+        failed += report["status"] in ("drift", "error")
+        reports.append(report)
+
+    if args.format == "json":
+        print(json.dumps(reports, indent=2))
+        return 1 if failed else 0
+
+    for report in reports:
+        status = report["status"]
+        if status == "error":
+            print(f"✗ {report['skill']}: {report['error']}")
+        elif status == "drift":
+            print(f"✗ {report['skill']}")
+            for key, mark in (("modified", "M"), ("added", "A"), ("removed", "D")):
+                for path in report[key]:
+                    print(f"    {mark} {path}")
+        elif not args.quiet:
+            print(f"✓ {report['skill']}" + (" (manifest written)" if status == "written" else ""))
+
+    if args.action == "verify" and not args.quiet:
+        print(f"\n{len(reports) - failed}/{len(reports)} skill(s) match their manifest")
+        print("(.git/ and the content of symlinked directories are not covered)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
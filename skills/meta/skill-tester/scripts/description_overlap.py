@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Find skills whose descriptions overlap enough for an agent to confuse them.
+
+Builds a TF-IDF vector for every description beneath a directory and reports
+each pair whose cosine similarity reaches a threshold. With NumPy installed
+the similarity matrix X @ X.T is computed as a sparse product in row blocks:
+each block gathers the posting lists of its terms and sums the products with
+array operations, so memory stays bounded per block and no Python loop runs
+per pair. Without NumPy an exact pure-Python fallback walks the same
+inverted index row by row, which is fine for smaller trees.
+
+Usage:
+    python description_overlap.py <root>
+    python description_overlap.py skills --threshold 0.5 --format json
+    python description_overlap.py --help
+
+Exits 1 if any pair reaches the threshold.
+"""
+
+import argparse
+import functools
+import json
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Tuple
+
+from skill_parser import discover_skills, load_frontmatter, load_yaml_module, read_frontmatter
+
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_BLOCK_SIZE = 512
+
+# Per-block memory bounds for the NumPy path: similarity accumulator cells
+# and posting entries gathered at once
+ACCUMULATOR_BUDGET = 1 << 22
+GATHER_BUDGET = 1 << 22
+# Terms in more than 1/32 of all descriptions are multiplied as dense columns
+COMMON_TERM_FRACTION = 32
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or "
+    "that the this to use used uses when with you your".split()
+)
+
+
+class SkillDescription(NamedTuple):
+    """A skill's description. ``path`` is relative to the analysed root."""
+
+    path: str
+    name: str
+    description: str
+
+
+class Overlap(NamedTuple):
+    """Two skills whose descriptions reach the similarity threshold."""
+
+    similarity: float
+    first: SkillDescription
+    second: SkillDescription
+
+
+@functools.lru_cache(maxsize=None)
+def load_numpy():
+    """NumPy if it is installed, else None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric terms, without stopwords and single letters."""
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def load_descriptions(root: Path) -> List[SkillDescription]:
+    """Descriptions of every skill beneath root, reading only the frontmatter.
+
+    Skills without a readable frontmatter or a string description are
+    skipped; the validator reports those.
+    """
+    yaml = load_yaml_module()
+    skills = []
+    for skill_dir in discover_skills(root):
+        try:
+            text = read_frontmatter(skill_dir / "SKILL.md")
+            frontmatter = load_frontmatter(text) if text is not None else None
+        except (OSError, UnicodeDecodeError, yaml.YAMLError):
+            continue
+        if not isinstance(frontmatter, dict):
+            continue
+        description = frontmatter.get("description")
+        if not isinstance(description, str) or not description.strip():
+            continue
+        skills.append(
+            SkillDescription(
+                path=skill_dir.relative_to(root).as_posix(),
+                name=str(frontmatter.get("name") or skill_dir.name),
+                description=" ".join(description.split()),
+            )
+        )
+    return skills
+
+
+def tfidf_rows(descriptions: List[str]) -> Tuple[List[int], List[int], List[float]]:
+    """L2-normalised TF-IDF vectors as CSR arrays (row offsets, term ids, weights).
+
+    Term frequencies are sublinear (1 + log tf) and IDF is smoothed, so terms
+    shared by every description still carry a little weight.
+    """
+    counts = [Counter(tokenize(text)) for text in descriptions]
+    document_frequency: Counter = Counter()
+    for row in counts:
+        document_frequency.update(row.keys())
+    n = len(descriptions)
+    term_ids = {term: i for i, term in enumerate(sorted(document_frequency))}
+    idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+    indptr, indices, data = [0], [], []
+    for row in counts:
+        weights = sorted(
+            (term_ids[term], (1 + math.log(tf)) * idf[term]) for term, tf in row.items()
+        )
+        norm = math.sqrt(sum(weight * weight for _, weight in weights)) or 1.0
+        for term_id, weight in weights:
+            indices.append(term_id)
+            data.append(weight / norm)
+        indptr.append(len(indices))
+    return indptr, indices, data
+
+
+def _row_blocks(np, row_costs, n: int, block_size: int) -> Iterator[tuple]:
+    """(lo, hi) row ranges bounded by block_size, the score accumulator size
+    and the number of posting entries gathered per block."""
+    max_rows = max(1, min(block_size, ACCUMULATOR_BUDGET // max(n, 1)))
+    cumulative = np.cumsum(row_costs)
+    lo = 0
+    while lo < n:
+        base = cumulative[lo - 1] if lo else 0
+        hi = int(np.searchsorted(cumulative, base + GATHER_BUDGET, side="right"))
+        hi = min(max(hi, lo + 1), lo + max_rows, n)
+        yield lo, hi
+        lo = hi
+
+
+def _pairs_numpy(indptr, indices, data, threshold: float, block_size: int) -> Iterator[tuple]:
+    """(row, row, similarity) for every pair at or above threshold, by a blocked product.
+
+    X @ X.T is split by term frequency. Terms found in many descriptions
+    (boilerplate such as "skills" or "agent") form a small dense matrix whose
+    contribution is one matrix multiply per block. For the remaining, rarer
+    terms, every (row, term, weight) entry of a block is joined with the
+    term's posting list in one gather and the products are summed per pair
+    with a bincount. Neither step loops in Python over rows, terms or pairs.
+    """
+    np = load_numpy()
+    indptr = np.asarray(indptr, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(indptr) - 1
+    if not len(indices):
+        return
+    row_of = np.repeat(np.arange(n), np.diff(indptr))
+    df = np.bincount(indices)
+
+    # Common terms, most frequent first, as dense columns
+    common = np.nonzero(df * COMMON_TERM_FRACTION > n)[0]
+    common = common[np.argsort(-df[common], kind="stable")][: max(1, ACCUMULATOR_BUDGET // n)]
+    column = np.full(len(df), -1)
+    column[common] = np.arange(len(common))
+    is_common = column[indices] >= 0
+    dense = np.zeros((n, len(common)))
+    dense[row_of[is_common], column[indices[is_common]]] = data[is_common]
+
+    # The other terms in CSR form, with their postings (X transposed)
+    rare_indices, rare_data, rare_rows = indices[~is_common], data[~is_common], row_of[~is_common]
+    rare_ptr = np.concatenate(([0], np.cumsum(np.bincount(rare_rows, minlength=n))))
+    order = np.argsort(rare_indices, kind="stable")
+    posting_rows, posting_data = rare_rows[order], rare_data[order]
+    rare_df = np.bincount(rare_indices, minlength=len(df))
+    posting_ptr = np.concatenate(([0], np.cumsum(rare_df)))
+
+    row_costs = np.zeros(n, dtype=np.int64)
+    np.add.at(row_costs, rare_rows, rare_df[rare_indices])
+
+    for lo, hi in _row_blocks(np, row_costs, n, block_size):
+        a, b = rare_ptr[lo], rare_ptr[hi]
+        lengths = rare_df[rare_indices[a:b]]
+        entry = np.repeat(np.arange(a, b), lengths)
+        ends = np.cumsum(lengths)
+        within = np.arange(ends[-1] if len(ends) else 0) - np.repeat(ends - lengths, lengths)
+        position = posting_ptr[rare_indices[entry]] + within
+
+        rows = rare_rows[entry]
+        others = posting_rows[position]
+        upper = others > rows
+        products = rare_data[entry][upper] * posting_data[position][upper]
+        flat = (rows[upper] - lo) * n + others[upper]
+        scores = np.bincount(flat, weights=products, minlength=(hi - lo) * n)
+        # An empty bincount comes back as integers
+        scores = scores.astype(np.float64, copy=False).reshape(hi - lo, n)
+        if len(common):
+            scores += dense[lo:hi] @ dense.T
+
+        hit_rows, hit_cols = np.nonzero(scores >= threshold)
+        upper = hit_cols > hit_rows + lo
+        for row, col in zip(hit_rows[upper].tolist(), hit_cols[upper].tolist()):
+            yield lo + row, col, float(scores[row, col])
+
+
+def _pairs_python(indptr, indices, data, threshold: float) -> Iterator[tuple]:
+    """(row, row, similarity) for every pair at or above threshold, through an inverted index."""
+    postings = defaultdict(list)
+    for row in range(len(indptr) - 1):
+        for k in range(indptr[row], indptr[row + 1]):
+            postings[indices[k]].append((row, data[k]))
+
+    for row in range(len(indptr) - 1):
+        scores = defaultdict(float)
+        for k in range(indptr[row], indptr[row + 1]):
+            weight = data[k]
+            for other, other_weight in postings[indices[k]]:
+                if other > row:
+                    scores[other] += weight * other_weight
+        for other in sorted(scores):
+            if scores[other] >= threshold:
+                yield row, other, scores[other]
+
+
+def find_overlaps(
+    skills: List[SkillDescription],
+    threshold: float = DEFAULT_THRESHOLD,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    engine: str = "auto",
+) -> List[Overlap]:
+    """Every pair of skills whose description similarity reaches threshold, most similar first."""
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be in (0, 1]")
+    if engine == "auto":
+        engine = "numpy" if load_numpy() is not None else "python"
+    if engine == "numpy" and load_numpy() is None:
+        raise RuntimeError("NumPy is not installed (pip install numpy), use --engine python")
+
+    indptr, indices, data = tfidf_rows([skill.description for skill in skills])
+    # Identical descriptions can sum to a hair under 1.0
+    cutoff = threshold - 1e-9
+    if engine == "numpy":
+        pairs = _pairs_numpy(indptr, indices, data, cutoff, block_size)
+    else:
+        pairs = _pairs_python(indptr, indices, data, cutoff)
+
+    # Rounding first keeps the order identical between engines
+    overlaps = [Overlap(round(min(score, 1.0), 4), skills[a], skills[b]) for a, b, score in pairs]
+    overlaps.sort(key=lambda o: (-o.similarity, o.first.path, o.second.path))
+    return overlaps
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find skills with overlapping descriptions"
+    )
+    parser.add_argument(
+        "root",
+        type=Path,
+        help="Directory to search for skills",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Report pairs with cosine similarity at or above this (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=DEFAULT_BLOCK_SIZE,
+        help=f"Maximum descriptions per block in the NumPy computation (default: {DEFAULT_BLOCK_SIZE})",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["auto", "numpy", "python"],
+        default="auto",
+        help="Similarity implementation (default: numpy when installed)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    args = parser.parse_args()
+
+    if not args.root.is_dir():
+        print(f"Error: {args.root} is not a directory", file=sys.stderr)
+        return 2
+
+    skills = load_descriptions(args.root)
+    try:
+        overlaps = find_overlaps(skills, args.threshold, max(args.block_size, 1), args.engine)
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.format == "json":
+        print(
+            json.dumps(
+                [
+                    {
+                        "similarity": overlap.similarity,
+                        "first": overlap.first._asdict(),
+                        "second": overlap.second._asdict(),
+                    }
+                    for overlap in overlaps
+                ],
+                indent=2,
+            )
+        )
+        return 1 if overlaps else 0
+
+    if not overlaps:
+        print(f"✓ No overlapping descriptions among {len(skills)} skills (threshold {args.threshold})")
+        return 0
+
+    print(f"⚠ {len(overlaps)} overlapping description pair(s) among {len(skills)} skills:\n")
+    for overlap in overlaps:
+        print(f"{overlap.similarity:.2f}  {overlap.first.name} ({overlap.first.path})")
+        print(f"      {overlap.second.name} ({overlap.second.path})")
+        print(f"      - {overlap.first.description}")
+        print(f"      - {overlap.second.description}")
+        print()
+    return 1
+
+
+if __name__ == "__main__":
+    exit(main())
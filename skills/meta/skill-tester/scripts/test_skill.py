@@ -4,34 +4,517 @@ Validate agent skill structure and compliance with Agent Skills Specification v1
 
 Usage:
     python validate_skill.py <skill-directory>
+    python validate_skill.py <skills-root> [--quiet] [--jobs N] [--counts-only]
+    python validate_skill.py <path> --cache-dir .cache/skill-validation
+    python validate_skill.py <path> --metrics metrics.json
+    python validate_skill.py <path> --format ndjson|json
+    python validate_skill.py <skills-root> --changed-since origin/main
+    python validate_skill.py <skills-root> --changed-since origin/main..HEAD
+    python validate_skill.py <skills-root> --staged [--changed-since HEAD]
+    python validate_skill.py bundle.tar.gz|bundle.zip
+    python validate_skill.py --serve [--cache-dir DIR] [--jobs N]
     python validate_skill.py --help
+
+When given a directory without a SKILL.md, every skill beneath it is
+discovered and validated in a single process. With --serve it stays running
+and answers JSON-RPC requests, one per line (see ValidationServer).
 """
 
 import argparse
+import functools
+import hashlib
+import json
+import marshal
+import math
+import os
+import posixpath
 import re
 import sys
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from urllib.parse import unquote
+
+import skill_parser
+from skill_parser import (
+    SKIP_DIRS,
+    ParsedSkill,
+    count_words,
+    discover_skills,
+    parse_skill_md,
+    parse_skill_text,
+    skill_metadata,
+)
+
+
+class CredentialRule(NamedTuple):
+    """A credential pattern: a key (regex) assigned a quoted value, e.g. `token: "..."`."""
+
+    name: str
+    key: str
+
+
+DEFAULT_CREDENTIAL_RULES = [
+    CredentialRule("password", r"password"),
+    CredentialRule("api-key", r"api[_-]?key"),
+    CredentialRule("secret", r"secret"),
+    CredentialRule("token", r"token"),
+]
+
+
+class CredentialScanner:
+    """Finds hardcoded credentials for any number of rules in one pass.
+
+    All rule keys are compiled into a single alternation matching up to the
+    opening quote; the closing quote is then checked against a per-line cache,
+    so scanning stays linear in the text size even on adversarial input.
+    """
+
+    QUOTES = "'\""
+
+    def __init__(self, rules: Iterable[CredentialRule]):
+        self.rules = list(rules)
+        alternatives = "|".join(f"({rule.key})" for rule in self.rules)
+        self._pattern = re.compile(
+            rf"(?:{alternatives})\s*[:=]\s*['\"]", re.IGNORECASE
+        )
+        # Map each rule's outer group index to the rule (rule keys may have groups)
+        self._rule_by_group = {}
+        group = 1
+        for rule in self.rules:
+            self._rule_by_group[group] = rule
+            group += re.compile(rule.key).groups + 1
+
+    def scan(self, text: str) -> Iterator[Tuple[CredentialRule, int]]:
+        """Yield (rule, offset) for every credential assignment in text."""
+        line_end = -1
+        last_quote = -1
+        for match in self._pattern.finditer(text):
+            opening = match.end() - 1
+            if opening >= line_end:
+                line_end = text.find("\n", opening)
+                if line_end == -1:
+                    line_end = len(text)
+                last_quote = max(text.rfind(q, opening, line_end) for q in self.QUOTES)
+
+            # The value must be closed by another quote on the same line
+            if last_quote > opening:
+                yield self._rule_by_group[match.lastindex], match.start()
+
+
+# Inline code paths that count as references to bundled files
+RESOURCE_PREFIXES = ("scripts/", "templates/", "assets/", "references/")
+
+FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+LINK_DEFINITION_PATTERN = re.compile(r"^ {0,3}\[[^\]]+\]:\s*(<[^>]*>|\S+)")
+INLINE_PATTERN = re.compile(
+    r"(?P<ticks>`+)(?P<code>.+?)(?<!`)(?P=ticks)(?!`)"  # Code span
+    r"|!?\[[^\]]*\]\("  # Link or image, up to its destination
+)
+LINK_TAIL_PATTERN = re.compile(
+    r"(?:\s+(?:\"[^\"]*\"|'[^']*'|\([^)]*\)))?\s*\)"  # Optional title, then ")"
+)
+URL_SCHEME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:|^//")
+ESCAPED_PUNCTUATION_PATTERN = re.compile(r"\\([!-/:-@\[-`{-~])")
+
+
+def _link_destination(line: str, start: int) -> Tuple[int, int, int] | None:
+    """Locate an inline link's destination, given the offset just after "(".
+
+    Returns (target start, target end, end of the link), or None when the
+    text is not a link after all. As in CommonMark, a destination not in
+    <...> may contain balanced parentheses and backslash-escaped ones.
+    """
+    pos = start
+    while pos < len(line) and line[pos] in " \t":
+        pos += 1
+    target_start = pos
+
+    if line.startswith("<", pos):
+        close = line.find(">", pos)
+        if close == -1:
+            return None
+        pos = close + 1
+    else:
+        depth = 0
+        while pos < len(line):
+            char = line[pos]
+            if char == "\\":
+                pos = min(pos + 2, len(line))
+                continue
+            if char.isspace():
+                break
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                if not depth:
+                    break
+                depth -= 1
+            pos += 1
+        if depth or pos == target_start:
+            return None
+
+    tail = LINK_TAIL_PATTERN.match(line, pos)
+    if tail is None:
+        return None
+    return target_start, pos, tail.end()
+
+
+def _link_target_path(target: str) -> str | None:
+    """Local file path of a link target, or None for URLs and pure anchors."""
+    if target.startswith("<") and target.endswith(">"):
+        target = target[1:-1]
+    if URL_SCHEME_PATTERN.match(target):
+        return None
+    target = ESCAPED_PUNCTUATION_PATTERN.sub(r"\1", target)
+    target = target.split("#", 1)[0].split("?", 1)[0]
+    return unquote(target).strip() or None
+
+
+def extract_file_references(body: str) -> List[Tuple[str, int]]:
+    """Find local file references in a SKILL.md body in a single pass.
+
+    Returns (path, offset) pairs for link targets, image sources, link
+    definitions and inline code naming bundled resources (``scripts/...``
+    etc.). Fenced code blocks are skipped; URLs, anchors and titles are
+    stripped from link targets.
+    """
+    references = []
+    fence = None
+    offset = 0
+    for line in body.splitlines(keepends=True):
+        fence_match = FENCE_PATTERN.match(line)
+        if fence is not None:
+            # A fence closes on a bare run of the same character, at least as long
+            if fence_match and fence_match.group(1).startswith(fence) and not line[
+                fence_match.end():
+            ].strip():
+                fence = None
+        elif fence_match:
+            fence = fence_match.group(1)
+        else:
+            definition = LINK_DEFINITION_PATTERN.match(line)
+            if definition:
+                path = _link_target_path(definition.group(1))
+                if path:
+                    references.append((path, offset + definition.start(1)))
+            else:
+                pos = 0
+                while (match := INLINE_PATTERN.search(line, pos)) is not None:
+                    pos = match.end()
+                    if match.group("code") is not None:
+                        code = match.group("code").strip()
+                        if code.startswith(RESOURCE_PREFIXES) and code not in RESOURCE_PREFIXES:
+                            references.append((code, offset + match.start("code")))
+                        continue
+
+                    link = _link_destination(line, pos)
+                    if link is None:
+                        continue
+                    target_start, target_end, pos = link
+                    path = _link_target_path(line[target_start:target_end])
+                    if path:
+                        references.append((path, offset + target_start))
+        offset += len(line)
+    return references
+
+
+class DirectorySnapshot:
+    """In-memory listing of a skill directory for resolving file references.
+
+    Each directory is read with a single os.scandir() the first time a
+    reference needs it, so resolving many references costs one syscall per
+    directory rather than one stat per file.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._listings: Dict[str, Dict[str, bool] | None] = {}
+
+    def _listing(self, rel_dir: str) -> Dict[str, bool] | None:
+        """Map of entry name to is-directory for rel_dir, or None if unreadable."""
+        if rel_dir not in self._listings:
+            try:
+                with os.scandir(self.root / rel_dir) as entries:
+                    listing = {}
+                    for entry in entries:
+                        try:
+                            listing[entry.name] = entry.is_dir()
+                        except OSError:
+                            listing[entry.name] = False
+            except OSError:
+                listing = None
+            self._listings[rel_dir] = listing
+        return self._listings[rel_dir]
+
+    def exists(self, rel_path: str) -> bool:
+        """True if a normalized, skill-relative POSIX path exists in the snapshot."""
+        if rel_path == ".":
+            return True
+
+        rel_dir = "."
+        parts = rel_path.split("/")
+        for i, name in enumerate(parts):
+            listing = self._listing(rel_dir)
+            if listing is None or name not in listing:
+                return False
+            if i < len(parts) - 1 and not listing[name]:
+                return False
+            rel_dir = name if rel_dir == "." else f"{rel_dir}/{name}"
+        return True
+
 
-import yaml
+class MemberTree:
+    """A read-only file tree held as a listing of members, not a directory on disk.
+
+    Stands in for the directory ``base``: paths under base are looked up by
+    their POSIX path relative to it. ``members`` maps each file's relative
+    path to whatever handle ``_read`` needs to fetch its content; directories
+    are implied by the files they contain. Subclasses implement ``_read``.
+    """
+
+    def __init__(self, base: Path, members: Dict[str, object]):
+        self.base = base
+        self.members = members
+        self.dirs = {"."}
+        for rel_path in members:
+            parent = posixpath.dirname(rel_path)
+            while parent and parent not in self.dirs:
+                self.dirs.add(parent)
+                parent = posixpath.dirname(parent)
+
+    def _key(self, path: Path) -> str | None:
+        try:
+            return path.relative_to(self.base).as_posix()
+        except ValueError:
+            return None
+
+    def _read(self, handle) -> bytes:
+        raise NotImplementedError
+
+    def close(self):
+        """Release whatever the tree reads members through."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def is_dir(self, path: Path) -> bool:
+        return self._key(path) in self.dirs
+
+    def is_file(self, path: Path) -> bool:
+        return self._key(path) in self.members
+
+    def read_text(self, path: Path) -> str:
+        """Content of a member file with newlines translated like Path.read_text.
+
+        Raises OSError if it is not in the tree.
+        """
+        key = self._key(path)
+        if key not in self.members:
+            raise FileNotFoundError(f"No such file in {self.base}: {path}")
+        text = self._read(self.members[key]).decode("utf-8")
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def snapshot(self, skill_path: Path) -> "MemberSnapshot":
+        return MemberSnapshot(self, self._key(skill_path))
+
+    def discover_skills(self) -> List[Path]:
+        """Every directory in the tree holding a SKILL.md, in path order."""
+        skill_dirs = []
+        for rel_path in self.members:
+            parts = rel_path.split("/")
+            if parts[-1] == "SKILL.md" and not SKIP_DIRS.intersection(parts[:-1]):
+                skill_dirs.append(parts[:-1])
+        return [self.base.joinpath(*parts) for parts in sorted(skill_dirs)]
+
+
+class MemberSnapshot:
+    """DirectorySnapshot counterpart resolving references against a MemberTree."""
+
+    def __init__(self, tree: MemberTree, skill_key: str | None):
+        self.tree = tree
+        self.prefix = "" if skill_key in (None, ".") else f"{skill_key}/"
+
+    def exists(self, rel_path: str) -> bool:
+        """True if a normalized, skill-relative POSIX path exists in the tree."""
+        if rel_path == ".":
+            return True
+        key = self.prefix + rel_path
+        return key in self.tree.members or key in self.tree.dirs
+
+
+# Result severities, in report order
+PASS = "pass"
+WARNING = "warning"
+ERROR = "error"
+
+# Rule recorded when a check raises instead of reporting
+INTERNAL_ERROR_RULE = "internal-error"
+
+
+class ValidationResult:
+    """One check outcome for a skill.
+
+    ``rule`` is a stable identifier for the check. The human-readable message
+    is only formatted from ``template`` and ``args`` when it is asked for.
+    ``line`` and ``column`` locate the finding in SKILL.md when known.
+    """
+
+    __slots__ = ("rule", "severity", "skill_path", "template", "args", "line", "column")
+
+    def __init__(
+        self,
+        rule: str,
+        severity: str,
+        skill_path: Path,
+        template: str,
+        args: tuple = (),
+        line: int | None = None,
+        column: int | None = None,
+    ):
+        self.rule = rule
+        self.severity = severity
+        self.skill_path = skill_path
+        self.template = template
+        self.args = args
+        self.line = line
+        self.column = column
+
+    @property
+    def message(self) -> str:
+        """The formatted message, including the location when known."""
+        message = self.template.format(*self.args)
+        if self.line is not None:
+            message += f" at line {self.line}, column {self.column}"
+        return message
+
+    def to_dict(self) -> dict:
+        """Plain representation for machine-readable output."""
+        return {
+            "rule": self.rule,
+            "severity": self.severity,
+            "skill": str(self.skill_path),
+            "message": self.message,
+            "line": self.line,
+            "column": self.column,
+        }
 
 
 class SkillValidator:
-    """Validates agent skills against the specification."""
+    """Validates agent skills against the specification.
+
+    With ``counts_only`` passed checks are counted but not stored, keeping
+    memory flat when validating large trees. Given a ``tree`` the skill is
+    read from that MemberTree instead of the filesystem.
+    """
+
+    credential_scanner = CredentialScanner(DEFAULT_CREDENTIAL_RULES)
 
-    def __init__(self, skill_path: Path):
+    def __init__(
+        self,
+        skill_path: Path,
+        collect_metrics: bool = False,
+        counts_only: bool = False,
+        tree: MemberTree | None = None,
+    ):
         self.skill_path = skill_path
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.passes: List[str] = []
+        self.tree = tree
+        self.collect_metrics = collect_metrics
+        self.counts_only = counts_only
+        self.results: List[ValidationResult] = []
+        self.counts: Dict[str, int] = {PASS: 0, WARNING: 0, ERROR: 0}
+        self.referenced_files: List[str] = []
+        self.parsed: ParsedSkill | None = None
+        self.metrics: dict | None = None
+
+    def _record(
+        self, severity: str, rule: str, template: str, *args, offset: int | None = None
+    ):
+        """Record a check outcome; offset locates it within the SKILL.md body."""
+        self.counts[severity] += 1
+        if severity == PASS and self.counts_only:
+            return
+
+        line = column = None
+        if offset is not None and self.parsed is not None:
+            line, column = self.parsed.body_line_col(offset)
+        self.results.append(
+            ValidationResult(rule, severity, self.skill_path, template, args, line, column)
+        )
+
+    def _error(self, rule: str, template: str, *args, offset: int | None = None):
+        self._record(ERROR, rule, template, *args, offset=offset)
+
+    def _warn(self, rule: str, template: str, *args, offset: int | None = None):
+        self._record(WARNING, rule, template, *args, offset=offset)
+
+    def _pass(self, rule: str, template: str, *args, offset: int | None = None):
+        self._record(PASS, rule, template, *args, offset=offset)
+
+    def _messages(self, severity: str) -> List[str]:
+        return [r.message for r in self.results if r.severity == severity]
+
+    @property
+    def errors(self) -> List[str]:
+        return self._messages(ERROR)
+
+    @property
+    def warnings(self) -> List[str]:
+        return self._messages(WARNING)
+
+    @property
+    def passes(self) -> List[str]:
+        return self._messages(PASS)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.counts[ERROR] == 0
+
+    def _exists(self, path: Path) -> bool:
+        if self.tree is not None:
+            return self.tree.is_dir(path) or self.tree.is_file(path)
+        return path.exists()
+
+    def _is_dir(self, path: Path) -> bool:
+        return self.tree.is_dir(path) if self.tree is not None else path.is_dir()
+
+    def _is_file(self, path: Path) -> bool:
+        return self.tree.is_file(path) if self.tree is not None else path.is_file()
 
     def validate(self) -> bool:
-        """Run all validation checks. Returns True if all checks pass."""
+        """Run all validation checks. Returns True if all checks pass.
+
+        An unexpected exception becomes an error for this skill instead of
+        propagating, so one malformed skill can't abort a tree run.
+        """
+        try:
+            self._run_checks()
+        except Exception as exc:
+            self._error(
+                INTERNAL_ERROR_RULE,
+                "Validation stopped by an unexpected error: {}: {}",
+                type(exc).__name__,
+                str(exc),
+            )
+        # Results carry their own locations; don't keep the file content around
+        self.parsed = None
+        return self.is_valid
+
+    @property
+    def crashed(self) -> bool:
+        """Whether validation was cut short by an unexpected exception."""
+        return any(result.rule == INTERNAL_ERROR_RULE for result in self.results)
+
+    def _run_checks(self):
         self._check_directory_exists()
         self._check_skill_md_exists()
 
-        if not self.skill_path.exists() or not (self.skill_path / "SKILL.md").exists():
-            return False
+        if not self._exists(self.skill_path) or not self._exists(self.skill_path / "SKILL.md"):
+            return
 
         skill_md_path = self.skill_path / "SKILL.md"
         frontmatter, body = self._parse_skill_md(skill_md_path)
@@ -45,53 +528,67 @@ class SkillValidator:
             self._validate_body_content(body, skill_md_path)
             self._validate_file_references(body)
 
-        return len(self.errors) == 0
+            if self.collect_metrics:
+                # Bad frontmatter is reported above; metrics still come from the body
+                self._collect_metrics(frontmatter, body)
 
     def _check_directory_exists(self):
         """Check if skill directory exists."""
-        if not self.skill_path.exists():
-            self.errors.append(f"Directory does not exist: {self.skill_path}")
-        elif not self.skill_path.is_dir():
-            self.errors.append(f"Path is not a directory: {self.skill_path}")
+        if not self._exists(self.skill_path):
+            self._error("directory-exists", "Directory does not exist: {}", str(self.skill_path))
+        elif not self._is_dir(self.skill_path):
+            self._error("directory-exists", "Path is not a directory: {}", str(self.skill_path))
         else:
-            self.passes.append(f"Directory exists: {self.skill_path}")
+            self._pass("directory-exists", "Directory exists: {}", str(self.skill_path))
 
     def _check_skill_md_exists(self):
         """Check if SKILL.md file exists."""
         skill_md = self.skill_path / "SKILL.md"
-        if not skill_md.exists():
-            self.errors.append("SKILL.md file not found (case-sensitive)")
-        elif not skill_md.is_file():
-            self.errors.append("SKILL.md exists but is not a file")
+        if not self._exists(skill_md):
+            self._error("skill-md-exists", "SKILL.md file not found (case-sensitive)")
+        elif not self._is_file(skill_md):
+            self._error("skill-md-exists", "SKILL.md exists but is not a file")
         else:
-            self.passes.append("SKILL.md file exists")
+            self._pass("skill-md-exists", "SKILL.md file exists")
 
     def _parse_skill_md(self, skill_md_path: Path) -> Tuple[dict | None, str | None]:
         """Parse SKILL.md file and extract YAML frontmatter and body."""
         try:
-            content = skill_md_path.read_text(encoding="utf-8")
+            if self.tree is not None:
+                self.parsed = parse_skill_text(self.tree.read_text(skill_md_path), skill_md_path)
+            else:
+                self.parsed = parse_skill_md(skill_md_path)
         except Exception as e:
-            self.errors.append(f"Failed to read SKILL.md: {e}")
+            self._error("skill-md-readable", "Failed to read SKILL.md: {}", str(e))
             return None, None
 
-        # Extract YAML frontmatter
-        pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-        match = re.match(pattern, content, re.DOTALL)
-
-        if not match:
-            self.errors.append("SKILL.md missing YAML frontmatter (must start with ---)")
+        if self.parsed.frontmatter_text is None:
+            self._error(
+                "frontmatter-present",
+                "SKILL.md missing YAML frontmatter (must start with ---)",
+            )
             return None, None
 
-        frontmatter_text = match.group(1)
-        body = match.group(2)
+        if self.parsed.yaml_error is not None:
+            self._error(
+                "frontmatter-yaml", "Invalid YAML frontmatter: {}", str(self.parsed.yaml_error)
+            )
+            return None, self.parsed.body
 
-        try:
-            frontmatter = yaml.safe_load(frontmatter_text)
-            self.passes.append("YAML frontmatter is valid")
-            return frontmatter, body
-        except yaml.YAMLError as e:
-            self.errors.append(f"Invalid YAML frontmatter: {e}")
-            return None, body
+        if self.parsed.frontmatter is None:
+            self._error("frontmatter-mapping", "YAML frontmatter is empty")
+            return None, self.parsed.body
+
+        if not isinstance(self.parsed.frontmatter, dict):
+            self._error(
+                "frontmatter-mapping",
+                "YAML frontmatter must be a mapping of fields (got {})",
+                type(self.parsed.frontmatter).__name__,
+            )
+            return None, self.parsed.body
+
+        self._pass("frontmatter-yaml", "YAML frontmatter is valid")
+        return self.parsed.frontmatter, self.parsed.body
 
     def _validate_yaml_frontmatter(self, frontmatter: dict):
         """Validate YAML frontmatter fields."""
@@ -99,15 +596,15 @@ class SkillValidator:
         required_fields = ["name", "description"]
         for field in required_fields:
             if field not in frontmatter:
-                self.errors.append(f"Missing required field in YAML: '{field}'")
+                self._error("required-field", "Missing required field in YAML: '{}'", field)
             else:
-                self.passes.append(f"Required field present: '{field}'")
+                self._pass("required-field", "Required field present: '{}'", field)
 
         # Validate name field
         if "name" in frontmatter:
             name = frontmatter["name"]
             if not isinstance(name, str):
-                self.errors.append("Field 'name' must be a string")
+                self._error("name-type", "Field 'name' must be a string")
             else:
                 self._validate_skill_name(name)
 
@@ -115,27 +612,37 @@ class SkillValidator:
         if "description" in frontmatter:
             desc = frontmatter["description"]
             if not isinstance(desc, str):
-                self.errors.append("Field 'description' must be a string")
+                self._error("description-type", "Field 'description' must be a string")
             elif len(desc) > 1024:
-                self.errors.append(f"Description exceeds 1024 characters ({len(desc)} chars)")
+                self._error(
+                    "description-length",
+                    "Description exceeds 1024 characters ({} chars)",
+                    len(desc),
+                )
             elif len(desc) > 200:
-                self.warnings.append(f"Description is {len(desc)} chars (recommended ~200)")
+                self._warn(
+                    "description-length", "Description is {} chars (recommended ~200)", len(desc)
+                )
             else:
-                self.passes.append(f"Description length appropriate ({len(desc)} chars)")
+                self._pass(
+                    "description-length", "Description length appropriate ({} chars)", len(desc)
+                )
 
     def _validate_skill_name(self, name: str):
         """Validate skill name format."""
         # Check length
         if len(name) > 64:
-            self.errors.append(f"Skill name exceeds 64 characters: {len(name)}")
+            self._error("name-length", "Skill name exceeds 64 characters: {}", len(name))
 
         # Check format: hyphen-case (lowercase alphanumeric and hyphens only)
         if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
-            self.errors.append(
-                f"Skill name must be hyphen-case (lowercase, hyphens only): '{name}'"
+            self._error(
+                "name-format",
+                "Skill name must be hyphen-case (lowercase, hyphens only): '{}'",
+                name,
             )
         else:
-            self.passes.append(f"Skill name format is valid: '{name}'")
+            self._pass("name-format", "Skill name format is valid: '{}'", name)
 
     def _validate_name_matching(self, frontmatter: dict):
         """Validate directory name matches YAML name field."""
@@ -146,82 +653,100 @@ class SkillValidator:
         dir_name = self.skill_path.name
 
         if yaml_name != dir_name:
-            self.errors.append(
-                f"Directory name '{dir_name}' does not match YAML name '{yaml_name}'"
+            self._error(
+                "name-matches-directory",
+                "Directory name '{}' does not match YAML name '{}'",
+                dir_name,
+                str(yaml_name),
             )
         else:
-            self.passes.append(f"Directory name matches YAML name: '{yaml_name}'")
+            self._pass(
+                "name-matches-directory", "Directory name matches YAML name: '{}'", yaml_name
+            )
 
     def _validate_description(self, frontmatter: dict):
         """Validate description quality."""
         if "description" not in frontmatter:
             return
 
-        desc = frontmatter["description"].lower()
+        desc = frontmatter["description"]
+        if not isinstance(desc, str):
+            # Already reported by the description-type check
+            return
+        desc = desc.lower()
 
         # Check if description explains WHEN to use the skill
         when_indicators = ["when", "use when", "for", "to help", "if you need"]
         has_when = any(indicator in desc for indicator in when_indicators)
 
         if not has_when:
-            self.warnings.append(
-                "Description should explain WHEN to use the skill (contains no 'when' indicators)"
+            self._warn(
+                "description-when",
+                "Description should explain WHEN to use the skill (contains no 'when' indicators)",
             )
         else:
-            self.passes.append("Description explains when to use the skill")
+            self._pass("description-when", "Description explains when to use the skill")
 
     def _validate_body_content(self, body: str, skill_md_path: Path):
         """Validate SKILL.md body content."""
         # Check word count
-        word_count = len(body.split())
+        word_count = count_words(body)
         if word_count > 5000:
-            self.warnings.append(
-                f"SKILL.md body has {word_count} words (recommended <5,000)"
+            self._warn(
+                "body-word-count", "SKILL.md body has {} words (recommended <5,000)", word_count
             )
         else:
-            self.passes.append(f"SKILL.md body has {word_count} words (<5,000)")
-
-        # Check for hardcoded credentials (simple check)
-        credential_patterns = [
-            r"password\s*[:=]\s*['\"].*['\"]",
-            r"api[_-]?key\s*[:=]\s*['\"].*['\"]",
-            r"secret\s*[:=]\s*['\"].*['\"]",
-            r"token\s*[:=]\s*['\"].*['\"]",
-        ]
+            self._pass("body-word-count", "SKILL.md body has {} words (<5,000)", word_count)
 
-        for pattern in credential_patterns:
-            if re.search(pattern, body, re.IGNORECASE):
-                self.warnings.append(
-                    f"Possible hardcoded credential detected (pattern: {pattern})"
-                )
+        # Check for hardcoded credentials
+        for rule, offset in self.credential_scanner.scan(body):
+            self._warn(
+                "hardcoded-credential",
+                "Possible hardcoded credential detected ({})",
+                rule.name,
+                offset=offset,
+            )
 
     def _validate_file_references(self, body: str):
         """Validate that referenced files exist."""
-        # Find markdown links and code references to local files
-        patterns = [
-            r"\[(.*?)\]\(((?!http)[^\)]+)\)",  # Markdown links (not HTTP)
-            r"`(scripts/[^`]+)`",  # Inline code with scripts/
-            r"`(templates/[^`]+)`",  # Inline code with templates/
-            r"`(assets/[^`]+)`",  # Inline code with assets/
-            r"`(references/[^`]+)`",  # Inline code with references/
-        ]
-
-        referenced_files = set()
-        for pattern in patterns:
-            for match in re.finditer(pattern, body):
-                file_ref = match.group(1) if pattern.startswith(r"\[") else match.group(1)
-                # Clean up the reference
-                file_ref = file_ref.strip()
-                if file_ref and not file_ref.startswith("http"):
-                    referenced_files.add(file_ref)
+        # First occurrence of each reference, used to locate findings
+        referenced_files: Dict[str, int] = {}
+        for file_ref, offset in extract_file_references(body):
+            referenced_files.setdefault(file_ref, offset)
 
         # Check if referenced files exist
-        for file_ref in referenced_files:
-            file_path = self.skill_path / file_ref
-            if not file_path.exists():
-                self.errors.append(f"Referenced file does not exist: {file_ref}")
+        self.referenced_files = sorted(referenced_files)
+        if self.tree is not None:
+            snapshot = self.tree.snapshot(self.skill_path)
+        else:
+            snapshot = DirectorySnapshot(self.skill_path)
+        for file_ref in self.referenced_files:
+            offset = referenced_files[file_ref]
+            rel_path = posixpath.normpath(file_ref)
+            if rel_path == ".." or rel_path.startswith(("../", "/")):
+                self._error(
+                    "reference-outside-skill",
+                    "Referenced file is outside the skill directory: {}",
+                    file_ref,
+                    offset=offset,
+                )
+            elif not snapshot.exists(rel_path):
+                self._error(
+                    "reference-exists",
+                    "Referenced file does not exist: {}",
+                    file_ref,
+                    offset=offset,
+                )
             else:
-                self.passes.append(f"Referenced file exists: {file_ref}")
+                self._pass("reference-exists", "Referenced file exists: {}", file_ref)
+
+    def _collect_metrics(self, frontmatter: dict | None, body: str):
+        """Record evaluation metrics from the already-parsed SKILL.md.
+
+        Frontmatter fields are recorded as text, so metrics always serialize
+        to JSON even when YAML loaded a value as a date or a list.
+        """
+        self.metrics = skill_metadata(frontmatter, body)
 
     def print_report(self):
         """Print validation report."""
@@ -229,35 +754,828 @@ class SkillValidator:
         print(f"Skill Validation Report: {self.skill_path.name}")
         print(f"{'='*60}\n")
 
-        if self.passes:
-            print(f"✓ PASSED ({len(self.passes)})")
+        if self.counts[PASS]:
+            print(f"✓ PASSED ({self.counts[PASS]})")
             for msg in self.passes:
                 print(f"  ✓ {msg}")
             print()
 
-        if self.warnings:
-            print(f"⚠ WARNINGS ({len(self.warnings)})")
+        if self.counts[WARNING]:
+            print(f"⚠ WARNINGS ({self.counts[WARNING]})")
             for msg in self.warnings:
                 print(f"  ⚠ {msg}")
             print()
 
-        if self.errors:
-            print(f"✗ FAILED ({len(self.errors)})")
+        if self.counts[ERROR]:
+            print(f"✗ FAILED ({self.counts[ERROR]})")
             for msg in self.errors:
                 print(f"  ✗ {msg}")
             print()
 
         # Summary
         print(f"{'='*60}")
-        if self.errors:
+        if self.counts[ERROR]:
             print("RESULT: FAILED - Fix errors before using this skill")
-        elif self.warnings:
+        elif self.counts[WARNING]:
             print("RESULT: PASSED with warnings - Consider addressing warnings")
         else:
             print("RESULT: PASSED - Skill is valid")
         print(f"{'='*60}\n")
 
 
+def _module_bytes(module) -> bytes:
+    """A module's file as loaded, read through its loader.
+
+    Inside the zipapp ``__file__`` points into the archive (and may be the
+    bytecode rather than the source), which only the loader can read. If
+    even that fails, the marshalled code object stands in.
+    """
+    loader = getattr(module, "__loader__", None)
+    try:
+        return loader.get_data(module.__file__)
+    except (AttributeError, OSError):
+        return marshal.dumps(loader.get_code(module.__name__))
+
+
+class ValidationCache:
+    """On-disk cache of validation results keyed by skill content.
+
+    An entry is keyed by the skill path, a hash of SKILL.md and the validator
+    rule version, and records the stat signature of every referenced file.
+    Entries are written atomically (temp file + rename), so concurrent runs
+    sharing a cache directory never observe partial writes.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def rules_version() -> str:
+        """Hash of the validator and parser source; any rule change invalidates the cache."""
+        digest = hashlib.sha256(_module_bytes(sys.modules[__name__]))
+        digest.update(_module_bytes(skill_parser))
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _stat_signature(path: Path) -> List[int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    def _entry_path(self, skill_path: Path, content_hash: str) -> Path:
+        key = "\0".join(
+            [self.rules_version(), str(skill_path), str(skill_path.resolve()), content_hash]
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    @staticmethod
+    def _content_hash(skill_path: Path) -> str | None:
+        try:
+            return hashlib.sha256((skill_path / "SKILL.md").read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def lookup(
+        self, skill_path: Path, collect_metrics: bool = False, counts_only: bool = False
+    ) -> SkillValidator | None:
+        """Return a validator populated from the cache, or None on a miss."""
+        content_hash = self._content_hash(skill_path)
+        if content_hash is None:
+            return None
+
+        try:
+            entry = json.loads(self._entry_path(skill_path, content_hash).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if collect_metrics and "metrics" not in entry:
+            return None
+        if not counts_only and not entry.get("has_passes"):
+            return None
+
+        references: Dict[str, List[int] | None] = entry.get("references", {})
+        for file_ref, signature in references.items():
+            if self._stat_signature(skill_path / file_ref) != signature:
+                return None
+
+        validator = SkillValidator(
+            skill_path, collect_metrics=collect_metrics, counts_only=counts_only
+        )
+        validator.counts = entry["counts"]
+        validator.results = [
+            ValidationResult(rule, severity, skill_path, template, tuple(args), line, column)
+            for rule, severity, template, args, line, column in entry["results"]
+            if not (counts_only and severity == PASS)
+        ]
+        validator.referenced_files = list(references)
+        validator.metrics = entry.get("metrics")
+        return validator
+
+    def store(self, validator: SkillValidator):
+        """Record a validator's results.
+
+        An entry that can't be written or serialized is skipped (the skill
+        just stays uncached) and leaves no temporary file behind.
+        """
+        content_hash = self._content_hash(validator.skill_path)
+        if content_hash is None:
+            return
+
+        entry = {
+            "counts": validator.counts,
+            "has_passes": not validator.counts_only,
+            "results": [
+                [r.rule, r.severity, r.template, r.args, r.line, r.column]
+                for r in validator.results
+            ],
+            "references": {
+                file_ref: self._stat_signature(validator.skill_path / file_ref)
+                for file_ref in validator.referenced_files
+            },
+        }
+        if validator.metrics is not None:
+            entry["metrics"] = validator.metrics
+
+        entry_path = self._entry_path(validator.skill_path, content_hash)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, entry_path)
+        except (OSError, TypeError, ValueError):
+            Path(tmp_name).unlink(missing_ok=True)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _git(cwd: Path, *args: str) -> str:
+    """Run a git command and return its output. Raises RuntimeError on failure."""
+    import subprocess
+
+    proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"git {args[0]} failed")
+    return proc.stdout
+
+
+def git_range_end(ref: str) -> str | None:
+    """The commit a ``A..B`` (or ``A...B``) range ends at, or None for a single ref."""
+    if ".." not in ref:
+        return None
+    return ref.rsplit("..", 1)[1] or "HEAD"
+
+
+def git_changed_files(ref: str, cwd: Path, staged: bool = False) -> List[Path]:
+    """Absolute paths of files that differ between ref and the working tree.
+
+    With ``staged`` the index is compared instead of the working tree; given
+    an ``A..B`` range the two commits are compared, leaving both untouched.
+    Renames are split into a deletion and an addition so both sides count.
+    Raises RuntimeError if git fails (not a repository, unknown ref).
+    """
+    top = Path(_git(cwd, "rev-parse", "--show-toplevel").strip())
+    diff = ["diff", "--name-only", "--no-renames", "-z"]
+    if staged:
+        diff.append("--cached")
+    names = _git(cwd, *diff, ref, "--")
+    return [top / name for name in names.split("\0") if name]
+
+
+def changed_skills(
+    root: Path, changed_files: Iterable[Path], tree: MemberTree | None = None
+) -> List[Path] | None:
+    """Skills beneath root owning any of the changed files, in discovery order.
+
+    A file belongs to the nearest enclosing directory with a SKILL.md (in
+    ``tree`` when given, otherwise on disk), so edits to a skill's scripts/
+    or templates/ select that skill. Returns None when the validator's own
+    rules changed and every skill needs rechecking.
+    """
+    rule_sources = {Path(__file__).resolve(), Path(skill_parser.__file__).resolve()}
+    abs_root = root.resolve()
+    owners: Dict[Path, Path | None] = {}
+    skills = set()
+
+    for changed in changed_files:
+        if changed.resolve() in rule_sources:
+            return None
+        try:
+            rel = changed.relative_to(abs_root)
+        except ValueError:
+            continue
+
+        # Walk up towards root, remembering each directory's owner
+        parts = rel.parts[:-1]
+        visited = []
+        owner = None
+        for depth in range(len(parts), -1, -1):
+            rel_dir = Path(*parts[:depth])
+            if rel_dir in owners:
+                owner = owners[rel_dir]
+                break
+            visited.append(rel_dir)
+            if tree is not None:
+                is_skill = tree.is_file(root / rel_dir / "SKILL.md")
+            else:
+                is_skill = (abs_root / rel_dir / "SKILL.md").is_file()
+            if is_skill:
+                owner = rel_dir
+                break
+        for rel_dir in visited:
+            owners[rel_dir] = owner
+        if owner is not None:
+            skills.add(owner)
+
+    return [root / rel_dir for rel_dir in sorted(skills, key=lambda p: p.parts)]
+
+
+class GitObjectReader:
+    """Reads blobs through one long-lived ``git cat-file --batch`` process."""
+
+    def __init__(self, cwd: Path):
+        import subprocess
+
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def read(self, oid: str) -> bytes:
+        """Content of an object. Raises OSError if git cannot provide it."""
+        self._proc.stdin.write(oid.encode("ascii") + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) != 3:
+            raise FileNotFoundError(f"git object {oid} is missing")
+        size = int(header[2])
+        data = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)  # trailing newline
+        return data
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+
+class GitIndexTree(MemberTree):
+    """The staged content of ``base`` as recorded in the git index.
+
+    Lists the index once with ``git ls-files`` and streams blobs on demand
+    through a single ``git cat-file --batch`` process, so exactly what would
+    be committed is validated without checking anything out. Given a
+    ``treeish`` (a commit, say) its content is read instead of the index.
+    """
+
+    def __init__(self, base: Path, treeish: str | None = None):
+        members: Dict[str, str] = {}
+        # Paths are listed relative to base
+        if treeish is not None:
+            listing = _git(base, "ls-tree", "-r", "-z", treeish, "--", ".")
+            for entry in listing.split("\0"):
+                if not entry:
+                    continue
+                info, rel_path = entry.split("\t", 1)
+                _mode, kind, oid = info.split()
+                # Submodules are commits, not files
+                if kind == "blob":
+                    members[rel_path] = oid
+        else:
+            listing = _git(base, "ls-files", "--stage", "-z", "--", ".")
+            for entry in listing.split("\0"):
+                if not entry:
+                    continue
+                info, rel_path = entry.split("\t", 1)
+                _mode, oid, stage = info.split()
+                # Unmerged paths are listed once per stage; prefer our side
+                if stage in ("0", "2") or rel_path not in members:
+                    members[rel_path] = oid
+        super().__init__(base, members)
+        self._reader = GitObjectReader(base)
+
+    def _read(self, handle) -> bytes:
+        return self._reader.read(handle)
+
+    def close(self):
+        self._reader.close()
+
+
+# Archive suffixes recognized (case-insensitively) as bundles of skills
+ARCHIVE_SUFFIXES = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tar", ".zip")
+
+
+def _archive_member_path(name: str) -> str | None:
+    """Normalized relative path of an archive member, or None if it is unsafe."""
+    rel_path = posixpath.normpath(name)
+    if rel_path == "." or rel_path == ".." or rel_path.startswith(("../", "/")):
+        return None
+    return rel_path
+
+
+class ArchiveTree(MemberTree):
+    """Skills inside a .zip or .tar(.gz/.bz2/.xz) archive, read without extracting.
+
+    The archive stands in for a directory named after it (its path without
+    the archive suffix): ``bundle.zip`` holding ``my-skill/SKILL.md`` yields
+    the skill ``bundle/my-skill``, and ``my-skill.zip`` with a top-level
+    SKILL.md yields ``my-skill``. Tar archives are streamed once,
+    keeping only SKILL.md contents in memory; zip members are read on demand.
+    """
+
+    def __init__(self, archive: Path):
+        import zipfile
+
+        self.archive = archive
+        self._zip = None
+        base = archive.with_name(archive.name[: -len(self._suffix(archive))])
+
+        members: Dict[str, object] = {}
+        if zipfile.is_zipfile(archive):
+            self._zip = zipfile.ZipFile(archive)
+            for info in self._zip.infolist():
+                rel_path = _archive_member_path(info.filename)
+                if rel_path is not None and not info.is_dir():
+                    members[rel_path] = info.filename
+        else:
+            import tarfile
+
+            try:
+                with tarfile.open(archive, "r|*") as tar:
+                    for member in tar:
+                        rel_path = _archive_member_path(member.name)
+                        if rel_path is None or member.isdir():
+                            continue
+                        content = None
+                        if member.isfile() and posixpath.basename(rel_path) == "SKILL.md":
+                            content = tar.extractfile(member).read()
+                        members[rel_path] = content
+            except tarfile.TarError as e:
+                raise OSError(f"Not a readable archive: {archive} ({e})") from e
+        super().__init__(base, members)
+
+    @staticmethod
+    def _suffix(path: Path) -> str:
+        name = path.name.lower()
+        return next((suffix for suffix in ARCHIVE_SUFFIXES if name.endswith(suffix)), "")
+
+    @classmethod
+    def is_archive(cls, path: Path) -> bool:
+        return path.is_file() and cls._suffix(path) != ""
+
+    def _read(self, handle) -> bytes:
+        if self._zip is not None:
+            return self._zip.read(handle)
+        if handle is None:
+            raise OSError("Archive member is not a regular file")
+        return handle
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may use, honoring affinity and cgroup quotas."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, math.ceil(quota)))
+    return cpus
+
+
+def _cgroup_cpu_quota() -> float | None:
+    """Read the CPU quota from cgroup v2 or v1, if one is set."""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # cgroup v1: quota of -1 means unlimited
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def validate_skill(
+    skill_dir: Path,
+    cache_dir: Path | None = None,
+    collect_metrics: bool = False,
+    counts_only: bool = False,
+    tree: MemberTree | None = None,
+) -> SkillValidator:
+    """Validate a single skill, consulting the result cache when one is given.
+
+    Skills read from a MemberTree bypass the cache, which tracks files on
+    disk. Also the worker entry point for the process pool.
+    """
+    cache = None
+    if cache_dir is not None and tree is None:
+        cache = ValidationCache(cache_dir)
+    if cache is not None:
+        cached = cache.lookup(
+            skill_dir, collect_metrics=collect_metrics, counts_only=counts_only
+        )
+        if cached is not None:
+            return cached
+
+    validator = SkillValidator(
+        skill_dir, collect_metrics=collect_metrics, counts_only=counts_only, tree=tree
+    )
+    validator.validate()
+    if cache is not None and not validator.crashed:
+        cache.store(validator)
+    return validator
+
+
+def iter_validate_dirs(
+    skill_dirs: List[Path],
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+    collect_metrics: bool = False,
+    counts_only: bool = False,
+    tree: MemberTree | None = None,
+) -> Iterator[SkillValidator]:
+    """Validate the given skills, yielding each as it finishes.
+
+    With jobs > 1 skills are fanned out to a process pool; results are always
+    yielded in the order given so reports are stable between runs. Skills in
+    a MemberTree are validated in this process, which owns the tree's reader.
+    """
+    worker = functools.partial(
+        validate_skill,
+        cache_dir=cache_dir,
+        collect_metrics=collect_metrics,
+        counts_only=counts_only,
+        tree=tree,
+    )
+    if jobs <= 1 or len(skill_dirs) < 2 or tree is not None:
+        yield from map(worker, skill_dirs)
+        return
+
+    # Only pay for the process pool machinery when fanning out
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = min(jobs, len(skill_dirs))
+    chunksize = max(1, len(skill_dirs) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(worker, skill_dirs, chunksize=chunksize)
+
+
+def iter_validate_tree(root: Path, jobs: int = 1, **options) -> Iterator[SkillValidator]:
+    """Validate every skill beneath root, yielding each in discovery (path) order."""
+    return iter_validate_dirs(discover_skills(root), jobs=jobs, **options)
+
+
+def validate_tree(root: Path, jobs: int = 1, **options) -> List[SkillValidator]:
+    """Validate every skill beneath root, collecting results instead of stopping."""
+    return list(iter_validate_tree(root, jobs=jobs, **options))
+
+
+def validate_archive(archive: Path, **options) -> List[SkillValidator]:
+    """Validate every skill inside a .zip or .tar(.gz) archive without extracting it."""
+    with ArchiveTree(archive) as tree:
+        return [
+            validate_skill(skill_dir, tree=tree, **options)
+            for skill_dir in tree.discover_skills()
+        ]
+
+
+class RunSummary:
+    """Aggregate counts for a validation run, updated as skills finish."""
+
+    def __init__(self, allow_empty: bool = False):
+        self.allow_empty = allow_empty
+        self.skills = 0
+        self.warned = 0
+        self.failed: List[Tuple[Path, int]] = []
+        self.metrics: List[dict] = []
+
+    def add(self, validator: SkillValidator):
+        self.skills += 1
+        if not validator.is_valid:
+            self.failed.append((validator.skill_path, validator.counts[ERROR]))
+        elif validator.counts[WARNING]:
+            self.warned += 1
+        if validator.metrics is not None:
+            self.metrics.append(
+                {
+                    "path": str(validator.skill_path),
+                    "valid": validator.is_valid,
+                    **validator.metrics,
+                }
+            )
+
+    @property
+    def is_valid(self) -> bool:
+        return (self.skills > 0 or self.allow_empty) and not self.failed
+
+    def to_dict(self) -> dict:
+        return {
+            "skills": self.skills,
+            "passed": self.skills - self.warned - len(self.failed),
+            "warned": self.warned,
+            "failed": len(self.failed),
+            "valid": self.is_valid,
+        }
+
+
+def skill_record(validator: SkillValidator) -> dict:
+    """Per-skill summary record for machine-readable output."""
+    return {
+        "skill": str(validator.skill_path),
+        "valid": validator.is_valid,
+        "counts": validator.counts,
+    }
+
+
+def print_tree_summary(root: Path, summary: RunSummary):
+    """Print aggregate results for a tree validation run."""
+    print(f"{'='*60}")
+    print(f"Tree Validation Summary: {root}")
+    print(f"{'='*60}\n")
+    counts = summary.to_dict()
+    print(f"Skills validated: {counts['skills']}")
+    print(f"  ✓ Passed: {counts['passed']}")
+    print(f"  ⚠ Passed with warnings: {counts['warned']}")
+    print(f"  ✗ Failed: {counts['failed']}")
+
+    if summary.failed:
+        print()
+        for skill_path, error_count in summary.failed:
+            print(f"  ✗ {skill_path} ({error_count} errors)")
+
+    print(f"\n{'='*60}")
+    if summary.failed:
+        print("RESULT: FAILED - Fix errors before using these skills")
+    elif not summary.skills and summary.allow_empty:
+        print("RESULT: PASSED - No changed skills to validate")
+    elif not summary.skills:
+        print(f"RESULT: FAILED - No skills found under {root}")
+    else:
+        print("RESULT: PASSED - All skills are valid")
+    print(f"{'='*60}\n")
+
+
+def write_ndjson(validator: SkillValidator):
+    """Stream one line per result, then the skill's summary record."""
+    for result in validator.results:
+        print(json.dumps({"type": "result", **result.to_dict()}))
+    print(json.dumps({"type": "skill", **skill_record(validator)}), flush=True)
+
+
+def write_metrics(output: Path, summary: RunSummary):
+    """Write evaluation metrics gathered during validation as JSON."""
+    output.write_text(json.dumps(summary.metrics, indent=2) + "\n", encoding="utf-8")
+
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    """An error to report to the client as a JSON-RPC error response."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class ValidationServer:
+    """Long-lived validation worker speaking JSON-RPC 2.0 over stdin/stdout.
+
+    One request or response per line. Parsed rules, loaded modules and
+    results stay warm between calls: a skill whose SKILL.md and referenced
+    files are unchanged is answered from memory, and misses fall through to
+    the on-disk cache when one is configured.
+
+    At most ``memo_size`` results are kept in memory; the least recently
+    used is dropped first.
+
+    Methods:
+        validate       {"path", "metrics"?, "counts_only"?} -> skill report
+        validate_many  {"paths" | "root", "metrics"?, "counts_only"?}
+                       -> {"summary", "skills"}
+        evaluate       {"path"} -> {"skill", "valid", "metrics"}
+    """
+
+    MEMO_SIZE = 4096
+
+    def __init__(
+        self, cache_dir: Path | None = None, jobs: int = 1, memo_size: int = MEMO_SIZE
+    ):
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self.memo_size = memo_size
+        self._pool = None
+        # (path, collect_metrics, counts_only) -> (fingerprint, validator), oldest first
+        self._memo: OrderedDict[Tuple[str, bool, bool], Tuple[tuple, SkillValidator]]
+        self._memo = OrderedDict()
+        self._methods = {
+            "validate": self._validate,
+            "validate_many": self._validate_many,
+            "evaluate": self._evaluate,
+        }
+
+    @staticmethod
+    def _fingerprint(skill_path: Path, references: Iterable[str]) -> tuple:
+        # The directory's own signature catches it appearing or its files changing
+        return (
+            ValidationCache._stat_signature(skill_path),
+            ValidationCache._content_hash(skill_path),
+            tuple(ValidationCache._stat_signature(skill_path / ref) for ref in references),
+        )
+
+    def _remember(self, key: Tuple[str, bool, bool], validator: SkillValidator):
+        fingerprint = self._fingerprint(validator.skill_path, validator.referenced_files)
+        self._memo[key] = (fingerprint, validator)
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _recall(self, key: Tuple[str, bool, bool]) -> SkillValidator | None:
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        fingerprint, validator = entry
+        if self._fingerprint(validator.skill_path, validator.referenced_files) != fingerprint:
+            del self._memo[key]
+            return None
+        self._memo.move_to_end(key)
+        return validator
+
+    def validate_paths(
+        self, paths: List[Path], collect_metrics: bool = False, counts_only: bool = False
+    ) -> List[SkillValidator]:
+        """Validate skills, reusing warm results and fanning misses out to the pool."""
+        keys = [(str(path), collect_metrics, counts_only) for path in paths]
+        validators = [self._recall(key) for key in keys]
+        misses = [i for i, validator in enumerate(validators) if validator is None]
+
+        worker = functools.partial(
+            validate_skill,
+            cache_dir=self.cache_dir,
+            collect_metrics=collect_metrics,
+            counts_only=counts_only,
+        )
+        miss_paths = [paths[i] for i in misses]
+        if self.jobs > 1 and len(misses) > 1:
+            if self._pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+            chunksize = max(1, len(misses) // (self.jobs * 4))
+            fresh = self._pool.map(worker, miss_paths, chunksize=chunksize)
+        else:
+            fresh = map(worker, miss_paths)
+
+        for i, validator in zip(misses, fresh):
+            self._remember(keys[i], validator)
+            validators[i] = validator
+        return validators
+
+    @staticmethod
+    def _report(validator: SkillValidator) -> dict:
+        report = {
+            **skill_record(validator),
+            "results": [result.to_dict() for result in validator.results],
+        }
+        if validator.metrics is not None:
+            report["metrics"] = validator.metrics
+        return report
+
+    @staticmethod
+    def _path_param(params: dict, name: str = "path") -> Path:
+        value = params.get(name)
+        if not isinstance(value, str) or not value:
+            raise RpcError(INVALID_PARAMS, f"'{name}' must be a non-empty string")
+        return Path(value)
+
+    def _validate(self, params: dict) -> dict:
+        [validator] = self.validate_paths(
+            [self._path_param(params)],
+            collect_metrics=bool(params.get("metrics")),
+            counts_only=bool(params.get("counts_only")),
+        )
+        return self._report(validator)
+
+    def _validate_many(self, params: dict) -> dict:
+        if "root" in params:
+            paths = discover_skills(self._path_param(params, "root"))
+        else:
+            paths = params.get("paths")
+            if not isinstance(paths, list) or not all(isinstance(p, str) for p in paths):
+                raise RpcError(INVALID_PARAMS, "expected 'paths' (list of strings) or 'root'")
+            paths = [Path(p) for p in paths]
+
+        summary = RunSummary()
+        skills = []
+        for validator in self.validate_paths(
+            paths,
+            collect_metrics=bool(params.get("metrics")),
+            counts_only=bool(params.get("counts_only")),
+        ):
+            summary.add(validator)
+            skills.append(self._report(validator))
+        return {"summary": summary.to_dict(), "skills": skills}
+
+    def _evaluate(self, params: dict) -> dict:
+        [validator] = self.validate_paths(
+            [self._path_param(params)], collect_metrics=True, counts_only=True
+        )
+        return {
+            "skill": str(validator.skill_path),
+            "valid": validator.is_valid,
+            "metrics": validator.metrics,
+        }
+
+    def handle(self, request) -> str | None:
+        """Answer one decoded request with an encoded response line.
+
+        Returns None for notifications. The result is encoded inside the
+        error handling, so one that can't be serialized is answered with an
+        internal error instead of stopping the worker.
+        """
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return json.dumps(self._error(None, INVALID_REQUEST, "Invalid request"))
+
+        request_id = request.get("id")
+        method = self._methods.get(request["method"])
+        params = request.get("params", {})
+        try:
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            result = method(params)
+            response = json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+        except RpcError as e:
+            response = json.dumps(self._error(request_id, e.code, str(e)))
+        except Exception as e:  # keep serving after unexpected failures
+            response = json.dumps(
+                self._error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            )
+
+        return response if "id" in request else None
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    def serve(self, stdin=None, stdout=None):
+        """Answer requests line by line until stdin is closed."""
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        try:
+            for line in iter(stdin.readline, ""):
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = json.dumps(self._error(None, PARSE_ERROR, "Parse error"))
+                else:
+                    response = self.handle(request)
+                if response is not None:
+                    stdout.write(response + "\n")
+                    stdout.flush()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate agent skill structure and spec compliance"
@@ -265,15 +1583,157 @@ def main():
     parser.add_argument(
         "skill_directory",
         type=Path,
-        help="Path to skill directory to validate",
+        nargs="?",
+        help="Path to a skill directory, a root directory containing skills, "
+        "or a .zip/.tar.gz archive of skills",
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="In tree mode, only print reports for skills with errors or warnings",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Worker processes for tree mode (default: available CPUs)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse results for unchanged skills from this cache directory",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        metavar="FILE",
+        help="Also write evaluation metrics for each skill to FILE (JSON)",
+    )
+    parser.add_argument(
+        "--counts-only",
+        action="store_true",
+        help="Count passed checks without listing them (keeps memory flat on large trees)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson", "json"],
+        default="text",
+        help="Report format: human-readable text, one JSON record per line "
+        "streamed as skills finish, or a single JSON document (default: text)",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="In tree mode, only validate skills with files changed since this git ref; "
+        "given a range A..B, skills changed between two commits, as committed in B",
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Validate the content staged in the git index instead of the working tree",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a long-lived worker answering JSON-RPC requests on stdin/stdout",
     )
     args = parser.parse_args()
 
-    validator = SkillValidator(args.skill_directory)
-    is_valid = validator.validate()
-    validator.print_report()
+    if args.serve:
+        ValidationServer(cache_dir=args.cache_dir, jobs=args.jobs).serve()
+        return
+    if args.skill_directory is None:
+        parser.error("the following arguments are required: skill_directory")
+
+    root = args.skill_directory
+    tree = None
+    range_end = git_range_end(args.changed_since) if args.changed_since is not None else None
+    if ArchiveTree.is_archive(root):
+        if args.staged or args.changed_since is not None:
+            parser.error("--staged and --changed-since do not apply to archives")
+        try:
+            tree = ArchiveTree(root)
+        except OSError as e:
+            parser.error(str(e))
+        # Every skill in the archive is validated, wherever it sits
+        root = tree.base
+        tree_mode = True
+    elif args.staged:
+        if range_end is not None:
+            parser.error("--staged compares against the index; give --changed-since a single ref")
+        try:
+            tree = GitIndexTree(root)
+        except (OSError, RuntimeError) as e:
+            parser.error(f"--staged: {e}")
+        tree_mode = not tree.is_file(root / "SKILL.md")
+    elif range_end is not None:
+        # Validate the skills as committed at the end of the range, not the checkout
+        try:
+            tree = GitIndexTree(root, treeish=range_end)
+        except (OSError, RuntimeError) as e:
+            parser.error(f"--changed-since: {e}")
+        tree_mode = not tree.is_file(root / "SKILL.md")
+    else:
+        tree_mode = root.is_dir() and not (root / "SKILL.md").exists()
+    options = {
+        "cache_dir": args.cache_dir,
+        "collect_metrics": args.metrics is not None,
+        "counts_only": args.counts_only,
+        "tree": tree,
+    }
+
+    try:
+        skill_dirs = None
+        if args.changed_since is not None:
+            if not tree_mode:
+                parser.error("--changed-since needs a directory of skills")
+            try:
+                changed = git_changed_files(args.changed_since, root, staged=args.staged)
+            except (OSError, RuntimeError) as e:
+                parser.error(f"--changed-since: {e}")
+            skill_dirs = changed_skills(root, changed, tree)
+        if skill_dirs is None and tree_mode:
+            skill_dirs = tree.discover_skills() if tree is not None else discover_skills(root)
+
+        if tree_mode:
+            validators = iter_validate_dirs(skill_dirs, jobs=args.jobs, **options)
+        else:
+            validators = [validate_skill(root, **options)]
+
+        summary = RunSummary(allow_empty=args.changed_since is not None)
+        skills = []
+        for validator in validators:
+            summary.add(validator)
+            if args.format == "ndjson":
+                write_ndjson(validator)
+            elif args.format == "json":
+                skills.append(
+                    {
+                        **skill_record(validator),
+                        "results": [result.to_dict() for result in validator.results],
+                    }
+                )
+            else:
+                quiet = tree_mode and args.quiet
+                if not quiet or validator.counts[ERROR] or validator.counts[WARNING]:
+                    validator.print_report()
+
+        if args.format == "ndjson":
+            print(json.dumps({"type": "summary", **summary.to_dict()}))
+        elif args.format == "json":
+            print(json.dumps({"summary": summary.to_dict(), "skills": skills}, indent=2))
+        elif tree_mode:
+            print_tree_summary(root, summary)
+
+        if args.metrics is not None:
+            write_metrics(args.metrics, summary)
+
+        valid = summary.is_valid
+    finally:
+        if tree is not None:
+            tree.close()
 
-    sys.exit(0 if is_valid else 1)
+    sys.exit(0 if valid else 1)
 
 
 if __name__ == "__main__":
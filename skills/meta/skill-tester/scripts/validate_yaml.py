@@ -4,90 +4,110 @@ Validate YAML frontmatter in agent skill SKILL.md files.
 
 Usage:
     python validate_yaml.py <skill-directory>
+    python validate_yaml.py <skill-directory> --format ndjson|json
     python validate_yaml.py --help
 """
 
 import argparse
+import json
 import re
 import sys
 from pathlib import Path
 
-import yaml
+from skill_parser import load_frontmatter, load_yaml_module, read_frontmatter
 
 
-def validate_yaml_frontmatter(skill_path: Path) -> bool:
-    """Validate YAML frontmatter in SKILL.md. Returns True if valid."""
+# Check severities and their report glyphs
+PASS = "pass"
+WARNING = "warning"
+ERROR = "error"
+GLYPHS = {PASS: "✓", WARNING: "⚠", ERROR: "✗"}
+
+
+def print_check(severity: str, message: str):
+    """Print a check outcome in the human-readable format."""
+    print(f"{GLYPHS[severity]} {message}")
+
+
+def validate_yaml_frontmatter(skill_path: Path, report=print_check) -> bool:
+    """Validate YAML frontmatter in SKILL.md. Returns True if valid.
+
+    Each check outcome is passed to report(severity, message).
+    """
     skill_md = skill_path / "SKILL.md"
 
     if not skill_md.exists():
-        print(f"✗ SKILL.md not found in {skill_path}")
+        report(ERROR, f"SKILL.md not found in {skill_path}")
         return False
 
     try:
-        content = skill_md.read_text(encoding="utf-8")
+        frontmatter_text = read_frontmatter(skill_md)
     except Exception as e:
-        print(f"✗ Failed to read SKILL.md: {e}")
+        report(ERROR, f"Failed to read SKILL.md: {e}")
         return False
 
-    # Extract YAML frontmatter
-    pattern = r"^---\s*\n(.*?)\n---\s*\n"
-    match = re.match(pattern, content, re.DOTALL)
+    if frontmatter_text is None:
+        report(ERROR, "SKILL.md missing YAML frontmatter (must start with ---)")
+        return False
 
-    if not match:
-        print("✗ SKILL.md missing YAML frontmatter (must start with ---)")
+    try:
+        frontmatter = load_frontmatter(frontmatter_text)
+    except load_yaml_module().YAMLError as e:
+        report(ERROR, f"Invalid YAML frontmatter: {e}")
         return False
 
-    frontmatter_text = match.group(1)
+    if frontmatter is None:
+        report(ERROR, "YAML frontmatter is empty")
+        return False
 
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        print("✓ YAML frontmatter is valid")
-    except yaml.YAMLError as e:
-        print(f"✗ Invalid YAML frontmatter: {e}")
+    if not isinstance(frontmatter, dict):
+        report(ERROR, f"YAML frontmatter must be a mapping of fields (got {type(frontmatter).__name__})")
         return False
 
+    report(PASS, "YAML frontmatter is valid")
+
     # Check required fields
     required_fields = ["name", "description"]
     all_present = True
 
     for field in required_fields:
         if field not in frontmatter:
-            print(f"✗ Missing required field: '{field}'")
+            report(ERROR, f"Missing required field: '{field}'")
             all_present = False
         else:
-            print(f"✓ Required field present: '{field}'")
+            report(PASS, f"Required field present: '{field}'")
 
     # Validate field types
     if "name" in frontmatter and not isinstance(frontmatter["name"], str):
-        print("✗ Field 'name' must be a string")
+        report(ERROR, "Field 'name' must be a string")
         all_present = False
 
     if "description" in frontmatter and not isinstance(frontmatter["description"], str):
-        print("✗ Field 'description' must be a string")
+        report(ERROR, "Field 'description' must be a string")
         all_present = False
 
-    # Validate constraints
-    if "name" in frontmatter:
+    # Validate constraints (fields of the wrong type are reported above)
+    if isinstance(frontmatter.get("name"), str):
         name = frontmatter["name"]
         if len(name) > 64:
-            print(f"✗ Skill name exceeds 64 characters: {len(name)}")
+            report(ERROR, f"Skill name exceeds 64 characters: {len(name)}")
             all_present = False
 
         if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
-            print(f"✗ Skill name must be hyphen-case: '{name}'")
+            report(ERROR, f"Skill name must be hyphen-case: '{name}'")
             all_present = False
         else:
-            print(f"✓ Skill name format valid: '{name}'")
+            report(PASS, f"Skill name format valid: '{name}'")
 
-    if "description" in frontmatter:
+    if isinstance(frontmatter.get("description"), str):
         desc = frontmatter["description"]
         if len(desc) > 1024:
-            print(f"✗ Description exceeds 1024 characters: {len(desc)}")
+            report(ERROR, f"Description exceeds 1024 characters: {len(desc)}")
             all_present = False
         elif len(desc) > 200:
-            print(f"⚠ Description is {len(desc)} chars (recommended ~200)")
+            report(WARNING, f"Description is {len(desc)} chars (recommended ~200)")
         else:
-            print(f"✓ Description length appropriate: {len(desc)} chars")
+            report(PASS, f"Description length appropriate: {len(desc)} chars")
 
     # Check name matches directory
     if "name" in frontmatter:
@@ -95,10 +115,10 @@ def validate_yaml_frontmatter(skill_path: Path) -> bool:
         dir_name = skill_path.name
 
         if yaml_name != dir_name:
-            print(f"✗ Directory '{dir_name}' does not match YAML name '{yaml_name}'")
+            report(ERROR, f"Directory '{dir_name}' does not match YAML name '{yaml_name}'")
             all_present = False
         else:
-            print(f"✓ Directory name matches YAML name: '{yaml_name}'")
+            report(PASS, f"Directory name matches YAML name: '{yaml_name}'")
 
     return all_present
 
@@ -112,17 +132,43 @@ def main():
         type=Path,
         help="Path to skill directory",
     )
+    parser.add_argument(
+        "--format",
+        choices=["text", "ndjson", "json"],
+        default="text",
+        help="Report format: human-readable text, one JSON record per check, "
+        "or a single JSON document (default: text)",
+    )
     args = parser.parse_args()
+    skill = str(args.skill_directory)
+
+    if args.format == "ndjson":
+        def report(severity: str, message: str):
+            record = {"type": "result", "severity": severity, "skill": skill}
+            print(json.dumps({**record, "message": message}), flush=True)
+
+        is_valid = validate_yaml_frontmatter(args.skill_directory, report)
+        print(json.dumps({"type": "summary", "skill": skill, "valid": is_valid}))
 
-    print(f"\nValidating YAML in: {args.skill_directory}\n")
-    is_valid = validate_yaml_frontmatter(args.skill_directory)
+    elif args.format == "json":
+        results = []
+
+        def report(severity: str, message: str):
+            results.append({"severity": severity, "message": message})
+
+        is_valid = validate_yaml_frontmatter(args.skill_directory, report)
+        print(json.dumps({"skill": skill, "valid": is_valid, "results": results}, indent=2))
 
-    print("\n" + "="*60)
-    if is_valid:
-        print("RESULT: VALID")
     else:
-        print("RESULT: INVALID - Fix errors above")
-    print("="*60 + "\n")
+        print(f"\nValidating YAML in: {args.skill_directory}\n")
+        is_valid = validate_yaml_frontmatter(args.skill_directory)
+
+        print("\n" + "="*60)
+        if is_valid:
+            print("RESULT: VALID")
+        else:
+            print("RESULT: INVALID - Fix errors above")
+        print("="*60 + "\n")
 
     sys.exit(0 if is_valid else 1)
 
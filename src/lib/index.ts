@@ -16,6 +16,7 @@ export * from "./invoke.js";
 export * from "./processor.js";
 export * from "./environment.js";
 export * from "./daemon-status.js";
+export * from "./skill-worker.js";
 
 // Validation
 export * from "./validation/index.js";
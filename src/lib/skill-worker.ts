@@ -0,0 +1,195 @@
+import { spawn, type ChildProcessWithoutNullStreams } from "node:child_process";
+import { createInterface } from "node:readline";
+
+/**
+ * Options for starting a skill validation worker
+ */
+export interface SkillWorkerOptions {
+  /** Path to validate_skill.py (or skill-tester's test_skill.py) */
+  scriptPath: string;
+  /** Python interpreter (default: python3) */
+  python?: string;
+  /** On-disk result cache shared with CLI runs */
+  cacheDir?: string;
+  /** Worker processes for validateMany (default: available CPUs) */
+  jobs?: number;
+}
+
+/**
+ * A single check outcome reported by the validator
+ */
+export interface SkillCheckResult {
+  rule: string;
+  severity: "pass" | "warning" | "error";
+  skill: string;
+  message: string;
+  line: number | null;
+  column: number | null;
+}
+
+/**
+ * Validation report for one skill
+ */
+export interface SkillValidationReport {
+  skill: string;
+  valid: boolean;
+  counts: Record<"pass" | "warning" | "error", number>;
+  results: SkillCheckResult[];
+  metrics?: Record<string, unknown>;
+}
+
+/**
+ * Reports for several skills with aggregate counts
+ */
+export interface SkillValidationSummary {
+  summary: {
+    skills: number;
+    passed: number;
+    warned: number;
+    failed: number;
+    valid: boolean;
+  };
+  skills: SkillValidationReport[];
+}
+
+/**
+ * Objective metrics for one skill
+ */
+export interface SkillEvaluation {
+  skill: string;
+  valid: boolean;
+  metrics: Record<string, unknown>;
+}
+
+interface PendingRequest {
+  resolve: (value: unknown) => void;
+  reject: (error: Error) => void;
+}
+
+/**
+ * Client for the long-lived skill validator (`validate_skill.py --serve`).
+ *
+ * Keeps one Python process running and exchanges newline-delimited JSON-RPC
+ * messages with it, so repeated validations skip interpreter start-up and
+ * reuse results for unchanged skills. The process is started on first use.
+ */
+export class SkillWorker {
+  private process: ChildProcessWithoutNullStreams | null = null;
+  private nextId = 1;
+  private pending = new Map<number, PendingRequest>();
+
+  constructor(private readonly options: SkillWorkerOptions) {}
+
+  /**
+   * Validate a single skill directory
+   */
+  validate(
+    path: string,
+    options: { metrics?: boolean; countsOnly?: boolean } = {}
+  ): Promise<SkillValidationReport> {
+    return this.request("validate", {
+      path,
+      metrics: options.metrics ?? false,
+      counts_only: options.countsOnly ?? false,
+    });
+  }
+
+  /**
+   * Validate several skills, given explicitly or discovered beneath a root
+   */
+  validateMany(
+    target: { paths: string[] } | { root: string },
+    options: { metrics?: boolean; countsOnly?: boolean } = {}
+  ): Promise<SkillValidationSummary> {
+    return this.request("validate_many", {
+      ...target,
+      metrics: options.metrics ?? false,
+      counts_only: options.countsOnly ?? false,
+    });
+  }
+
+  /**
+   * Collect evaluation metrics for a skill
+   */
+  evaluate(path: string): Promise<SkillEvaluation> {
+    return this.request("evaluate", { path });
+  }
+
+  /**
+   * Stop the worker process. Pending requests are rejected.
+   */
+  async close(): Promise<void> {
+    const proc = this.process;
+    if (!proc) return;
+    this.process = null;
+    await new Promise<void>((resolve) => {
+      proc.once("exit", () => resolve());
+      proc.stdin.end();
+    });
+  }
+
+  private request<T>(method: string, params: Record<string, unknown>): Promise<T> {
+    const proc = this.start();
+    const id = this.nextId++;
+    return new Promise<T>((resolve, reject) => {
+      this.pending.set(id, { resolve: resolve as (value: unknown) => void, reject });
+      proc.stdin.write(JSON.stringify({ jsonrpc: "2.0", id, method, params }) + "\n");
+    });
+  }
+
+  private start(): ChildProcessWithoutNullStreams {
+    if (this.process) return this.process;
+
+    const args = [this.options.scriptPath, "--serve"];
+    if (this.options.cacheDir) args.push("--cache-dir", this.options.cacheDir);
+    if (this.options.jobs !== undefined) args.push("--jobs", String(this.options.jobs));
+
+    const proc = spawn(this.options.python ?? "python3", args, {
+      stdio: ["pipe", "pipe", "pipe"],
+    });
+    this.process = proc;
+
+    let stderr = "";
+    proc.stderr.on("data", (chunk: Buffer) => {
+      stderr += chunk.toString();
+    });
+
+    createInterface({ input: proc.stdout }).on("line", (line) => this.handleLine(line));
+
+    const fail = (error: Error) => {
+      if (this.process === proc) this.process = null;
+      for (const { reject } of this.pending.values()) reject(error);
+      this.pending.clear();
+    };
+    proc.on("error", fail);
+    proc.on("exit", (code) => {
+      fail(new Error(`Skill worker exited with code ${code}${stderr ? `: ${stderr.trim()}` : ""}`));
+    });
+
+    return proc;
+  }
+
+  private handleLine(line: string): void {
+    let response: {
+      id?: number | null;
+      result?: unknown;
+      error?: { code: number; message: string };
+    };
+    try {
+      response = JSON.parse(line);
+    } catch {
+      return;
+    }
+    if (typeof response.id !== "number") return;
+
+    const pending = this.pending.get(response.id);
+    if (!pending) return;
+    this.pending.delete(response.id);
+
+    if (response.error) {
+      pending.reject(new Error(response.error.message));
+    } else {
+      pending.resolve(response.result);
+    }
+  }
+}
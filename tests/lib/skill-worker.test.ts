@@ -0,0 +1,65 @@
+import { describe, it, beforeAll, afterAll } from "vitest";
+import assert from "node:assert/strict";
+import { spawnSync } from "node:child_process";
+import { dirname, join } from "node:path";
+import { fileURLToPath } from "node:url";
+import { SkillWorker } from "../../src/lib/skill-worker.js";
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const PROJECT_ROOT = join(__dirname, "..", "..");
+const SCRIPT = join(PROJECT_ROOT, "skills/meta/skill-creator/scripts/validate_skill.py");
+const SKILLS = join(PROJECT_ROOT, "skills");
+
+// The worker runs the Python validator, which needs PyYAML
+const hasPython = spawnSync("python3", ["-c", "import yaml"]).status === 0;
+
+describe.skipIf(!hasPython)("SkillWorker", () => {
+  let worker: SkillWorker;
+
+  beforeAll(() => {
+    worker = new SkillWorker({ scriptPath: SCRIPT, jobs: 1 });
+  });
+
+  afterAll(async () => {
+    await worker.close();
+  });
+
+  it("validates a single skill", async () => {
+    const report = await worker.validate(join(SKILLS, "examples/get-weather"));
+    assert.equal(report.valid, true);
+    assert.equal(report.counts.error, 0);
+    assert.ok(report.results.some((r) => r.rule === "frontmatter-yaml"));
+  });
+
+  it("answers repeated requests from the same process", async () => {
+    const path = join(SKILLS, "examples/get-weather");
+    const [first, second] = await Promise.all([worker.validate(path), worker.validate(path)]);
+    assert.deepEqual(first, second);
+  });
+
+  it("reports errors for a missing skill", async () => {
+    const report = await worker.validate(join(SKILLS, "does-not-exist"));
+    assert.equal(report.valid, false);
+    assert.ok(report.counts.error > 0);
+  });
+
+  it("validates every skill beneath a root", async () => {
+    const { summary, skills } = await worker.validateMany({ root: SKILLS });
+    assert.equal(summary.skills, skills.length);
+    assert.ok(summary.skills > 0);
+    assert.equal(summary.valid, true);
+  });
+
+  it("collects evaluation metrics", async () => {
+    const evaluation = await worker.evaluate(join(SKILLS, "examples/get-weather"));
+    assert.equal(evaluation.metrics.name, "get-weather");
+    assert.equal(typeof evaluation.metrics.word_count, "number");
+  });
+
+  it("rejects invalid params without stopping the worker", async () => {
+    await assert.rejects(worker.validate(""), /non-empty string/);
+    const report = await worker.validate(join(SKILLS, "examples/get-weather"));
+    assert.equal(report.valid, true);
+  });
+});